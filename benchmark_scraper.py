@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for job_scraper.py
+
+  python3 benchmark_scraper.py record            # capture live API responses as fixtures (needs network)
+  python3 benchmark_scraper.py run                # replay them from a local server and time the scraper
+  python3 benchmark_scraper.py run --latency 150 --jitter 50 --error-rate 0.05 --json bench.json
+  python3 benchmark_scraper.py run --compare bench.json
+
+The scraper's session is pointed at a local HTTP stand-in server through a
+rewriting transport adapter, so the real request, retry, cache and parsing
+code paths all run; only the remote hosts are replaced.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+import job_scraper
+
+FIXTURE_DIR = os.path.join(".scraper_cache", "fixtures")
+# Query parameters that carry credentials; never stored and ignored when matching
+SECRET_PARAMS = {"app_id", "app_key"}
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def fixture_key(host: str, path: str, query: str) -> str:
+    """Stable fixture name for a request: host, path and sorted non-secret query"""
+    params = sorted((k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k not in SECRET_PARAMS)
+    key = f"{host}{path}"
+    if params:
+        key += "?" + urlencode(params)
+    return key
+
+
+def body_name(key: str) -> str:
+    return hashlib.sha1(key.encode()).hexdigest() + ".body"
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that saves every live response as a fixture"""
+
+    def __init__(self, directory: str, **kwargs):
+        super().__init__(**kwargs)
+        self.directory = directory
+        self.index = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        parts = urlsplit(request.url)
+        key = fixture_key(parts.hostname, parts.path, parts.query)
+        with open(os.path.join(self.directory, body_name(key)), "wb") as f:
+            f.write(response.content)
+        with self._lock:
+            self.index[key] = {
+                "status": response.status_code,
+                "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+                "body": body_name(key),
+            }
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport adapter that sends every request to the local stand-in server instead"""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = f"{self.base_url}/{parts.hostname}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+        return super().send(request, **kwargs)
+
+
+def mount(aggregator: "job_scraper.JobAggregator", adapter: HTTPAdapter):
+    aggregator.http.session.mount("https://", adapter)
+    aggregator.http.session.mount("http://", adapter)
+
+
+def load_fixtures(directory: str) -> Tuple[Optional[float], Dict]:
+    """The recording time (epoch seconds) and the responses indexed by fixture key.
+
+    Fixtures recorded before the time was stored have none; they replay
+    against the current time.
+    """
+    with open(os.path.join(directory, "index.json")) as f:
+        data = json.load(f)
+    if "responses" not in data:
+        return None, data
+    return data["recorded_at"], data["responses"]
+
+
+def record(args):
+    """Fetch every source live once and store the responses under args.fixtures"""
+    os.makedirs(args.fixtures, exist_ok=True)
+    recorded_at = time.time()
+    # A throwaway detail cache, so every detail response gets recorded too
+    with tempfile.TemporaryDirectory(prefix="scraper_details_") as details_dir:
+        aggregator = job_scraper.JobAggregator(cache_dir=None, slug_health_path=None, details_dir=details_dir)
+        adapter = RecordingAdapter(args.fixtures, pool_connections=8, pool_maxsize=aggregator.engine.max_workers)
+        mount(aggregator, adapter)
+        jobs = aggregator.fetch_all_jobs()
+    with open(os.path.join(args.fixtures, "index.json"), "w") as f:
+        # Replays measure job age from this moment, so the same jobs pass the recency filter every time
+        json.dump({"recorded_at": recorded_at, "responses": adapter.index}, f, indent=1, sort_keys=True)
+    total_bytes = sum(os.path.getsize(os.path.join(args.fixtures, entry["body"])) for entry in adapter.index.values())
+    print(f"\n📼 Recorded {len(adapter.index)} responses ({total_bytes / 1024:.0f} KB) "
+          f"for {len(jobs)} jobs into {args.fixtures}")
+
+
+def make_handler(fixtures: str, index: Dict, latency: float, jitter: float, error_rate: float, seed: int):
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out as separate writes; without this Nagle's algorithm stalls keep-alive replies
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            host, _, path = parts.path.lstrip("/").partition("/")
+            with lock:
+                delay = max(0.0, latency + rng.uniform(-jitter, jitter))
+                fail = rng.random() < error_rate
+            time.sleep(delay)
+            if fail:
+                self.reply(rng.choice((429, 503)), b"", {"Retry-After": "1"})
+                return
+            entry = index.get(fixture_key(host, f"/{path}", parts.query))
+            if entry is None:
+                self.reply(404, b"{}", {"Content-Type": "application/json"})
+                return
+            etag = entry["headers"].get("ETag")
+            if etag and self.headers.get("If-None-Match") == etag:
+                self.reply(304, b"", {"ETag": etag})
+                return
+            with open(os.path.join(fixtures, entry["body"]), "rb") as f:
+                body = f.read()
+            self.reply(entry["status"], body, entry["headers"])
+
+        def reply(self, status: int, body: bytes, headers: Dict[str, str]):
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def serve(fixtures: str, latency: float, jitter: float, error_rate: float, seed: int, ready):
+    """Run the stand-in server; meant to live in its own process"""
+    _, index = load_fixtures(fixtures)
+    handler = make_handler(fixtures, index, latency, jitter, error_rate, seed)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_once(base_url: str, workdir: str, unthrottled: bool, recorded_at: Optional[float] = None) -> Dict:
+    """One cold scrape against the stand-in server, timed stage by stage"""
+    rate_limits = {source: 1e6 for source in job_scraper.SOURCE_HOSTS} if unthrottled else None
+    aggregator = job_scraper.JobAggregator(cache_dir=os.path.join(workdir, "http"), rate_limits=rate_limits,
+                                           slug_health_path=os.path.join(workdir, "slug_health.json"),
+                                           details_dir=os.path.join(workdir, "details"))
+    aggregator.reference_time = recorded_at
+    mount(aggregator, ReplayAdapter(base_url, pool_connections=8, pool_maxsize=aggregator.engine.max_workers))
+    stages = {}
+
+    started = time.perf_counter()
+    raw = list(aggregator.iter_all_jobs())
+    stages["fetch"] = time.perf_counter() - started
+
+    mark = time.perf_counter()
+    jobs = list(aggregator.normalize_jobs(raw))
+    stages["normalize"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    jobs = list(aggregator.enrich_jobs(jobs))
+    stages["details"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    deduplicator = job_scraper.JobDeduplicator()
+    jobs = deduplicator.deduplicate(jobs)
+    stages["dedup"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    writer = job_scraper.JobStreamWriter(os.path.join(workdir, "jobs_data.json"))
+    try:
+        for job in jobs:
+            writer.add(job)
+        writer.finish({"last_updated": job_scraper.datetime.now().isoformat()}, {}, [])
+    finally:
+        writer.close()
+    stages["write"] = time.perf_counter() - mark
+
+    wall = time.perf_counter() - started
+    requests_sent = aggregator.http.requests_sent
+    return {
+        "wall_seconds": round(wall, 3),
+        "requests": requests_sent,
+        "requests_per_second": round(requests_sent / stages["fetch"], 1) if stages["fetch"] else 0.0,
+        "retries": aggregator.http.retries,
+        "jobs": len(jobs),
+        "stages": {name: round(seconds, 3) for name, seconds in stages.items()},
+    }
+
+
+def run(args):
+    """Replay the fixtures through the scraper args.repeat times and report the best and median run"""
+    if not os.path.exists(os.path.join(args.fixtures, "index.json")):
+        print(f"❌ No fixtures in {args.fixtures}; run 'python3 benchmark_scraper.py record' first")
+        raise SystemExit(1)
+    recorded_at, responses = load_fixtures(args.fixtures)
+    recorded_hosts = {key.split("/", 1)[0] for key in responses}
+    if recorded_at is None:
+        print("⚠️  These fixtures predate stored recording times; jobs are aged against the current time")
+    if job_scraper.SOURCE_HOSTS["Adzuna"] in recorded_hosts:
+        # Adzuna only runs with credentials; the stand-in server ignores them
+        os.environ.setdefault("ADZUNA_API_ID", "benchmark")
+        os.environ.setdefault("ADZUNA_API_KEY", "benchmark")
+
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, daemon=True, args=(
+        args.fixtures, args.latency / 1000, args.jitter / 1000, args.error_rate, args.seed, ready))
+    server.start()
+    base_url = f"http://127.0.0.1:{ready.get(timeout=10)}"
+
+    runs = []
+    try:
+        for attempt in range(args.repeat):
+            workdir = tempfile.mkdtemp(prefix="scraper_bench_")
+            try:
+                runs.append(run_once(base_url, workdir, args.unthrottled, recorded_at))
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+    finally:
+        server.terminate()
+
+    runs.sort(key=lambda result: result["wall_seconds"])
+    report = {
+        "commit": git_commit(),
+        "recorded_at": job_scraper.datetime.now().isoformat(),
+        "settings": {"latency_ms": args.latency, "jitter_ms": args.jitter, "error_rate": args.error_rate,
+                     "seed": args.seed, "repeat": args.repeat, "unthrottled": args.unthrottled},
+        "best": runs[0],
+        "median": runs[len(runs) // 2],
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+    print_report(report)
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(json.load(f), report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Saved benchmark report to {args.json}")
+
+
+def print_report(report: Dict):
+    median = report["median"]
+    print(f"\n📊 Benchmark ({report['commit'] or 'uncommitted'}, median of {report['settings']['repeat']} runs)")
+    print(f"   Wall time:    {median['wall_seconds']:.2f}s (best {report['best']['wall_seconds']:.2f}s)")
+    print(f"   Requests:     {median['requests']} ({median['requests_per_second']} req/s, {median['retries']} retries)")
+    print(f"   Jobs:         {median['jobs']}")
+    print(f"   Peak RSS:     {report['peak_rss_mb']} MB")
+    for name, seconds in median["stages"].items():
+        print(f"   {name:<13} {seconds:.3f}s")
+
+
+def print_comparison(before: Dict, after: Dict):
+    """Print the change in median timings against an earlier report"""
+    print(f"\n⚖️  Against {before.get('commit') or 'baseline'}:")
+    old, new = before["median"], after["median"]
+    rows = [("wall", old["wall_seconds"], new["wall_seconds"])]
+    rows += [(name, old["stages"].get(name, 0.0), seconds) for name, seconds in new["stages"].items()]
+    for name, was, now in rows:
+        change = f"{(now - was) / was * 100:+.1f}%" if was else "n/a"
+        print(f"   {name:<13} {was:.3f}s -> {now:.3f}s ({change})")
+    print(f"   {'peak RSS':<13} {before['peak_rss_mb']} MB -> {after['peak_rss_mb']} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job_scraper.py against recorded API responses")
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="fixture directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("record", help="record live responses as fixtures")
+    bench = commands.add_parser("run", help="replay fixtures from a local server and time the scraper")
+    bench.add_argument("--latency", type=float, default=100, help="mean response latency in ms")
+    bench.add_argument("--jitter", type=float, default=30, help="latency jitter (+/-) in ms")
+    bench.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 429/503")
+    bench.add_argument("--seed", type=int, default=1, help="seed for jitter and error injection")
+    bench.add_argument("--repeat", type=int, default=3, help="number of runs")
+    bench.add_argument("--unthrottled", action="store_true", help="lift the per-source rate limits")
+    bench.add_argument("--json", default=None, help="save the report as JSON for later --compare")
+    bench.add_argument("--compare", default=None, help="earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args)
+    else:
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,7 @@ echo "🚀 EpiskoAI Deployment Script"
 echo "=============================="
 echo ""
 
-# Generate icons
+# Generate icons (only the ones whose inputs changed since the last deploy)
 echo "📱 Generating app icons..."
 python3 generate_icons.py
 
@@ -22,6 +22,8 @@ echo ""
 echo "🌐 Starting local server..."
 echo "The app will be available at:"
 echo "  → http://localhost:8000/app.html"
+echo "Jobs can be queried at:"
+echo "  → http://localhost:8000/jobs?q=&company=&location=&page="
 echo ""
 echo "To install the app:"
 echo "  1. Open the URL in Chrome, Edge, or Safari"
@@ -31,5 +33,5 @@ echo ""
 echo "Press Ctrl+C to stop the server"
 echo ""
 
-# Start Python HTTP server
-python3 -m http.server 8000
+# Serve the site plus the /jobs query API; new jobs_data.json publications are picked up live
+python3 serve_jobs.py --port 8000
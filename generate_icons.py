@@ -1,76 +1,176 @@
 #!/usr/bin/env python3
 """
 Generate PWA icons for EpiskoAI app
+
+Sizes are rendered in parallel, and only when this script, the font,
+Pillow or the icon itself changed since the last build (recorded in
+icons/.build-cache.json). Pass --force to rebuild every icon.
 """
 from PIL import Image, ImageDraw, ImageFont
+import PIL
+import argparse
+import hashlib
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-def create_icon(size, filename):
-    """Create a square icon with gradient background and shield emoji"""
-    # Create image with gradient
-    img = Image.new('RGB', (size, size), color='#1a1a2e')
+try:
+    import numpy as np  # Optional: builds the background in one go instead of line by line
+except ImportError:
+    np = None
+
+ICON_DIR = 'icons'
+SIZES = [16, 32, 72, 96, 128, 144, 152, 192, 384, 512]
+TOP_COLOR = (26, 26, 46)  # #1a1a2e
+BOTTOM_COLOR = (74, 144, 226)  # #4a90e2
+CORNER_DIVISOR = 5  # Corner radius is a fifth of the icon size
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+CACHE_FILE = os.path.join(ICON_DIR, '.build-cache.json')
+
+def icon_filename(size):
+    return os.path.join(ICON_DIR, f'icon-{size}x{size}.png')
+
+def gradient(size):
+    """Vertical gradient from TOP_COLOR to BOTTOM_COLOR, as a (size, size, 3) array"""
+    y = np.arange(size, dtype=np.float64)[:, None]
+    top = np.array(TOP_COLOR, dtype=np.float64)
+    bottom = np.array(BOTTOM_COLOR, dtype=np.float64)
+    # Same arithmetic and truncation as int(26 + (74 - 26) * y / size) per channel
+    rows = (top + (bottom - top) * y / size).astype(np.uint8)
+    return np.broadcast_to(rows[:, None, :], (size, size, 3))
+
+def rounded_mask(size):
+    """Alpha mask of a square with rounded corners: 255 inside, 0 outside"""
+    radius = size // CORNER_DIVISOR
+    centers = np.arange(size) + 0.5
+    # How far each pixel centre reaches into a corner's square, per axis (0 away from the corners)
+    reach = np.maximum(np.maximum(radius - centers, centers - (size - radius)), 0)
+    inside = reach[:, None] ** 2 + reach[None, :] ** 2 <= radius ** 2
+    return np.where(inside, 255, 0).astype(np.uint8)
+
+def drawn_background(size):
+    """The same background drawn with Pillow alone, for when numpy is not installed"""
+    img = Image.new('RGB', (size, size), color=TOP_COLOR)
     draw = ImageDraw.Draw(img)
-    
-    # Create gradient background
     for y in range(size):
-        # Gradient from #1a1a2e to #4a90e2
-        r = int(26 + (74 - 26) * y / size)
-        g = int(26 + (144 - 26) * y / size)
-        b = int(46 + (226 - 46) * y / size)
-        draw.line([(0, y), (size, y)], fill=(r, g, b))
-    
-    # Add rounded corners
+        draw.line([(0, y), (size, y)], fill=tuple(int(top + (bottom - top) * y / size)
+                                                   for top, bottom in zip(TOP_COLOR, BOTTOM_COLOR)))
     mask = Image.new('L', (size, size), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    corner_radius = size // 5
-    mask_draw.rounded_rectangle([(0, 0), (size, size)], corner_radius, fill=255)
-    
-    # Apply mask
+    ImageDraw.Draw(mask).rounded_rectangle([(0, 0), (size, size)], size // CORNER_DIVISOR, fill=255)
     img.putalpha(mask)
-    
+    return img
+
+def background(size):
+    """Gradient square with rounded corners, as an RGBA image"""
+    if np is None:
+        return drawn_background(size)
+    pixels = np.empty((size, size, 4), dtype=np.uint8)
+    pixels[..., :3] = gradient(size)
+    pixels[..., 3] = rounded_mask(size)
+    return Image.fromarray(pixels, 'RGBA')
+
+def create_icon(size, filename):
+    """Create a square icon with gradient background and an "E" mark"""
+    img = background(size)
+    draw = ImageDraw.Draw(img)
+
     # Try to add text
     try:
         # Use a bold font if available
         font_size = size // 2
         try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
+            font = ImageFont.truetype(FONT_PATH, font_size)
         except:
             font = ImageFont.load_default()
-        
+
         # Add "E" text
         text = "E"
         # Get text bounding box
         bbox = draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
-        
+
         # Center text
         x = (size - text_width) // 2
         y = (size - text_height) // 2 - font_size // 8
-        
+
         # Draw text with shadow
         shadow_offset = max(2, size // 100)
         draw.text((x + shadow_offset, y + shadow_offset), text, fill=(0, 0, 0, 128), font=font)
         draw.text((x, y), text, fill='white', font=font)
     except Exception as e:
         print(f"Could not add text to icon: {e}")
-    
+
     # Save the image
     img.save(filename, 'PNG')
     print(f"Created {filename}")
+    return filename
+
+def build_key(size):
+    """Everything an icon's pixels depend on: this script, its size, the font, Pillow and numpy's presence"""
+    digest = hashlib.sha256()
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest.update(f.read())
+    try:
+        stat = os.stat(FONT_PATH)
+        font = f"{FONT_PATH}:{stat.st_size}:{stat.st_mtime_ns}"
+    except OSError:
+        font = "default"
+    # The drawn fallback anti-aliases the corners differently, so switching paths rebuilds the icons
+    digest.update(json.dumps([size, font, PIL.__version__, np is not None]).encode())
+    return digest.hexdigest()
+
+def file_digest(filename):
+    try:
+        with open(filename, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def load_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    tmp_path = f"{CACHE_FILE}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, CACHE_FILE)
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate the PWA icons into icons/")
+    parser.add_argument("--force", action="store_true", help="rebuild every icon, ignoring the build cache")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="icons rendered in parallel")
+    args = parser.parse_args()
+
     # Create icons directory
-    os.makedirs('icons', exist_ok=True)
-    
-    # Generate icons in various sizes
-    sizes = [16, 32, 72, 96, 128, 144, 152, 192, 384, 512]
-    
-    for size in sizes:
-        filename = f'icons/icon-{size}x{size}.png'
-        create_icon(size, filename)
-    
-    print("\n✓ All icons generated successfully!")
+    os.makedirs(ICON_DIR, exist_ok=True)
+
+    # An icon is up to date if it was built from the same inputs and not touched since
+    cache = {} if args.force else load_cache()
+    keys = {size: build_key(size) for size in SIZES}
+    stale = [size for size in SIZES
+             if cache.get(str(size), {}).get("key") != keys[size]
+             or cache[str(size)].get("sha256") != file_digest(icon_filename(size))]
+
+    if len(stale) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(stale))) as pool:
+            list(pool.map(create_icon, stale, [icon_filename(size) for size in stale]))
+    else:
+        for size in stale:
+            create_icon(size, icon_filename(size))
+
+    for size in stale:
+        cache[str(size)] = {"key": keys[size], "sha256": file_digest(icon_filename(size))}
+    save_cache(cache)
+
+    if stale:
+        print(f"\n✓ Generated {len(stale)} icons ({len(SIZES) - len(stale)} already up to date)")
+    else:
+        print(f"✓ All {len(SIZES)} icons already up to date")
     print("The app is ready to be installed as a PWA.")
 
 if __name__ == '__main__':
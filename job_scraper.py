@@ -5,305 +5,2617 @@ Fetches actual job listings from multiple sources
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+import gzip
+import hashlib
+import html
+import itertools
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict
+import random
+import re
+import shutil
+import signal
+import sqlite3
+import tempfile
+import queue
+import textwrap
+import threading
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 import os
 
-class JobAggregator:
+try:
+    import brotli  # Optional: only needed for .br siblings of the compact output
+except ImportError:
+    brotli = None
+
+try:
+    import fcntl  # Optional: POSIX only, guards the job store against two writers
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+# Bodies above this size are parsed element by element instead of all at once
+STREAM_PARSE_THRESHOLD = 1024 * 1024
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def json_loads(data) -> Any:
+    """Parse JSON from str or bytes with orjson when installed, else the stdlib"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> str:
+    """Compact JSON text with orjson when installed, else the stdlib"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def iter_json_array(document, key: Optional[str] = None) -> Iterator[Any]:
+    """Yield the elements of a JSON array one at a time.
+
+    The array is the whole document, or the ``key`` member of a top-level
+    object. Large documents are decoded element by element, so a caller that
+    filters as it goes never holds every element at once; small ones are
+    parsed in one go, which is faster.
+    """
+    if len(document) < STREAM_PARSE_THRESHOLD:
+        data = json_loads(document)
+        items = data.get(key) if key is not None and isinstance(data, dict) else data
+        if isinstance(items, list):
+            yield from items
+        return
+    
+    text = document.decode("utf-8") if isinstance(document, (bytes, bytearray)) else document
+    decode = _JSON_DECODER.raw_decode
+    skip = _JSON_WHITESPACE.match
+    idx = skip(text, 0).end()
+    if key is not None:
+        # Walk the top-level object's members, skipping everything up to the key
+        if text[idx:idx + 1] != "{":
+            return
+        idx = skip(text, idx + 1).end()
+        while text[idx:idx + 1] != "}":
+            name, idx = decode(text, idx)
+            idx = skip(text, idx).end()
+            if text[idx:idx + 1] != ":":
+                raise ValueError(f"Expected ':' at offset {idx}")
+            idx = skip(text, idx + 1).end()
+            if name == key:
+                break
+            _, idx = decode(text, idx)
+            idx = skip(text, idx).end()
+            if text[idx:idx + 1] == ",":
+                idx = skip(text, idx + 1).end()
+        else:
+            return
+    if text[idx:idx + 1] != "[":
+        return
+    idx = skip(text, idx + 1).end()
+    if text[idx:idx + 1] == "]":
+        return
+    while True:
+        item, idx = decode(text, idx)
+        yield item
+        idx = skip(text, idx).end()
+        separator = text[idx:idx + 1]
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' at offset {idx}")
+        idx = skip(text, idx + 1).end()
+
+
+# Company boards polled on each ATS: slug -> (display name, website)
+GREENHOUSE_COMPANIES = {
+    # Major Tech
+    "figma": ("Figma", "https://www.figma.com"),
+    "canva": ("Canva", "https://www.canva.com"), 
+    "grammarly": ("Grammarly", "https://www.grammarly.com"),
+    "airtable": ("Airtable", "https://www.airtable.com"),
+    "databricks": ("Databricks", "https://www.databricks.com"),
+    "cloudflare": ("Cloudflare", "https://www.cloudflare.com"),
+    "doordash": ("DoorDash", "https://www.doordash.com"),
+    "github": ("GitHub", "https://github.com"),
+    "gitlab": ("GitLab", "https://about.gitlab.com"),
+    "stripe": ("Stripe", "https://stripe.com"),
+    "square": ("Square", "https://squareup.com"),
+    "dropbox": ("Dropbox", "https://www.dropbox.com"),
+    "atlassian": ("Atlassian", "https://www.atlassian.com"),
+    "snap": ("Snap Inc", "https://www.snap.com"),
+    "uber": ("Uber", "https://www.uber.com"),
+    "lyft": ("Lyft", "https://www.lyft.com"),
+    "airbnb": ("Airbnb", "https://www.airbnb.com"),
+    "twitch": ("Twitch", "https://www.twitch.tv"),
+    "reddit": ("Reddit", "https://www.reddit.com"),
+    "discord": ("Discord", "https://discord.com"),
+    "roblox": ("Roblox", "https://corp.roblox.com"),
+    "spotify": ("Spotify", "https://www.spotify.com"),
+    "netflix": ("Netflix", "https://www.netflix.com"),
+    "patreon": ("Patreon", "https://www.patreon.com"),
+    "pinterest": ("Pinterest", "https://www.pinterest.com"),
+    "medium": ("Medium", "https://medium.com"),
+    "tumblr": ("Tumblr", "https://www.tumblr.com"),
+    "vimeo": ("Vimeo", "https://vimeo.com"),
+    "soundcloud": ("SoundCloud", "https://soundcloud.com"),
+    
+    # Web3/Crypto
+    "immunefi": ("Immunefi", "https://immunefi.com"),
+    "chainalysis": ("Chainalysis", "https://www.chainalysis.com"),
+    "consensys": ("ConsenSys", "https://consensys.net"),
+    "alchemy": ("Alchemy", "https://www.alchemy.com"),
+    "coinbase": ("Coinbase", "https://www.coinbase.com"),
+    "circle": ("Circle", "https://www.circle.com"),
+    "gemini": ("Gemini", "https://www.gemini.com"),
+    "opensea": ("OpenSea", "https://opensea.io"),
+    "uniswap": ("Uniswap Labs", "https://uniswap.org"),
+    "luno": ("Luno", "https://www.luno.com"),
+    "kraken": ("Kraken", "https://www.kraken.com"),
+    "binance": ("Binance", "https://www.binance.com"),
+    "blockdaemon": ("Blockdaemon", "https://blockdaemon.com"),
+    "infura": ("Infura", "https://infura.io"),
+    "anchorage": ("Anchorage Digital", "https://www.anchorage.com"),
+    "fireblocks": ("Fireblocks", "https://www.fireblocks.com"),
+    "messari": ("Messari", "https://messari.io"),
+    "aave": ("Aave", "https://aave.com"),
+    "sushiswap": ("SushiSwap", "https://www.sushi.com"),
+    "thegraph": ("The Graph", "https://thegraph.com"),
+    "pythereum": ("Pyth Network", "https://pyth.network"),
+    "lido": ("Lido", "https://lido.fi"),
+    "rarible": ("Rarible", "https://rarible.com"),
+    "magiceden": ("Magic Eden", "https://magiceden.io"),
+    "looksrare": ("LooksRare", "https://looksrare.org"),
+    "moonbeam": ("Moonbeam", "https://moonbeam.network"),
+    "render": ("Render", "https://render.com"),
+    "farcaster": ("Farcaster", "https://www.farcaster.xyz"),
+    "lensprotocol": ("Lens Protocol", "https://www.lens.xyz"),
+    "optimism": ("Optimism", "https://optimism.io"),
+    "arbitrum": ("Arbitrum", "https://arbitrum.io"),
+    "polygon": ("Polygon", "https://polygon.technology"),
+    "solana": ("Solana Labs", "https://solana.com"),
+    "avalabs": ("Avalabs", "https://www.avalabs.org"),
+    "near": ("Near Protocol", "https://near.org"),
+    "sideshift": ("SideShift.ai", "https://sideshift.ai"),
+    "changelly": ("Changelly", "https://changelly.com"),
+    "shapeshift": ("ShapeShift", "https://shapeshift.com"),
+    "thorchain": ("Thorchain", "https://thorchain.org"),
+    "0x": ("0x", "https://0x.org"),
+    "paraswap": ("Paraswap", "https://paraswap.io"),
+    "kybernetwork": ("Kyber Network", "https://kyber.network"),
+    "lifi": ("Li.Fi", "https://li.fi"),
+    "dydx": ("dYdX", "https://dydx.exchange"),
+    "compound": ("Compound", "https://compound.finance"),
+    "makerdao": ("MakerDAO", "https://makerdao.com"),
+    "curve": ("Curve Finance", "https://curve.fi"),
+    "balancer": ("Balancer", "https://balancer.fi"),
+    "1inch": ("1inch", "https://1inch.io"),
+    "metamask": ("MetaMask", "https://metamask.io"),
+    "rainbow": ("Rainbow", "https://rainbow.me"),
+    "phantom": ("Phantom", "https://phantom.app"),
+    "ledger": ("Ledger", "https://www.ledger.com"),
+    "trezor": ("Trezor", "https://trezor.io"),
+    "safe": ("Safe", "https://safe.global"),
+    "zksync": ("zkSync", "https://zksync.io"),
+    "starkware": ("StarkWare", "https://starkware.co"),
+    "matter-labs": ("Matter Labs", "https://matter-labs.io"),
+    "scroll": ("Scroll", "https://scroll.io"),
+    "base": ("Base", "https://base.org"),
+    "mantle": ("Mantle", "https://www.mantle.xyz"),
+    "linea": ("Linea", "https://linea.build"),
+    
+    # Blockchain Security & Auditing
+    "code4rena": ("Code4rena", "https://code4rena.com"),
+    "sherlock": ("Sherlock", "https://www.sherlock.xyz"),
+    "openzeppelin": ("OpenZeppelin", "https://www.openzeppelin.com"),
+    "certik": ("CertiK", "https://www.certik.com"),
+    "halborn": ("Halborn", "https://halborn.com"),
+    "trailofbits": ("Trail of Bits", "https://www.trailofbits.com"),
+    
+    # Blockchain Analytics & Compliance
+    "trmlabs": ("TRM Labs", "https://www.trmlabs.com"),
+    "elliptic": ("Elliptic", "https://www.elliptic.co"),
+    "crystalblockchain": ("Crystal Blockchain", "https://crystalblockchain.com"),
+    "merklescience": ("Merkle Science", "https://www.merklescience.com"),
+    
+    # AI Startups
+    "anthropic": ("Anthropic", "https://www.anthropic.com"),
+    "openai": ("OpenAI", "https://www.openai.com"),
+    "scale": ("Scale AI", "https://scale.com"),
+    "huggingface": ("Hugging Face", "https://huggingface.co"),
+    "cohere": ("Cohere", "https://cohere.com"),
+    "adept": ("Adept", "https://www.adept.ai"),
+    "inflection": ("Inflection AI", "https://inflection.ai"),
+    "character": ("Character.AI", "https://character.ai"),
+    "midjourney": ("Midjourney", "https://www.midjourney.com"),
+    "runway": ("Runway", "https://runwayml.com"),
+    "jasper": ("Jasper", "https://www.jasper.ai"),
+    "replicate": ("Replicate", "https://replicate.com"),
+    "together": ("Together AI", "https://www.together.ai"),
+    "mosaic": ("MosaicML", "https://www.mosaicml.com"),
+    "ai21": ("AI21 Labs", "https://www.ai21.com"),
+    "perplexity": ("Perplexity AI", "https://www.perplexity.ai"),
+    "stability": ("Stability AI", "https://stability.ai"),
+    "cresta": ("Cresta", "https://cresta.com"),
+    "synthesia": ("Synthesia", "https://www.synthesia.io"),
+    "elevenlabs": ("ElevenLabs", "https://elevenlabs.io"),
+    "replit": ("Replit", "https://replit.com"),
+    "mem": ("Mem", "https://get.mem.ai"),
+    "glean": ("Glean", "https://www.glean.com"),
+    "harvey": ("Harvey", "https://www.harvey.ai"),
+    "typeface": ("Typeface", "https://www.typeface.ai"),
+    "aleph-alpha": ("Aleph Alpha", "https://www.aleph-alpha.com"),
+    "lightricks": ("Lightricks", "https://www.lightricks.com"),
+    "writer": ("Writer", "https://writer.com"),
+    "reka": ("Reka AI", "https://reka.ai"),
+    "mistral": ("Mistral AI", "https://mistral.ai"),
+    "poolside": ("Poolside", "https://poolside.ai"),
+    "magic": ("Magic", "https://magic.dev"),
+    
+    # Security/Bug Bounty/Cybersecurity
+    "okta": ("Okta", "https://www.okta.com"),
+    "auth0": ("Auth0", "https://auth0.com"),
+    "crowdstrike": ("CrowdStrike", "https://www.crowdstrike.com"),
+    "datadog": ("Datadog", "https://www.datadoghq.com"),
+    "elastic": ("Elastic", "https://www.elastic.co"),
+    "splunk": ("Splunk", "https://www.splunk.com"),
+    "hackerone": ("HackerOne", "https://www.hackerone.com"),
+    "bugcrowd": ("Bugcrowd", "https://www.bugcrowd.com"),
+    "synack": ("Synack", "https://www.synack.com"),
+    "cobalt": ("Cobalt", "https://cobalt.io"),
+    "safebreach": ("SafeBreach", "https://safebreach.com"),
+    "paloaltonetworks": ("Palo Alto Networks", "https://www.paloaltonetworks.com"),
+    "sentinelone": ("SentinelOne", "https://www.sentinelone.com"),
+    "trellix": ("Trellix", "https://www.trellix.com"),
+    "checkpoint": ("Check Point", "https://www.checkpoint.com"),
+    "sophos": ("Sophos", "https://www.sophos.com"),
+    "akamai": ("Akamai", "https://www.akamai.com"),
+    "cisco": ("Cisco Security", "https://www.cisco.com"),
+    "rapid7": ("Rapid7", "https://www.rapid7.com"),
+    "tenable": ("Tenable", "https://www.tenable.com"),
+    "arcticwolf": ("Arctic Wolf", "https://arcticwolf.com"),
+    
+    # E-commerce/Marketplaces
+    "shopify": ("Shopify", "https://www.shopify.com"),
+    "etsy": ("Etsy", "https://www.etsy.com"),
+    "instacart": ("Instacart", "https://www.instacart.com"),
+    "doordash": ("DoorDash", "https://www.doordash.com"),
+    
+    # Developer Tools
+    "vercel": ("Vercel", "https://vercel.com"),
+    "notion": ("Notion", "https://www.notion.so"),
+    "linear": ("Linear", "https://linear.app"),
+    "retool": ("Retool", "https://retool.com"),
+    "webflow": ("Webflow", "https://webflow.com"),
+    "miro": ("Miro", "https://miro.com"),
+    "docker": ("Docker", "https://www.docker.com"),
+    "hashicorp": ("HashiCorp", "https://www.hashicorp.com"),
+    "mongodb": ("MongoDB", "https://www.mongodb.com"),
+    "postman": ("Postman", "https://www.postman.com"),
+    "confluent": ("Confluent", "https://www.confluent.io"),
+    "snyk": ("Snyk", "https://snyk.io"),
+    "pagerduty": ("PagerDuty", "https://www.pagerduty.com"),
+    "new-relic": ("New Relic", "https://newrelic.com"),
+    "sentry": ("Sentry", "https://sentry.io"),
+    
+    # Social/Communication
+    "bumble": ("Bumble", "https://bumble.com"),
+    "hinge": ("Hinge", "https://hinge.co"),
+    "match": ("Match Group", "https://mtch.com"),
+    "zoom": ("Zoom", "https://zoom.us"),
+    "slack": ("Slack", "https://slack.com"),
+    
+    # Gaming
+    "riotgames": ("Riot Games", "https://www.riotgames.com"),
+    "unity": ("Unity Technologies", "https://unity.com"),
+    "epicgames": ("Epic Games", "https://www.epicgames.com"),
+    "ea": ("Electronic Arts", "https://www.ea.com"),
+    "activision": ("Activision Blizzard", "https://www.activisionblizzard.com"),
+    "blizzard": ("Blizzard Entertainment", "https://www.blizzard.com"),
+    "bungie": ("Bungie", "https://www.bungie.net"),
+    "supercell": ("Supercell", "https://supercell.com"),
+    "king": ("King", "https://king.com"),
+    "zynga": ("Zynga", "https://www.zynga.com")
+}
+
+LEVER_COMPANIES = {
+    "cloudflare": ("Cloudflare", "https://www.cloudflare.com"),
+    "affirm": ("Affirm", "https://www.affirm.com"),
+    "asana": ("Asana", "https://asana.com"),
+    "notion": ("Notion", "https://www.notion.so"),
+    "figma": ("Figma", "https://www.figma.com"),
+    "gusto": ("Gusto", "https://gusto.com"),
+    "benchling": ("Benchling", "https://www.benchling.com"),
+    "airtable": ("Airtable", "https://www.airtable.com"),
+    "ripple": ("Ripple", "https://ripple.com"),
+    "tiktok": ("TikTok", "https://www.tiktok.com"),
+    "bytedance": ("ByteDance", "https://www.bytedance.com"),
+    "stripe": ("Stripe", "https://stripe.com"),
+    "canva": ("Canva", "https://www.canva.com"),
+    "linkedin": ("LinkedIn", "https://www.linkedin.com"),
+    "netflix": ("Netflix", "https://www.netflix.com"),
+    "meta": ("Meta", "https://www.meta.com"),
+    "moonpay": ("MoonPay", "https://www.moonpay.com"),
+    "github": ("GitHub", "https://github.com")
+}
+
+# Per-company boards, refreshed board by board in incremental mode
+BOARD_SOURCES = {
+    "Greenhouse": GREENHOUSE_COMPANIES,
+    "Lever": LEVER_COMPANIES,
+}
+
+# (source, company name) -> "Source/slug" refresh unit for board jobs
+BOARD_UNITS = {
+    (source, company_name): f"{source}/{slug}"
+    for source, companies in BOARD_SOURCES.items()
+    for slug, (company_name, _) in companies.items()
+}
+
+
+def select_companies(companies: Dict[str, tuple], slugs: Optional[Iterable[str]] = None) -> Dict[str, tuple]:
+    """Restrict a company table to the given slugs, keeping table order"""
+    if slugs is None:
+        return companies
+    wanted = set(slugs)
+    return {slug: info for slug, info in companies.items() if slug in wanted}
+
+
+def job_key(job: Dict) -> str:
+    """Stable identity of a posting across runs"""
+    if job.get("id"):
+        return f"{job['source'].lower()}:{job['id']}"
+    if job.get("url"):
+        return job["url"]
+    return "|".join(str(job.get(field, "")) for field in ("source", "company", "title", "location"))
+
+
+SEARCH_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+# Location gazetteer: tags implied by each place name (matched as whole words, case-insensitive)
+LOCATION_GAZETTEER = [
+    (("country:us",), ["united states", "usa", "u.s.", "u.s.a.", "us", "us-based"]),
+    (("country:us", "metro:sf"), ["san francisco", "sf", "bay area", "sf bay area", "south san francisco",
+                                  "san mateo", "palo alto", "mountain view", "menlo park", "oakland",
+                                  "san jose", "sunnyvale", "redwood city", "foster city", "san bruno"]),
+    (("country:us", "metro:nyc"), ["new york", "new york city", "nyc", "brooklyn", "manhattan"]),
+    (("country:us", "metro:seattle"), ["seattle", "bellevue", "redmond", "kirkland"]),
+    (("country:us", "metro:la"), ["los angeles", "santa monica", "irvine", "culver city"]),
+    (("country:us", "metro:austin"), ["austin"]),
+    (("country:us", "metro:boston"), ["boston", "cambridge, ma"]),
+    (("country:us", "metro:chicago"), ["chicago"]),
+    (("country:us", "metro:denver"), ["denver", "boulder"]),
+    (("country:us", "metro:dc"), ["washington, dc", "washington dc", "washington d.c.", "washington, d.c.",
+                                  "arlington, va"]),
+    (("country:us",), ["atlanta", "miami", "dallas", "houston", "phoenix", "portland", "san diego",
+                       "salt lake city", "pittsburgh", "philadelphia", "raleigh", "nashville", "minneapolis",
+                       "california", "texas", "washington", "oregon", "colorado", "arizona", "utah", "florida",
+                       "massachusetts", "illinois", "virginia", "north carolina", "new jersey", "hawaii",
+                       "new mexico"]),
+    (("country:gb",), ["united kingdom", "uk", "u.k.", "england", "scotland", "wales", "great britain"]),
+    (("country:gb", "metro:london"), ["london"]),
+    (("country:gb",), ["manchester", "edinburgh", "cambridge, uk", "bristol"]),
+    (("country:in",), ["india", "hyderabad", "mumbai", "pune", "chennai", "delhi", "new delhi",
+                       "noida", "gurgaon", "gurugram"]),
+    (("country:in", "metro:bengaluru"), ["bengaluru", "bangalore"]),
+    (("country:ca",), ["canada", "montreal", "ottawa", "calgary", "ontario", "quebec", "alberta",
+                       "british columbia", "manitoba", "nova scotia"]),
+    (("country:ca", "metro:toronto"), ["toronto"]),
+    (("country:ca", "metro:vancouver"), ["vancouver"]),
+    (("country:ie", "metro:dublin"), ["ireland", "dublin"]),
+    (("country:de",), ["germany", "munich", "hamburg", "frankfurt"]),
+    (("country:de", "metro:berlin"), ["berlin"]),
+    (("country:fr", "metro:paris"), ["france", "paris"]),
+    (("country:nl", "metro:amsterdam"), ["netherlands", "amsterdam"]),
+    (("country:es",), ["spain", "madrid", "barcelona"]),
+    (("country:pt",), ["portugal", "lisbon"]),
+    (("country:pl",), ["poland", "warsaw", "krakow"]),
+    (("country:ch",), ["switzerland", "zurich", "zürich", "zug", "geneva"]),
+    (("country:lu",), ["luxembourg"]),
+    (("country:ro",), ["romania", "bucharest"]),
+    (("country:se",), ["sweden", "stockholm"]),
+    (("country:il",), ["israel", "tel aviv"]),
+    (("country:ae",), ["united arab emirates", "uae", "dubai", "abu dhabi"]),
+    (("country:sg", "metro:singapore"), ["singapore"]),
+    (("country:jp", "metro:tokyo"), ["japan", "tokyo"]),
+    (("country:kr",), ["south korea", "korea", "seoul"]),
+    (("country:hk",), ["hong kong"]),
+    (("country:cn",), ["china", "shanghai", "beijing", "shenzhen"]),
+    (("country:za",), ["south africa", "cape town", "johannesburg"]),
+    (("country:au",), ["australia", "sydney", "melbourne"]),
+    (("country:br",), ["brazil", "são paulo", "sao paulo"]),
+    (("country:mx",), ["mexico", "mexico city"]),
+    (("country:ar",), ["argentina", "buenos aires"]),
+    (("country:cr",), ["costa rica"]),
+    (("country:ph",), ["philippines", "manila"]),
+    (("region:emea",), ["emea", "europe", "eu"]),
+    (("region:apac",), ["apac", "asia", "asia pacific"]),
+    (("region:latam",), ["latam", "latin america", "south america"]),
+    (("region:americas",), ["americas", "north america"]),
+    (("region:global",), ["anywhere", "worldwide", "global"]),
+]
+
+# US state codes only count after a comma ("Austin, TX"), matched case-sensitively
+US_STATE_CODES = ("AL AK AZ AR CA CO CT DE FL GA HI ID IL IN IA KS KY LA ME MD MA MI MN MS MO MT NE NV NH NJ "
+                  "NM NY NC ND OH OK OR PA RI SC SD TN TX UT VT VA WA WV WI WY DC").split()
+# State codes that are also ISO country codes ("Toronto, CA", "Berlin, DE"); they need other US context
+AMBIGUOUS_STATE_CODES = set("AL AR AZ CA CO DE GA ID IL IN KY LA MA MD ME MN MO MS MT NC NE PA SC SD TN VA".split())
+
+_PLACE_TAGS = {alias: tags for tags, aliases in LOCATION_GAZETTEER for alias in aliases}
+_PLACE_PATTERN = re.compile(
+    r"(?<![a-z0-9])(" + "|".join(re.escape(alias) for alias in sorted(_PLACE_TAGS, key=len, reverse=True)) + r")(?![a-z0-9])"
+)
+_STATE_PATTERN = re.compile(r",\s*(" + "|".join(US_STATE_CODES) + r")\b")
+_ZIP_PATTERN = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+# Regions that take in the US, so naming one alone says nothing about working abroad
+_US_REGIONS = {"region:global", "region:americas"}
+_REMOTE_PATTERN = re.compile(r"\b(remote|anywhere|worldwide|work from home|wfh|distributed)\b")
+
+
+@lru_cache(maxsize=8192)
+def normalize_location(location: str) -> tuple:
+    """Parse a raw location string into sorted, namespaced tags.
+
+    Tags are ``country:<iso2>``, ``metro:<name>``, ``region:<name>``, ``remote``
+    and ``remote:<country or region>`` (``remote:global`` when no place is
+    named), plus ``international`` for countries and regions (such as EMEA)
+    outside the US. Location strings repeat heavily across
+    boards, so results are memoized.
+    """
+    lowered = (location or "").lower()
+    tags = set()
+    # Aliases are tried longest first, so "new mexico" is taken whole before "mexico" can match
+    for match in _PLACE_PATTERN.finditer(lowered):
+        tags.update(_PLACE_TAGS[match.group(1)])
+    # A state-looking code never overrides a country named outright ("Vancouver, BC, CA")
+    if not any(tag.startswith("country:") and tag != "country:us" for tag in tags):
+        us_context = "country:us" in tags or _ZIP_PATTERN.search(location or "")
+        if any(us_context or code not in AMBIGUOUS_STATE_CODES for code in _STATE_PATTERN.findall(location or "")):
+            tags.add("country:us")
+    
+    if _REMOTE_PATTERN.search(lowered):
+        tags.add("remote")
+        areas = [tag.split(":", 1)[1] for tag in tags if tag.startswith(("country:", "region:"))]
+        tags.update(f"remote:{area}" for area in areas or ["global"])
+    
+    abroad = {tag for tag in tags if tag.startswith(("country:", "region:"))} - _US_REGIONS
+    if abroad and "country:us" not in tags:
+        tags.add("international")
+    return tuple(sorted(tags))
+
+
+def location_tags(location: str) -> List[str]:
+    return list(normalize_location(location or ""))
+
+
+class SearchIndexBuilder:
+    """Incrementally builds the inverted index over title and company tokens, plus facet counts.
+
+    Jobs are added in the order they are written, so postings are positions
+    in the jobs file. Location facets count each ``location_tags`` tag.
+    """
+
     def __init__(self):
-        self.jobs = []
-        self.days_old_threshold = 60  # Only show jobs posted within last 60 days
+        self.postings = {}
+        self.facets = {"company": Counter(), "source": Counter(), "location": Counter()}
+        self.count = 0
+
+    def add(self, job: Dict):
+        position = self.count
+        self.count += 1
+        text = f"{job.get('title', '')} {job.get('company', '')}".lower()
+        for token in set(SEARCH_TOKEN.findall(text)):
+            self.postings.setdefault(token, []).append(position)
+        self.facets["company"][job.get("company", "Unknown")] += 1
+        self.facets["source"][job.get("source", "Unknown")] += 1
+        self.facets["location"].update(job.get("location_tags") or location_tags(job.get("location", "")))
+
+    def result(self, last_updated: str) -> Dict:
+        """The index document; tokens are sorted so the client can binary-search prefixes"""
+        tokens = sorted(self.postings)
+        return {
+            "last_updated": last_updated,
+            "total_jobs": self.count,
+            "tokens": tokens,
+            "postings": [self.postings[token] for token in tokens],
+            "facets": {name: dict(counts.most_common()) for name, counts in self.facets.items()}
+        }
+
+
+def build_search_index(jobs: Iterable[Dict], last_updated: str) -> Dict:
+    """Inverted index and facet counts for a list of jobs"""
+    builder = SearchIndexBuilder()
+    for job in jobs:
+        builder.add(job)
+    return builder.result(last_updated)
+
+
+class ShardWriter:
+    """Writes jobs as per-source chunks plus a small manifest the pages load progressively.
+
+    Chunks hold at most ``shard_size`` jobs and keep the order jobs are added
+    in, so the first chunk is enough to render the first page. Chunk names
+    carry a hash of their content, so clients may cache them for good. The
+    manifest is replaced last, and chunks it no longer lists are removed.
+    """
+
+    def __init__(self, directory: str = "jobs_data", shard_size: int = 200):
+        self.directory = directory
+        self.shard_size = shard_size
+        self.shards = []
+        self.count = 0
+        self._chunk = []
+        self._source = None
+        self._chunks_per_source = Counter()
+        os.makedirs(directory, exist_ok=True)
+
+    def add(self, job: Dict):
+        source = job.get("source", "Unknown")
+        if source != self._source or len(self._chunk) >= self.shard_size:
+            self._flush()
+            self._source = source
+        self._chunk.append(job)
+        self.count += 1
+
+    def _flush(self):
+        if not self._chunk:
+            return
+        number = self._chunks_per_source[self._source]
+        self._chunks_per_source[self._source] += 1
+        body = json.dumps({"source": self._source, "jobs": self._chunk}, separators=(",", ":")).encode()
+        # Named by content, so an unchanged chunk keeps its name and stays cached in clients
+        name = f"{self._source.lower()}-{number}.{hashlib.sha256(body).hexdigest()[:16]}.json"
+        path = os.path.join(self.directory, name)
+        if not os.path.exists(path):
+            write_atomic(path, body)
+        self.shards.append({"file": name, "source": self._source, "count": len(self._chunk)})
+        self._chunk = []
+
+    def finish(self, last_updated: str) -> Dict:
+        self._flush()
+        manifest = {
+            "last_updated": last_updated,
+            "total_jobs": self.count,
+            "shards": self.shards
+        }
+        write_atomic(os.path.join(self.directory, "manifest.json"), json.dumps(manifest, indent=2).encode())
         
-    def is_job_recent(self, posted_date_str: str) -> bool:
-        """Check if job was posted within the threshold"""
+        listed = {shard["file"] for shard in self.shards} | {"manifest.json"}
+        for name in os.listdir(self.directory):
+            if name.endswith(".json") and name not in listed:
+                os.remove(os.path.join(self.directory, name))
+        
+        print(f"🧩 Wrote {len(self.shards)} shards and a manifest to {self.directory}/")
+        return manifest
+
+    @staticmethod
+    def remove(manifest_path: str):
+        """Delete a manifest and the chunks it lists, once sharding is turned off"""
+        directory = os.path.dirname(manifest_path)
         try:
-            from datetime import timezone
-            # Parse various date formats
-            if 'T' in posted_date_str:
-                # Remove timezone info for simpler comparison
-                posted_date_str = posted_date_str.split('T')[0] + 'T' + posted_date_str.split('T')[1].split('-')[0].split('+')[0]
-                posted_date = datetime.fromisoformat(posted_date_str.replace('Z', ''))
+            with open(manifest_path, "rb") as f:
+                names = [shard["file"] for shard in json_loads(f.read()).get("shards", [])]
+        except (OSError, ValueError):
+            return
+        for name in names + [os.path.basename(manifest_path)]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+        print(f"🧹 Removed the shards in {directory}/, sharding is off")
+
+
+# API host behind each source, and the request rate (per second) each is allowed by default
+SOURCE_HOSTS = {
+    "Greenhouse": "boards-api.greenhouse.io",
+    "Lever": "api.lever.co",
+    "RemoteOK": "remoteok.com",
+    "CryptoJobsList": "cryptojobslist.com",
+    "Adzuna": "api.adzuna.com",
+}
+SOURCE_RATE_LIMITS = {
+    "Greenhouse": 20.0,
+    "Lever": 20.0,
+    "RemoteOK": 1.0,
+    "CryptoJobsList": 2.0,
+    "Adzuna": 25 / 60,  # Free keys allow 25 calls a minute
+}
+# Tokens a source's bucket may save up (the limiter's default otherwise); with a burst of 1 Adzuna
+# can never front-load calls, so no minute sees more than its quota
+SOURCE_BURSTS = {
+    "Adzuna": 1,
+}
+
+# Adzuna country endpoints and search phrases; every pair is paged separately
+ADZUNA_COUNTRIES = ["us", "gb", "ca", "au"]
+ADZUNA_KEYWORDS = ["trust and safety", "content moderation", "fraud prevention", "threat intelligence"]
+ADZUNA_DAILY_CALLS = 250  # Free keys allow 250 calls a day
+
+# Preferred record when the same posting comes from several sources: direct ATS boards first
+SOURCE_PRIORITY = {"Greenhouse": 3, "Lever": 3, "Adzuna": 1, "RemoteOK": 1, "CryptoJobsList": 1}
+
+_COMPANY_SUFFIXES = re.compile(r"\b(inc|llc|ltd|limited|corp|corporation|co|company|labs|technologies|gmbh|plc|ai)\b\.?")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_company(company: str) -> str:
+    """Company name reduced for matching: lowercase, no punctuation or legal suffixes"""
+    lowered = (company or "").lower().replace(".com", "")
+    return _NON_WORD.sub(" ", _COMPANY_SUFFIXES.sub(" ", lowered)).strip()
+
+
+def normalize_title(title: str, company: str = "") -> str:
+    """Job title reduced for matching; drops parentheticals and a trailing 'at <company>'"""
+    lowered = re.sub(r"\([^)]*\)", " ", (title or "").lower()).replace("&", " and ")
+    if company:
+        lowered = re.sub(rf"\s+(at|@)\s+{re.escape(company.lower())}.*$", "", lowered)
+    return _NON_WORD.sub(" ", lowered).strip()
+
+
+# Title words that only say how or where the job is worked; two titles differing in these alone match
+TITLE_NOISE_WORDS = {"remote", "hybrid", "onsite", "on", "site", "office", "in", "full", "part", "time",
+                     "fulltime", "parttime", "contract", "contractor", "temporary", "temp", "permanent",
+                     "m", "f", "d", "w", "x"}
+
+
+class JobDeduplicator:
+    """Streaming cross-source dedup over normalized title, company and location.
+
+    Exact duplicates share a hash of the normalized fields. Near duplicates
+    (reordered words, a suffix like "- Remote") are found with MinHash
+    signatures over the title's word and bigram shingles. Company and
+    location must match exactly: locality-sensitive hashing (LSH) buckets
+    the signatures by both, so each job is only compared with a few
+    candidates instead of every job seen so far. A candidate also needs the
+    same title words apart from ``TITLE_NOISE_WORDS``, so "Senior Trust &
+    Safety Analyst" or "Risk Manager, Payments" stay separate postings.
+
+    Jobs are only merged with clusters that do not already hold their source,
+    because separate reqs on one board are real postings. Each cluster keeps
+    the record from the highest-priority source. add() observes jobs as they
+    stream past. transform() is applied at write time: it drops the losing
+    records and lists every contributing source on the winner.
+    """
+
+    PRIME = (1 << 61) - 1
+
+    def __init__(self, num_hashes: int = 64, bands: int = 16, threshold: float = 0.7):
+        rng = random.Random(1729)
+        self.coefficients = [(rng.randrange(1, self.PRIME), rng.randrange(0, self.PRIME)) for _ in range(num_hashes)]
+        self.bands = bands
+        self.rows = num_hashes // bands
+        self.threshold = threshold
+        self.exact = {}      # fingerprint -> cluster id
+        self.buckets = {}    # (company, location, band, rows) -> [cluster ids]
+        self.clusters = []   # {"winner", "priority", "sources", "urls", "signature", "words"}
+        self.cluster_of = {} # job_key -> cluster id
+        self.duplicates = 0
+
+    def _signature(self, text: str) -> tuple:
+        words = text.split()
+        shingles = set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+        hashes = [zlib.crc32(shingle.encode()) for shingle in shingles] or [0]
+        return tuple(min((a * h + b) % self.PRIME for h in hashes) for a, b in self.coefficients)
+
+    def _band_keys(self, block: tuple, signature: tuple) -> List[tuple]:
+        return [(*block, band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _similar(self, left: tuple, right: tuple) -> bool:
+        same = sum(1 for a, b in zip(left, right) if a == b)
+        return same / len(left) >= self.threshold
+
+    @staticmethod
+    def _same_qualifiers(left: frozenset, right: frozenset) -> bool:
+        """True if the titles differ at most in work-arrangement words, not seniority or scope"""
+        return (left ^ right) <= TITLE_NOISE_WORDS
+
+    def add(self, job: Dict):
+        key = job_key(job)
+        source = job.get("source", "Unknown")
+        company = normalize_company(job.get("company", ""))
+        title = normalize_title(job.get("title", ""), job.get("company", ""))
+        location = " ".join(job.get("location_tags") or []) or _NON_WORD.sub(" ", (job.get("location") or "").lower())
+        fingerprint = hashlib.sha1(f"{title}|{company}|{location}".encode()).hexdigest()
+        
+        cluster_id = self.exact.get(fingerprint)
+        if cluster_id is not None and source in self.clusters[cluster_id]["sources"]:
+            cluster_id = None
+        signature = self._signature(title)
+        words = frozenset(title.split())
+        band_keys = self._band_keys((company, location), signature)
+        if cluster_id is None:
+            candidates = {cid for band_key in band_keys for cid in self.buckets.get(band_key, ())}
+            for candidate in sorted(candidates):
+                cluster = self.clusters[candidate]
+                if (source not in cluster["sources"] and self._same_qualifiers(words, cluster["words"])
+                        and self._similar(signature, cluster["signature"])):
+                    cluster_id = candidate
+                    break
+        
+        if cluster_id is None:
+            cluster_id = len(self.clusters)
+            self.clusters.append({"winner": key, "priority": SOURCE_PRIORITY.get(source, 0),
+                                  "sources": [source], "urls": [job.get("url", "")],
+                                  "signature": signature, "words": words})
+            self.exact.setdefault(fingerprint, cluster_id)
+            for band_key in band_keys:
+                self.buckets.setdefault(band_key, []).append(cluster_id)
+        else:
+            cluster = self.clusters[cluster_id]
+            cluster["sources"].append(source)
+            cluster["urls"].append(job.get("url", ""))
+            priority = SOURCE_PRIORITY.get(source, 0)
+            if priority > cluster["priority"]:
+                cluster["winner"], cluster["priority"] = key, priority
+            self.duplicates += 1
+        self.cluster_of[key] = cluster_id
+
+    def stream(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """Dedup stage: observe each job and pass it along unchanged"""
+        for job in jobs:
+            self.add(job)
+            yield job
+
+    @property
+    def kept_count(self) -> int:
+        return len(self.clusters)
+
+    def transform(self, job: Dict) -> Optional[Dict]:
+        """Drop non-winning duplicates; annotate merged winners with their sources"""
+        key = job_key(job)
+        cluster = self.clusters[self.cluster_of[key]]
+        if cluster["winner"] != key:
+            return None
+        if len(cluster["sources"]) > 1:
+            job["sources"] = sorted(set(cluster["sources"]))
+            job["duplicate_urls"] = [url for url in cluster["urls"] if url and url != job.get("url")]
+        return job
+
+    def deduplicate(self, jobs: List[Dict]) -> List[Dict]:
+        """Non-streaming helper: the deduplicated version of a job list, in input order"""
+        for job in jobs:
+            self.add(job)
+        return [job for job in map(self.transform, jobs) if job is not None]
+
+
+def write_atomic(filename: str, body: bytes):
+    """Write a file through a temp file and a rename, so readers never see it half written"""
+    tmp_path = f"{filename}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(body)
+    os.replace(tmp_path, filename)
+
+
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def remove_files(paths: Iterable[str]):
+    """Delete files if present, e.g. outputs an earlier run wrote with other options"""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def write_compressed_siblings(filename: str):
+    """Stream a file into precompressed .gz (and .br, when brotli is installed) siblings"""
+    with open(filename, 'rb') as src, open(f"{filename}.gz.tmp", 'wb') as raw:
+        with gzip.GzipFile(filename="", mode='wb', fileobj=raw, compresslevel=9, mtime=0) as dst:
+            shutil.copyfileobj(src, dst)
+    os.replace(f"{filename}.gz.tmp", f"{filename}.gz")
+    if brotli is not None:
+        compressor = brotli.Compressor(quality=11)
+        with open(filename, 'rb') as src, open(f"{filename}.br.tmp", 'wb') as dst:
+            for block in iter(lambda: src.read(1 << 16), b""):
+                dst.write(compressor.process(block))
+            dst.write(compressor.finish())
+        os.replace(f"{filename}.br.tmp", f"{filename}.br")
+    else:
+        remove_files([f"{filename}.br"])  # Left by a run that had brotli; it would no longer match
+
+
+def hashed_name(filename: str, content_hash: str) -> str:
+    """``jobs_data.json`` -> ``jobs_data.<content_hash>.json``"""
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{content_hash}{ext}"
+
+
+def publish_hashed(filename: str, content_hash: str, compressed: bool = False) -> str:
+    """Give a written file (and its .gz/.br siblings) an immutable content-hashed twin; returns its name.
+
+    A twin that already exists is left alone, so a hashed name never changes
+    content once clients may have cached it. Twins are hard links where the
+    filesystem allows, since every writer here replaces files rather than
+    rewriting them in place.
+    """
+    target = hashed_name(filename, content_hash)
+    suffixes = [""]
+    if compressed:
+        suffixes += [".gz", ".br"] if brotli is not None else [".gz"]
+    for suffix in suffixes:
+        if os.path.exists(target + suffix):
+            continue
+        tmp_path = f"{target}{suffix}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            os.link(filename + suffix, tmp_path)
+        except OSError:
+            shutil.copyfile(filename + suffix, tmp_path)
+        os.replace(tmp_path, target + suffix)
+    return os.path.basename(target)
+
+
+def prune_hashed(filename: str, keep: Iterable[str]):
+    """Remove content-hashed twins of ``filename`` whose hash is not in ``keep``"""
+    directory = os.path.dirname(os.path.abspath(filename))
+    root, ext = os.path.splitext(os.path.basename(filename))
+    twin = re.compile(rf"{re.escape(root)}\.([0-9a-f]{{16}}){re.escape(ext)}(\.gz|\.br)?$")
+    keep = set(keep)
+    for name in os.listdir(directory):
+        match = twin.match(name)
+        if match and match.group(1) not in keep:
+            os.remove(os.path.join(directory, name))
+
+
+class JobStreamWriter:
+    """Incremental writer for the jobs file.
+
+    add() spools each job as one JSON line into a temp file per source, so
+    only the current job is held in memory. finish() then writes the
+    document with jobs grouped by source (in first-seen order), laid out
+    exactly as ``json.dump(..., indent=2)`` would, or minified when
+    ``compact`` is set. Each job is handed to ``consumers`` in final order.
+    The file is replaced atomically.
+
+    ``content_hash`` fingerprints the jobs added so far, so callers can
+    tell before finish() whether the data changed at all. It leaves out
+    ``last_seen``, which every refresh bumps, and ignores order, which
+    follows whichever board answered first.
+    """
+
+    # Bookkeeping that changes on every run without the posting changing
+    VOLATILE_FIELDS = ("last_seen",)
+
+    def __init__(self, filename: str, compact: bool = False, sample_size: int = 5):
+        self.filename = filename
+        self.compact = compact
+        self.sample_size = sample_size
+        self.count = 0
+        self.sample = []
+        self.pretty_bytes = 0  # Size the pretty-printed file has (or would have)
+        self._digest_sum = 0
+        self._spools = {}
+        self._spool_dir = tempfile.mkdtemp(prefix=".jobs_spool_", dir=os.path.dirname(os.path.abspath(filename)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, job: Dict):
+        source = job.get("source", "Unknown")
+        spool = self._spools.get(source)
+        if spool is None:
+            spool = self._spools[source] = open(os.path.join(self._spool_dir, f"{len(self._spools)}.jsonl"), 'w+', encoding="utf-8")
+        spool.write(json_dumps(job) + "\n")
+        stable = {key: value for key, value in job.items() if key not in self.VOLATILE_FIELDS}
+        digest = hashlib.sha256(json_dumps(stable).encode()).digest()
+        self._digest_sum = (self._digest_sum + int.from_bytes(digest, "big")) % (1 << 256)
+        self.count += 1
+
+    @property
+    def content_hash(self) -> str:
+        """Order-independent hash of the jobs added: the sum of each job's SHA-256"""
+        return f"{self._digest_sum:064x}"[:16]
+
+    def _spooled_jobs(self) -> Iterator[Dict]:
+        for spool in self._spools.values():
+            spool.seek(0)
+            for line in spool:
+                yield json_loads(line)
+
+    @staticmethod
+    def _pretty_member(key: str, value: Any) -> str:
+        """One top-level member as json.dump(indent=2) lays it out"""
+        return f"  {json.dumps(key)}: " + textwrap.indent(json.dumps(value, indent=2), "  ")[2:]
+
+    def finish(self, header: Dict, footer: Dict, consumers: Iterable[Callable[[Dict], None]] = (),
+               transform: Optional[Callable[[Dict], Optional[Dict]]] = None) -> int:
+        """Write the document: header fields, total_jobs, the jobs array, then footer fields.
+
+        ``transform`` may rewrite each spooled job or return None to drop it;
+        callers that drop jobs must pass the resulting ``total_jobs`` in the header.
+        """
+        header = {**header}
+        header.setdefault("total_jobs", self.count)
+        consumers = list(consumers)
+        written = 0
+        # The pretty layout is measured even in compact mode, as the baseline for the size report
+        pretty_head = ("{\n" + ",\n".join(self._pretty_member(key, value) for key, value in header.items())
+                       + ',\n  "jobs": [')
+        pretty_footer = "".join(",\n" + self._pretty_member(key, value) for key, value in footer.items()) + "\n}"
+        self.pretty_bytes = len(pretty_head.encode()) + len(pretty_footer.encode())
+        tmp_path = f"{self.filename}.tmp"
+        with open(tmp_path, 'w') as out:
+            if self.compact:
+                out.write(json.dumps(header, separators=(",", ":"))[:-1] + ',"jobs":[')
             else:
-                posted_date = datetime.strptime(posted_date_str, "%Y-%m-%d")
+                out.write(pretty_head)
             
-            cutoff_date = datetime.now() - timedelta(days=self.days_old_threshold)
+            for job in self._spooled_jobs():
+                if transform is not None:
+                    job = transform(job)
+                    if job is None:
+                        continue
+                for consume in consumers:
+                    consume(job)
+                if len(self.sample) < self.sample_size:
+                    self.sample.append(job)
+                pretty = textwrap.indent(json.dumps(job, indent=2), "    ")
+                self.pretty_bytes += len(pretty.encode()) + (2 if written else 1)
+                if self.compact:
+                    out.write(("," if written else "") + json.dumps(job, separators=(",", ":")))
+                else:
+                    out.write(("," if written else "") + "\n" + pretty)
+                written += 1
             
-            return posted_date.replace(tzinfo=None) >= cutoff_date.replace(tzinfo=None)
-        except Exception as e:
-            # If we can't parse the date, assume it's recent
+            if self.compact:
+                out.write("]")
+                for key, value in footer.items():
+                    out.write(f",{json.dumps(key)}:{json.dumps(value, separators=(',', ':'))}")
+                out.write("}")
+            else:
+                out.write("\n  ]" if written else "]")
+                out.write(pretty_footer)
+        self.pretty_bytes += len("\n  ]" if written else "]")
+        os.replace(tmp_path, self.filename)
+        if self.compact:
+            write_compressed_siblings(self.filename)
+        else:
+            self.pretty_bytes = os.path.getsize(self.filename)
+        self.count = written
+        return written
+
+    def close(self):
+        for spool in self._spools.values():
+            spool.close()
+        self._spools = {}
+        shutil.rmtree(self._spool_dir, ignore_errors=True)
+
+
+class JobStore:
+    """Embedded SQLite store of every posting ever fetched, with its first/last sighting.
+
+    Rows are keyed by ``job_key`` and never deleted: a posting that leaves
+    its board is marked inactive but keeps its history. Company, source,
+    posted date, first sighting and location tags are indexed, so queries
+    like "new jobs this week at these companies" avoid loading everything.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            key TEXT PRIMARY KEY,
+            source TEXT NOT NULL,
+            company TEXT,
+            title TEXT,
+            unit TEXT,
+            posted_ts INTEGER,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            seen_order INTEGER NOT NULL DEFAULT 0,
+            active INTEGER NOT NULL DEFAULT 1,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS job_tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (tag, key)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company);
+        CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source);
+        CREATE INDEX IF NOT EXISTS jobs_posted ON jobs (posted_ts);
+        CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+        CREATE INDEX IF NOT EXISTS jobs_unit ON jobs (unit, active);
+        CREATE INDEX IF NOT EXISTS jobs_export ON jobs (active, last_seen, seen_order);
+        CREATE INDEX IF NOT EXISTS job_tags_key ON job_tags (key);
+    """
+    # Columns kept outside the JSON blob; merged back into the job on export
+    HISTORY_FIELDS = ("first_seen", "last_seen")
+
+    def __init__(self, path: str = "jobs.db", batch_size: int = 500, check_same_thread: bool = True):
+        self.path = path
+        self.batch_size = batch_size
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Pass check_same_thread=False only if callers serialize access themselves
+        self.db = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(self.SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def is_empty(self) -> bool:
+        return self.db.execute("SELECT NOT EXISTS (SELECT 1 FROM jobs)").fetchone()[0] == 1
+
+    def get_meta(self, name: str, default: Any = None) -> Any:
+        row = self.db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return json_loads(row[0]) if row else default
+
+    def set_meta(self, name: str, value: Any):
+        with self.db:
+            self.db.execute("INSERT INTO meta (name, value) VALUES (?, ?) "
+                            "ON CONFLICT (name) DO UPDATE SET value = excluded.value", (name, json.dumps(value)))
+
+    def upsert(self, jobs: Iterable[Dict], stamp: str, unit_of: Callable[[Dict], str]) -> set:
+        """Insert or refresh jobs in batches; returns the keys written.
+
+        A known key keeps its ``first_seen``; ``last_seen`` becomes ``stamp``.
+        Jobs may carry their own ``first_seen``/``last_seen`` (e.g. imported
+        from an old snapshot), which are used for new rows.
+        """
+        written = set()
+        batch = []
+        for order, job in enumerate(jobs):
+            key = job_key(job)
+            if key in written:
+                continue
+            written.add(key)
+            batch.append((key, job, order))
+            if len(batch) >= self.batch_size:
+                self._write_batch(batch, stamp, unit_of)
+                batch = []
+        if batch:
+            self._write_batch(batch, stamp, unit_of)
+        return written
+
+    def _write_batch(self, batch: List[tuple], stamp: str, unit_of: Callable[[Dict], str]):
+        rows = []
+        tags = []
+        for key, job, order in batch:
+            data = {field: value for field, value in job.items() if field not in self.HISTORY_FIELDS}
+            rows.append((key, job.get("source", ""), job.get("company"), job.get("title"), unit_of(job),
+                         job.get("posted_ts"), job.get("first_seen", stamp), job.get("last_seen", stamp),
+                         order, json_dumps(data)))
+            tags.extend((tag, key) for tag in job.get("location_tags", ()))
+        with self.db:
+            self.db.executemany("""
+                INSERT INTO jobs (key, source, company, title, unit, posted_ts, first_seen, last_seen, seen_order, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    source = excluded.source, company = excluded.company, title = excluded.title,
+                    unit = excluded.unit, posted_ts = excluded.posted_ts, last_seen = excluded.last_seen,
+                    seen_order = excluded.seen_order, active = 1, data = excluded.data
+            """, rows)
+            self.db.executemany("DELETE FROM job_tags WHERE key = ?", [(key,) for key, _, _ in batch])
+            self.db.executemany("INSERT OR IGNORE INTO job_tags (tag, key) VALUES (?, ?)", tags)
+
+    def retire(self, seen: set, units: Optional[Iterable[str]] = None, keep_units: Iterable[str] = ()) -> int:
+        """Mark active jobs that were not seen this run as inactive.
+
+        Only jobs from the given refresh ``units`` are considered, or every
+        job when ``units`` is None; jobs from ``keep_units`` (e.g. boards
+        whose fetch failed) are left alone. Returns the number of jobs retired.
+        """
+        with self.db:
+            self.db.execute("CREATE TEMP TABLE IF NOT EXISTS seen_keys (key TEXT PRIMARY KEY)")
+            self.db.execute("DELETE FROM seen_keys")
+            self.db.executemany("INSERT INTO seen_keys VALUES (?)", ((key,) for key in seen))
+            query = "UPDATE jobs SET active = 0 WHERE active = 1 AND key NOT IN (SELECT key FROM seen_keys)"
+            if units is not None:
+                self.db.execute("CREATE TEMP TABLE IF NOT EXISTS retired_units (unit TEXT PRIMARY KEY)")
+                self.db.execute("DELETE FROM retired_units")
+                self.db.executemany("INSERT OR IGNORE INTO retired_units VALUES (?)", ((unit,) for unit in units))
+                query += " AND unit IN (SELECT unit FROM retired_units)"
+            keep_units = list(keep_units)
+            if keep_units:
+                self.db.execute("CREATE TEMP TABLE IF NOT EXISTS kept_units (unit TEXT PRIMARY KEY)")
+                self.db.execute("DELETE FROM kept_units")
+                self.db.executemany("INSERT OR IGNORE INTO kept_units VALUES (?)", ((unit,) for unit in keep_units))
+                query += " AND unit NOT IN (SELECT unit FROM kept_units)"
+            return self.db.execute(query).rowcount
+
+    def _rows_to_jobs(self, rows: Iterable[tuple]) -> Iterator[Dict]:
+        for data, first_seen, last_seen in rows:
+            job = json_loads(data)
+            job["first_seen"] = first_seen
+            job["last_seen"] = last_seen
+            yield job
+
+    def iter_active(self, cutoff_ts: Optional[int] = None, keep_undated: bool = True) -> Iterator[Dict]:
+        """Active jobs newest sighting first, in the order they were fetched"""
+        query = "SELECT data, first_seen, last_seen FROM jobs WHERE active = 1"
+        params = []
+        if cutoff_ts is not None:
+            query += " AND (posted_ts >= ?" + (" OR posted_ts IS NULL)" if keep_undated else ")")
+            params.append(cutoff_ts)
+        query += " ORDER BY last_seen DESC, seen_order"
+        yield from self._rows_to_jobs(self.db.execute(query, params))
+
+    def query(self, companies: Optional[Iterable[str]] = None, sources: Optional[Iterable[str]] = None,
+              tag: Optional[str] = None, first_seen_since: Optional[str] = None,
+              posted_since_ts: Optional[int] = None, title_contains: Optional[str] = None,
+              active_only: bool = True, limit: Optional[int] = None) -> List[Dict]:
+        """Look up jobs through the indexes, newest postings first.
+
+        E.g. new security jobs this week at crypto companies::
+
+            store.query(companies=["Coinbase", "Kraken"], title_contains="security",
+                        first_seen_since=(datetime.now() - timedelta(days=7)).isoformat())
+        """
+        clauses, params = [], []
+        if active_only:
+            clauses.append("jobs.active = 1")
+        if companies is not None:
+            companies = list(companies)
+            clauses.append(f"jobs.company IN ({', '.join('?' * len(companies))})")
+            params.extend(companies)
+        if sources is not None:
+            sources = list(sources)
+            clauses.append(f"jobs.source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if tag:
+            clauses.append("jobs.key IN (SELECT key FROM job_tags WHERE tag = ?)")
+            params.append(tag)
+        if first_seen_since:
+            clauses.append("jobs.first_seen >= ?")
+            params.append(first_seen_since)
+        if posted_since_ts is not None:
+            clauses.append("jobs.posted_ts >= ?")
+            params.append(posted_since_ts)
+        if title_contains:
+            clauses.append("jobs.title LIKE ?")
+            params.append(f"%{title_contains}%")
+        query = "SELECT data, first_seen, last_seen FROM jobs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY posted_ts DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return list(self._rows_to_jobs(self.db.execute(query, params)))
+
+
+# Fields whose repeated values the columnar format stores once in a table
+INTERNED_FIELDS = ("company", "company_url", "source", "location")
+
+
+def encode_columnar(data: Dict) -> Dict:
+    """Dictionary-encode a jobs snapshot column by column.
+
+    Interned fields become indexes into per-field tables, ``url`` becomes a
+    ``[prefix index, remainder]`` pair split at the last slash, and every
+    other field is stored as a plain column (``None`` where a job lacks it).
+    """
+    jobs = data["jobs"]
+    fields = []
+    for job in jobs:
+        for field in job:
+            if field not in fields:
+                fields.append(field)
+    
+    tables = {field: [] for field in INTERNED_FIELDS + ("url_prefix",)}
+    lookups = {field: {} for field in tables}
+    
+    def intern(table: str, value) -> int:
+        lookup = lookups[table]
+        if value not in lookup:
+            lookup[value] = len(tables[table])
+            tables[table].append(value)
+        return lookup[value]
+    
+    columns = {field: [] for field in fields}
+    for job in jobs:
+        for field in fields:
+            value = job.get(field)
+            if field in INTERNED_FIELDS and field in job:
+                value = intern(field, value)
+            elif field == "url" and isinstance(value, str):
+                prefix, _, rest = value.rpartition("/")
+                value = [intern("url_prefix", prefix + "/" if prefix else ""), rest]
+            columns[field].append(value)
+    
+    encoded = {key: value for key, value in data.items() if key != "jobs"}
+    encoded.update({"format": "columnar-v1", "tables": tables, "columns": columns})
+    return encoded
+
+
+def decode_columnar(encoded: Dict) -> Dict:
+    """Rebuild the row-oriented snapshot from encode_columnar() output"""
+    tables, columns = encoded["tables"], encoded["columns"]
+    data = {key: value for key, value in encoded.items() if key not in ("format", "tables", "columns")}
+    jobs = [{} for _ in range(data["total_jobs"])]
+    for field, column in columns.items():
+        for job, value in zip(jobs, column):
+            if value is None and field not in INTERNED_FIELDS:
+                continue
+            if field in INTERNED_FIELDS:
+                if value is None:
+                    continue
+                value = tables[field][value]
+            elif field == "url" and isinstance(value, list):
+                value = tables["url_prefix"][value[0]] + value[1]
+            job[field] = value
+    data["jobs"] = jobs
+    return data
+
+
+@lru_cache(maxsize=16384)
+def parse_timestamp(value) -> Optional[int]:
+    """Convert any source's posted date to a UTC epoch in seconds, or None if unusable.
+
+    Handles ISO 8601 with or without an offset (Greenhouse, RemoteOK, Adzuna),
+    epoch seconds or milliseconds (Lever's ``createdAt``) and RFC 822 dates
+    (RSS ``pubDate``). Naive times are taken as UTC. Results are memoized
+    because boards repeat the same timestamps.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        # Anything past the year 5000 in seconds is really milliseconds
+        return int(value / 1000) if value > 1e11 else int(value)
+    text = str(value).strip()
+    if not text or text.lower() == "unknown":
+        return None
+    if text.isdigit():
+        return parse_timestamp(int(text))
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+# Shared filter vocabulary: keyword -> relevance weight
+KEYWORD_WEIGHTS = {
+    "trust": 3, "safety": 3, "moderation": 3, "abuse": 3, "fraud": 3, "integrity": 3, "threat": 3,
+    "investigation": 2, "investigator": 2, "security": 2, "risk": 2, "compliance": 2,
+    "policy": 2, "policies": 2,
+    "operations": 1, "support": 1,
+}
+
+
+class KeywordMatcher:
+    """One precompiled word-boundary regex over every keyword, with per-keyword weights.
+
+    "risk" matches "Risk Analyst" but not "Asterisk", and a trailing plural
+    "s" is allowed. A job's relevance is the summed weight of the distinct
+    keywords it mentions; jobs below ``min_score`` are filtered out.
+    Keywords weighing less than ``min_score`` only boost a job that also
+    mentions a stronger one, so "Customer Support Specialist" scores 0.
+    """
+
+    def __init__(self, weights: Dict[str, float], min_score: float = 2):
+        self.weights = {keyword.lower(): weight for keyword, weight in weights.items()}
+        self.min_score = min_score
+        alternation = "|".join(re.escape(keyword) for keyword in sorted(self.weights, key=len, reverse=True))
+        # Lowercasing the text and matching case-sensitively is faster than re.IGNORECASE
+        self.pattern = re.compile(rf"\b({alternation})s?\b")
+
+    def score(self, *texts: str) -> float:
+        found = self.pattern.findall(" \n ".join(filter(None, texts)).lower())
+        weights = [self.weights[keyword] for keyword in set(found)]
+        if not weights or max(weights) < self.min_score:
+            return 0
+        return sum(weights)
+
+    def relevant(self, score: float) -> bool:
+        return score >= self.min_score
+
+
+def host_of(url: str) -> str:
+    """Return the hostname part of a URL"""
+    return urlparse(url).hostname or ""
+
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_BLOCK_TAG = re.compile(r"</?(p|div|br|li|ul|ol|h[1-6])\b[^>]*>", re.IGNORECASE)
+_SPACES = re.compile(r"[ \t\xa0]+")
+_BLANK_LINES = re.compile(r"\s*\n\s*")
+
+# Longest description kept per job, in characters
+DESCRIPTION_CHARS = 1000
+
+
+def html_to_text(markup: str, limit: int = DESCRIPTION_CHARS) -> str:
+    """Plain text from (possibly entity-escaped) HTML, cut at a word boundary to ``limit`` characters"""
+    if not markup:
+        return ""
+    text = html.unescape(markup)  # Greenhouse escapes its HTML once more
+    text = _BLOCK_TAG.sub("\n", text)
+    text = html.unescape(_HTML_TAG.sub("", text))
+    text = _BLANK_LINES.sub("\n", _SPACES.sub(" ", text)).strip()
+    if len(text) > limit:
+        text = text[:limit].rsplit(" ", 1)[0] + "…"
+    return text
+
+
+# RSS and Atom element names (namespace stripped) kept from each feed item, by field
+FEED_FIELDS = {
+    "title": ("title",),
+    "link": ("link",),
+    "description": ("description", "summary", "content", "encoded"),
+    "published": ("pubDate", "published", "updated", "date"),
+    "guid": ("guid", "id"),
+}
+_FEED_FIELD_OF = {name: field for field, names in FEED_FIELDS.items() for name in names}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_feed_items(chunks: Iterable[bytes], limit: Optional[int] = None,
+                    since_ts: Optional[int] = None) -> Iterator[Dict[str, str]]:
+    """Yield the items of an RSS or Atom feed as flat dicts while its body is still arriving.
+
+    Chunks go to an incremental parser; each ``<item>`` or ``<entry>`` is
+    reduced to the FEED_FIELDS it carries (first element wins) and then
+    dropped from the tree, so memory stays flat however long the feed is.
+    Reading stops after ``limit`` items, or at the first item published
+    before ``since_ts`` since feeds list newest first; the rest of the body
+    is never read.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    parents = []
+    yielded = 0
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                parents.append(elem)
+                continue
+            parents.pop()
+            if _local_name(elem.tag) not in ("item", "entry"):
+                continue
+            item = {}
+            for child in elem:
+                field = _FEED_FIELD_OF.get(_local_name(child.tag))
+                if field is None or field in item:
+                    continue
+                if field == "link" and child.get("href") is not None:
+                    # Atom links carry the URL in href; skip enclosures, self links and the like
+                    if child.get("rel", "alternate") == "alternate":
+                        item["link"] = child.get("href")
+                    continue
+                item[field] = "".join(child.itertext()).strip()
+            if parents:
+                parents[-1].remove(elem)
+            elem.clear()
+            if since_ts is not None:
+                published_ts = parse_timestamp(item.get("published"))
+                if published_ts is not None and published_ts < since_ts:
+                    return
+            yield item
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+
+
+class DetailCache:
+    """Job details on disk, one file per posting, valid while the posting's ``updated_at`` is unchanged"""
+
+    def __init__(self, directory: str = ".scraper_cache/details"):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, source: str, job_id) -> str:
+        return os.path.join(self.directory, f"{source}-{re.sub(r'[^A-Za-z0-9_-]', '_', str(job_id))}.json")
+
+    def get(self, source: str, job_id, updated_at) -> Optional[Dict]:
+        try:
+            with open(self._path(source, job_id), "rb") as f:
+                entry = json_loads(f.read())
+        except (OSError, ValueError):
+            entry = None
+        hit = entry is not None and entry.get("updated_at") == updated_at
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry["detail"] if hit else None
+
+    def put(self, source: str, job_id, updated_at, detail: Dict):
+        path = self._path(source, job_id)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json_dumps({"updated_at": updated_at, "detail": detail}))
+        os.replace(tmp_path, path)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a token is available and take it; returns the seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.waited_seconds += waited
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self, factor: float, floor: float, pause: float = 0.0):
+        """Cut the rate multiplicatively and, for Retry-After, drain the bucket for ``pause`` seconds"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(floor, self.rate * factor)
+            if pause:
+                self.tokens = min(self.tokens, -pause * self.rate)
+
+    def reward(self, step: float, ceiling: float):
+        """Raise the rate additively, never past the configured ceiling"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(ceiling, self.rate + step)
+
+
+class HostRateLimiter:
+    """One adaptive token bucket per host (AIMD).
+
+    A 429 or 503 halves the host's rate, down to ``min_rate``; every other
+    response adds back a twentieth of the configured rate until the ceiling
+    is reached again. Each bucket holds up to ``burst`` tokens, or the host's
+    entry in ``host_bursts``. Time spent waiting for tokens is counted per host.
+    """
+
+    THROTTLE_STATUSES = {429, 503}
+
+    def __init__(self, default_rate: float = 10.0, host_rates: Optional[Dict[str, float]] = None,
+                 burst: float = 5, min_rate: float = 0.1, backoff_factor: float = 0.5,
+                 host_bursts: Optional[Dict[str, float]] = None):
+        self.default_rate = default_rate
+        self.host_rates = dict(host_rates or {})
+        self.burst = burst
+        self.host_bursts = dict(host_bursts or {})
+        self.min_rate = min_rate
+        self.backoff_factor = backoff_factor
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.throttled_seconds = Counter()
+        self.throttled_requests = Counter()
+        self.backoffs = Counter()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.ceiling(host), self.host_bursts.get(host, self.burst))
+            return self._buckets[host]
+
+    def ceiling(self, host: str) -> float:
+        return self.host_rates.get(host, self.default_rate)
+
+    def acquire(self, host: str) -> float:
+        """Wait for the host's next token; returns the seconds spent throttled"""
+        waited = self._bucket(host).acquire()
+        if waited:
+            with self._lock:
+                self.throttled_seconds[host] += waited
+                self.throttled_requests[host] += 1
+        return waited
+
+    def observe(self, host: str, status: int, retry_after: Optional[float] = None):
+        """Adapt the host's rate to a response status"""
+        bucket = self._bucket(host)
+        if status in self.THROTTLE_STATUSES:
+            bucket.penalize(self.backoff_factor, self.min_rate, retry_after or 0.0)
+            with self._lock:
+                self.backoffs[host] += 1
+        elif bucket.rate < self.ceiling(host):
+            bucket.reward(self.ceiling(host) / 20, self.ceiling(host))
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-host current rate, ceiling, backoffs and throttled time"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            host: {
+                "rate": round(bucket.rate, 3),
+                "ceiling": self.ceiling(host),
+                "backoffs": self.backoffs[host],
+                "throttled_requests": self.throttled_requests[host],
+                "throttled_seconds": round(self.throttled_seconds[host], 3),
+            }
+            for host, bucket in sorted(buckets.items())
+        }
+
+
+class FetchEngine:
+    """Bounded thread pool that runs fetch tasks under global and per-host limits"""
+
+    def __init__(self, max_workers: int = 16, per_host_limit: int = 8,
+                 host_limits: Optional[Dict[str, int]] = None):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.host_limits = dict(host_limits or {})
+        self._global_slots = threading.BoundedSemaphore(max_workers)
+        self._host_slots = {}
+        self._lock = threading.Lock()
+        self.task_seconds = 0.0  # Sum of task durations, i.e. the serial-equivalent time
+        self.tasks_run = 0
+
+    def _slots_for(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                limit = self.host_limits.get(host, self.per_host_limit)
+                self._host_slots[host] = threading.BoundedSemaphore(max(1, limit))
+            return self._host_slots[host]
+
+    def run(self, func: Callable[..., Any], *args, host: str = "", **kwargs) -> Any:
+        """Run a single fetch task once a global and a per-host slot are free"""
+        with self._global_slots, self._slots_for(host):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self.task_seconds += elapsed
+                    self.tasks_run += 1
+
+    def imap(self, func: Callable[..., Any], items: Iterable[Any], host: str = "") -> Iterator[Any]:
+        """Yield func(item) results in input order as they finish.
+
+        At most twice ``max_workers`` tasks are submitted ahead of the consumer,
+        so large results are handed on and released instead of piling up.
+        """
+        items = iter(items)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = deque(pool.submit(self.run, func, item, host=host)
+                            for item in itertools.islice(items, self.max_workers * 2))
+            while pending:
+                result = pending.popleft().result()
+                for item in itertools.islice(items, 1):
+                    pending.append(pool.submit(self.run, func, item, host=host))
+                yield result
+
+    def map(self, func: Callable[..., Any], items: Iterable[Any], host: str = "") -> List[Any]:
+        """Run func over items concurrently, returning results in input order"""
+        return list(self.imap(func, items, host=host))
+
+    def interleave(self, streams: List[Callable[[], Iterable[Any]]], buffer_size: int = 256) -> Iterator[tuple]:
+        """Drain several generators side by side, yielding (stream index, item) as items arrive.
+
+        Each stream runs in its own thread behind a bounded queue, so producers
+        never run far ahead of the consumer. Stream threads only coordinate
+        their own fetch tasks and do not take a slot from the global limit.
+        """
+        if not streams:
+            return
+        items = queue.Queue(maxsize=buffer_size)
+        stop = threading.Event()
+        done = object()
+        
+        def put(entry) -> bool:
+            while not stop.is_set():
+                try:
+                    items.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def drain(index: int, stream: Callable[[], Iterable[Any]]):
+            try:
+                for item in stream():
+                    if not put((index, item)):
+                        return
+            except Exception as e:
+                print(f"⚠️  Stream {index} failed: {e}")
+            finally:
+                put((index, done))
+        
+        for index, stream in enumerate(streams):
+            threading.Thread(target=drain, args=(index, stream), daemon=True).start()
+        remaining = len(streams)
+        try:
+            while remaining:
+                index, item = items.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield index, item
+        finally:
+            stop.set()
+
+
+class ResponseCache:
+    """On-disk store of response bodies and validators for conditional GETs.
+
+    Bodies live in one file per URL and the validators in ``index.json``.
+    When the stored bodies exceed ``max_bytes`` the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, directory: str = ".scraper_cache/http", max_bytes: int = 200 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.bytes_saved = 0
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, "index.json")
+        try:
+            with open(self._index_path) as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    @staticmethod
+    def key_for(url: str, params: Optional[Dict] = None) -> str:
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        return hashlib.sha1(full_url.encode()).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.body")
+
+    def validators(self, key: str) -> Dict[str, str]:
+        """Conditional request headers for a cached URL, or {} if it isn't cached"""
+        with self._lock:
+            entry = self.index.get(key)
+        if not entry or not os.path.exists(self._body_path(key)):
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def replay(self, key: str, not_modified: requests.Response) -> requests.Response:
+        """Turn a 304 into a 200 response carrying the cached body"""
+        with open(self._body_path(key), "rb") as f:
+            body = f.read()
+        with self._lock:
+            entry = self.index[key]
+            entry["last_used"] = time.time()
+            self.hits += 1
+            self.bytes_saved += len(body)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response._content_consumed = True
+        response.headers = CaseInsensitiveDict(not_modified.headers)
+        response.headers["Content-Type"] = entry.get("content_type", "application/json")
+        response.encoding = entry.get("encoding")
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.from_cache = True
+        return response
+
+    def store(self, key: str, url: str, response: requests.Response):
+        """Remember a 200 response if the server gave us validators for it"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self.discard(key)
+            return
+        body = response.content
+        tmp_path = f"{self._body_path(key)}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        self._commit(key, url, response, tmp_path, len(body))
+
+    def store_stream(self, key: str, url: str, response: requests.Response,
+                     chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yield a streamed 200 body chunk by chunk, remembering it once it has all been read.
+
+        If the caller closes the iterator early, the unread rest is spooled
+        straight to disk rather than parsed, so the next run can still get a
+        304 for the whole body.
+        """
+        if not response.headers.get("ETag") and not response.headers.get("Last-Modified"):
+            self.discard(key)
+            yield from response.iter_content(chunk_size)
+            return
+        tmp_path = f"{self._body_path(key)}.{threading.get_ident()}.tmp"
+        size = 0
+        stored = False
+        try:
+            with open(tmp_path, "wb") as f:
+                chunks = response.iter_content(chunk_size)
+                try:
+                    for chunk in chunks:
+                        f.write(chunk)
+                        size += len(chunk)
+                        yield chunk
+                except GeneratorExit:
+                    try:
+                        for chunk in chunks:
+                            f.write(chunk)
+                            size += len(chunk)
+                    except requests.RequestException:
+                        return
+            self._commit(key, url, response, tmp_path, size)
+            stored = True
+        finally:
+            if not stored:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _commit(self, key: str, url: str, response: requests.Response, tmp_path: str, size: int):
+        """Move a fully written body into place and index it with the response's validators"""
+        os.replace(tmp_path, self._body_path(key))
+        with self._lock:
+            self.index[key] = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content_type": response.headers.get("Content-Type", ""),
+                "encoding": response.encoding,
+                "size": size,
+                "last_used": time.time(),
+            }
+            self._evict()
+
+    def discard(self, key: str):
+        with self._lock:
+            if self.index.pop(key, None) is not None:
+                self._remove_body(key)
+
+    def _remove_body(self, key: str):
+        try:
+            os.remove(self._body_path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes (lock held)"""
+        total = sum(entry["size"] for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1]["last_used"]):
+            del self.index[key]
+            self._remove_body(key)
+            total -= entry["size"]
+            if total <= self.max_bytes:
+                break
+
+    def save(self):
+        """Persist the index so validators survive between runs"""
+        with self._lock:
+            tmp_path = f"{self._index_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self._index_path)
+
+
+class RunMetrics:
+    """Per-run instrumentation: requests, bytes, statuses, parse time and jobs per source and company.
+
+    Fetch code calls ``scope(source, company)`` before its requests; the
+    transport then attributes every attempt to that scope for the calling
+    thread. Stage times come from ``stage`` blocks and from ``timed``
+    wrappers around the streaming pipeline, whose time excludes upstream stages.
+    """
+
+    LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = datetime.now(timezone.utc)
+            self.finished_at = None
+            self.sources = {}
+            self.companies = {}
+            self.stages = Counter()
+            self._streams = {}  # stage -> (inclusive seconds, upstream stage)
+            self.totals = {}
+
+    def reset_source(self, source: str):
+        """Drop one source's stats before a daemon cycle refetches it; the other sources' are kept.
+
+        The daemon refreshes sources on their own schedules, so each source's
+        figures describe its latest cycle.
+        """
+        def owned(name: str) -> bool:
+            return name == source or name.startswith(f"{source} ")  # e.g. "Greenhouse details"
+        
+        with self._lock:
+            self.sources = {name: stats for name, stats in self.sources.items() if not owned(name)}
+            self.companies = {key: stats for key, stats in self.companies.items() if not owned(key[0])}
+
+    def begin_cycle(self, started_at: datetime, fetch_seconds: float):
+        """Point the run-level start time, stages and totals at one daemon cycle, replacing the last one's"""
+        with self._lock:
+            self.started_at = started_at
+            self.finished_at = None
+            self.stages = Counter(fetch=fetch_seconds)
+            self._streams = {}
+            self.totals = {}
+
+    def finish(self):
+        """Stamp the end of the run (or daemon cycle) the report describes"""
+        with self._lock:
+            self.finished_at = datetime.now(timezone.utc)
+
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        return {"requests": 0, "retries": 0, "bytes": 0, "latency_sum": 0.0, "latency_max": 0.0,
+                "latency_buckets": [0] * len(RunMetrics.LATENCY_BUCKETS), "status_codes": Counter(),
+                "parse_seconds": 0.0, "jobs_seen": 0, "jobs_kept": 0}
+
+    def scope(self, source: str, company: str = ""):
+        """Attribute this thread's following requests and parses to a source and company"""
+        self._local.scope = (source, company)
+
+    def _targets(self) -> List[Dict[str, Any]]:
+        source, company = getattr(self._local, "scope", ("other", ""))
+        targets = [self.sources.setdefault(source, self._new_stats())]
+        if company:
+            targets.append(self.companies.setdefault((source, company), self._new_stats()))
+        return targets
+
+    def observe_request(self, status, seconds: float, nbytes: int = 0, retried: bool = False):
+        """Record one request attempt; ``status`` is an HTTP code, ``"timeout"`` or ``"error"``"""
+        with self._lock:
+            for stats in self._targets():
+                stats["requests"] += 1
+                stats["retries"] += int(retried)
+                stats["bytes"] += nbytes
+                stats["latency_sum"] += seconds
+                stats["latency_max"] = max(stats["latency_max"], seconds)
+                for i, bound in enumerate(self.LATENCY_BUCKETS):
+                    if seconds <= bound:
+                        stats["latency_buckets"][i] += 1
+                stats["status_codes"][str(status)] += 1
+
+    def observe_parse(self, seconds: float, seen: int, kept: int):
+        """Record parsing a response: time spent, postings read and postings kept"""
+        with self._lock:
+            for stats in self._targets():
+                stats["parse_seconds"] += seconds
+                stats["jobs_seen"] += seen
+                stats["jobs_kept"] += kept
+
+    @contextmanager
+    def stage(self, name: str, upstream: Optional[str] = None):
+        """Time a block; with ``upstream`` the time spent pulling from that timed stream is left out"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                if upstream:
+                    self._streams[name] = (elapsed, upstream)
+                else:
+                    self.stages[name] += elapsed
+
+    def timed(self, name: str, items: Iterable[Any], upstream: Optional[str] = None) -> Iterator[Any]:
+        """Pass items through, timing the stage that produces them.
+
+        The time spent waiting on ``upstream`` (itself wrapped with ``timed``)
+        is subtracted in the report, so each stage only counts its own work.
+        """
+        items = iter(items)
+        elapsed = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    elapsed += time.perf_counter() - started
+                    return
+                elapsed += time.perf_counter() - started
+                yield item
+        finally:
+            with self._lock:
+                self._streams[name] = (elapsed, upstream)
+
+    def status_summary(self, source: str) -> str:
+        """Non-2xx outcomes for a source, e.g. ``404 ×12, timeout ×3``"""
+        with self._lock:
+            codes = self.sources.get(source, {}).get("status_codes", {})
+            problems = [(status, count) for status, count in codes.items()
+                        if not status.startswith("2") and status != "304"]
+        return ", ".join(f"{status} ×{count}" for status, count in sorted(problems))
+
+    @staticmethod
+    def _export(stats: Dict[str, Any]) -> Dict[str, Any]:
+        requests_made = stats["requests"]
+        return {
+            "requests": requests_made,
+            "retries": stats["retries"],
+            "bytes": stats["bytes"],
+            "latency_seconds": {
+                "mean": round(stats["latency_sum"] / requests_made, 4) if requests_made else 0.0,
+                "max": round(stats["latency_max"], 4),
+                "sum": round(stats["latency_sum"], 4),
+            },
+            "status_codes": dict(sorted(stats["status_codes"].items())),
+            "parse_seconds": round(stats["parse_seconds"], 4),
+            "jobs_seen": stats["jobs_seen"],
+            "jobs_kept": stats["jobs_kept"],
+        }
+
+    def stage_seconds(self) -> Dict[str, float]:
+        """Own time of every stage, with streamed stages net of their upstream"""
+        with self._lock:
+            stages = dict(self.stages)
+            for name, (elapsed, upstream) in self._streams.items():
+                stages[name] = elapsed - self._streams.get(upstream, (0.0, None))[0]
+        return {name: round(max(0.0, seconds), 4) for name, seconds in stages.items()}
+
+    def report(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """The run report as a JSON-ready dict"""
+        finished_at = self.finished_at or datetime.now(timezone.utc)
+        with self._lock:
+            sources = {source: self._export(stats) for source, stats in sorted(self.sources.items())}
+            for (source, company), stats in sorted(self.companies.items()):
+                sources[source].setdefault("companies", {})[company] = self._export(stats)
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "duration_seconds": round((finished_at - self.started_at).total_seconds(), 3),
+            "stages": self.stage_seconds(),
+            "sources": sources,
+            "totals": dict(self.totals),
+            **(extra or {}),
+        }
+
+    def prometheus(self, extra_hosts: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+        """The run's metrics in the Prometheus text exposition format"""
+        def labels(**values) -> str:
+            # Label values escape backslashes and double quotes
+            escaped = (key + '="' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+                       for key, value in values.items())
+            return "{" + ",".join(escaped) + "}"
+        
+        lines = []
+        def metric(name: str, kind: str, help_text: str, samples: List[tuple]):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_labels, value, *suffix in samples:
+                lines.append(f"{name}{suffix[0] if suffix else ''}{sample_labels} {float(value)!r}")
+        
+        with self._lock:
+            sources = sorted(self.sources.items())
+            companies = sorted(self.companies.items())
+        metric("job_scraper_requests_total", "counter", "HTTP request attempts by source and status",
+               [(labels(source=source, status=status), count)
+                for source, stats in sources for status, count in sorted(stats["status_codes"].items())])
+        metric("job_scraper_retries_total", "counter", "Request attempts that were retries",
+               [(labels(source=source), stats["retries"]) for source, stats in sources])
+        metric("job_scraper_response_bytes_total", "counter", "Response body bytes received",
+               [(labels(source=source), stats["bytes"]) for source, stats in sources])
+        histogram = []
+        for source, stats in sources:
+            for bound, count in zip(self.LATENCY_BUCKETS, stats["latency_buckets"]):
+                histogram.append((labels(source=source, le=f"{bound:g}"), count, "_bucket"))
+            histogram.append((labels(source=source, le="+Inf"), stats["requests"], "_bucket"))
+            histogram.append((labels(source=source), stats["latency_sum"], "_sum"))
+            histogram.append((labels(source=source), stats["requests"], "_count"))
+        metric("job_scraper_request_duration_seconds", "histogram", "Request latency by source", histogram)
+        metric("job_scraper_parse_seconds_total", "counter", "Time spent parsing responses",
+               [(labels(source=source), stats["parse_seconds"]) for source, stats in sources])
+        metric("job_scraper_jobs_seen", "gauge", "Postings read from the source before filtering",
+               [(labels(source=source), stats["jobs_seen"]) for source, stats in sources])
+        metric("job_scraper_jobs_kept", "gauge", "Postings kept after keyword and recency filters",
+               [(labels(source=source), stats["jobs_kept"]) for source, stats in sources])
+        metric("job_scraper_company_jobs_kept", "gauge", "Postings kept per company board",
+               [(labels(source=source, company=company), stats["jobs_kept"])
+                for (source, company), stats in companies])
+        metric("job_scraper_company_request_failures", "gauge", "Failed request attempts per company board",
+               [(labels(source=source, company=company),
+                 sum(count for status, count in stats["status_codes"].items()
+                     if not status.startswith("2") and status != "304"))
+                for (source, company), stats in companies])
+        metric("job_scraper_stage_seconds", "gauge", "Time spent in each pipeline stage",
+               [(labels(stage=stage), seconds) for stage, seconds in sorted(self.stage_seconds().items())])
+        if extra_hosts:
+            metric("job_scraper_throttled_seconds_total", "counter", "Time requests waited for rate-limit tokens",
+                   [(labels(host=host), stats["throttled_seconds"]) for host, stats in sorted(extra_hosts.items())])
+        metric("job_scraper_total", "gauge", "Run totals such as jobs written and duplicates merged",
+               [(labels(name=name), value) for name, value in sorted(self.totals.items())
+                if isinstance(value, (int, float))])
+        finished_at = self.finished_at or datetime.now(timezone.utc)
+        metric("job_scraper_last_run_timestamp_seconds", "gauge", "When the last run finished",
+               [("", finished_at.timestamp())])
+        return "\n".join(lines) + "\n"
+
+
+class HttpTransport:
+    """Shared keep-alive session with bounded retries and jittered exponential backoff"""
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, pool_size: int = 16, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 cache: Optional[ResponseCache] = None,
+                 limiter: Optional[HostRateLimiter] = None,
+                 metrics: Optional[RunMetrics] = None):
+        self.cache = cache
+        self.limiter = limiter
+        self.metrics = metrics
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.session = requests.Session()
+        # One pool per host, each large enough for every worker to hold a live connection
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.retries = 0
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds to wait according to a Retry-After header, if the server sent one"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(self.backoff_max, max(0.0, seconds))
+
+    def get(self, url: str, cached: bool = False, **kwargs) -> requests.Response:
+        """GET a URL, revalidating against the response cache when cached=True"""
+        if not cached or self.cache is None:
+            return self._get_with_retries(url, **kwargs)
+        key = self.cache.key_for(url, kwargs.get("params"))
+        validators = self.cache.validators(key)
+        if validators:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+        response = self._get_with_retries(url, **kwargs)
+        if response.status_code == 304 and validators:
+            return self.cache.replay(key, response)
+        if response.status_code == 200 and not kwargs.get("stream"):
+            self.cache.store(key, url, response)
+        return response
+
+    def stream(self, url: str, cached: bool = False, chunk_size: int = 64 * 1024,
+               **kwargs) -> Tuple[requests.Response, Iterator[bytes]]:
+        """GET a URL without reading its body up front; returns the response and an iterator of body chunks.
+
+        With cached=True a 304 replays the stored body, and a fresh 200 body is
+        stored as it is read, once the caller has read it to the end.
+        """
+        response = self.get(url, cached=cached, stream=True, **kwargs)
+        if (cached and self.cache is not None and response.status_code == 200
+                and not getattr(response, "from_cache", False)):
+            key = self.cache.key_for(url, kwargs.get("params"))
+            return response, self.cache.store_stream(key, url, response, chunk_size)
+        return response, response.iter_content(chunk_size)
+
+    def _get_with_retries(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL, retrying connection errors, timeouts and retryable statuses"""
+        kwargs.setdefault("timeout", 10)
+        host = host_of(url)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire(host)
+            with self._lock:
+                self.requests_sent += 1
+                if attempt:
+                    self.retries += 1
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if self.metrics is not None:
+                    self.metrics.observe_request("timeout" if isinstance(e, requests.Timeout) else "error",
+                                                 time.perf_counter() - started, retried=bool(attempt))
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if self.metrics is not None:
+                    # A streamed body has not been read yet, so count what the server announced
+                    size = (int(response.headers.get("Content-Length") or 0) if kwargs.get("stream")
+                            else len(response.content))
+                    self.metrics.observe_request(response.status_code, time.perf_counter() - started,
+                                                 size, retried=bool(attempt))
+                retry_after = self._retry_after(response)
+                if self.limiter is not None:
+                    self.limiter.observe(host, response.status_code, retry_after)
+                if response.status_code not in self.RETRY_STATUSES:
+                    return response
+                if attempt == self.max_retries:
+                    print(f"⚠️  Giving up on {url} after {attempt + 1} attempts (HTTP {response.status_code})")
+                    return response
+                delay = retry_after
+                if delay is None:
+                    delay = self._backoff(attempt)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self):
+        self.session.close()
+
+
+# Board endpoints of each ATS, used to spot companies that moved away from the one we list them under
+ATS_PROBES = {
+    "Greenhouse": "https://boards-api.greenhouse.io/v1/boards/{slug}/jobs",
+    "Lever": "https://api.lever.co/v0/postings/{slug}",
+    "Ashby": "https://api.ashbyhq.com/posting-api/job-board/{slug}",
+}
+
+
+class SlugHealth:
+    """Persisted record of which ATS boards are dead, so runs stop wasting requests on them.
+
+    Each (source, slug) remembers its last outcome: ``ok``, ``not_found``
+    (404), ``empty`` (a board with no postings at all), ``timeout`` or
+    ``error``. Not-found and empty boards are skipped until their TTL runs
+    out; timeouts only after ``timeout_strikes`` in a row. Each TTL doubles
+    with every further failure (up to ``max_backoff`` times), and a small
+    share of skipped boards is rechecked early anyway.
+    """
+
+    DEFAULT_TTLS = {
+        "not_found": timedelta(days=7),
+        "empty": timedelta(days=3),
+        "timeout": timedelta(days=1),
+    }
+
+    def __init__(self, path: str = ".scraper_cache/slug_health.json",
+                 ttls: Optional[Dict[str, timedelta]] = None, recheck_rate: float = 0.05,
+                 timeout_strikes: int = 2, max_backoff: int = 8):
+        self.path = path
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.recheck_rate = recheck_rate
+        self.timeout_strikes = timeout_strikes
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self.skipped = Counter()
+        try:
+            with open(path) as f:
+                self.boards = json.load(f)
+        except (OSError, ValueError):
+            self.boards = {}
+
+    @staticmethod
+    def key(source: str, slug: str) -> str:
+        return f"{source}/{slug}"
+
+    def should_skip(self, source: str, slug: str) -> bool:
+        """True if the board is known dead and not yet due for a recheck"""
+        entry = self.boards.get(self.key(source, slug))
+        if not entry or entry["status"] not in self.ttls:
+            return False
+        if entry["status"] == "timeout" and entry["failures"] < self.timeout_strikes:
+            return False
+        backoff = min(self.max_backoff, 2 ** (entry["failures"] - 1))
+        expires = entry["checked"] + self.ttls[entry["status"]].total_seconds() * backoff
+        if time.time() >= expires or random.random() < self.recheck_rate:
+            return False
+        with self._lock:
+            self.skipped[source] += 1
+        return True
+
+    def record(self, source: str, slug: str, status: str):
+        """Store the outcome of fetching a board; failures in a row are counted"""
+        key = self.key(source, slug)
+        now = int(time.time())
+        with self._lock:
+            entry = self.boards.get(key)
+            if status == "ok":
+                self.boards[key] = {"status": "ok", "failures": 0, "checked": now, "since": now}
+            elif entry and entry["status"] == status:
+                entry["failures"] += 1
+                entry["checked"] = now
+            else:
+                self.boards[key] = {"status": status, "failures": 1, "checked": now, "since": now}
+
+    def dead(self) -> Dict[str, Dict]:
+        """Boards whose last check was a 404 or an empty board"""
+        with self._lock:
+            return {key: dict(entry) for key, entry in self.boards.items()
+                    if entry["status"] in ("not_found", "empty")}
+
+    def save(self):
+        """Persist the board outcomes so the next run can skip dead boards"""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.boards, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+class CallBudget:
+    """Persisted count of the calls made today to an API with a daily quota.
+
+    ``take`` spends one call and refuses once ``daily_limit`` calls were made
+    since midnight UTC. The count survives restarts, so one-shot runs and
+    daemon cycles on the same day share the quota.
+    """
+
+    def __init__(self, path: str, daily_limit: int):
+        self.path = path
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        self.day = state.get("day")
+        self.used = state.get("used", 0)
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(timezone.utc).date().isoformat()
+
+    def _roll(self):
+        if self.day != self.today():
+            self.day, self.used = self.today(), 0
+
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll()
+            return max(0, self.daily_limit - self.used)
+
+    def take(self) -> bool:
+        """Spend one call if any are left today"""
+        with self._lock:
+            self._roll()
+            if self.used >= self.daily_limit:
+                return False
+            self.used += 1
             return True
+
+    def save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"day": self.day, "used": self.used}, f)
+            os.replace(tmp_path, self.path)
+
+
+class JobAggregator:
+    def __init__(self, max_workers: int = 16, per_host_limit: int = 8,
+                 host_limits: Optional[Dict[str, int]] = None, max_retries: int = 3,
+                 cache_dir: Optional[str] = ".scraper_cache/http",
+                 cache_max_bytes: int = 200 * 1024 * 1024,
+                 rate_limits: Optional[Dict[str, float]] = None,
+                 slug_health_path: Optional[str] = ".scraper_cache/slug_health.json",
+                 db_path: str = "jobs.db",
+                 details_dir: Optional[str] = ".scraper_cache/details",
+                 adzuna_budget_path: Optional[str] = ".scraper_cache/adzuna_calls.json"):
+        self.jobs = []
+        self.db_path = db_path  # SQLite job store; the JSON files are exports of it
+        # Greenhouse lists carry no descriptions; matched jobs get theirs from the detail endpoint
+        self.details = DetailCache(details_dir) if details_dir else None
+        self.days_old_threshold = 60  # Only show jobs posted within last 60 days
+        self.keep_undated = True  # Keep jobs whose source gives no usable date
+        self._cutoff_ts = None
+        self.reference_time = None  # Epoch the recency cutoff counts back from; None means now
+        self.matcher = KeywordMatcher(KEYWORD_WEIGHTS)
+        self.last_sample = []  # First few jobs of the last saved file, for the CLI summary
+        # How stale each source may get before an incremental run refetches it
+        self.refresh_intervals = {
+            "Greenhouse": timedelta(hours=6),
+            "Lever": timedelta(hours=6),
+            "CryptoJobsList": timedelta(hours=1),
+            "RemoteOK": timedelta(hours=1),
+            "Adzuna": timedelta(hours=12),
+        }
+        self.adzuna_countries = list(ADZUNA_COUNTRIES)
+        self.adzuna_results_per_page = 50  # Adzuna's maximum page size
+        self.adzuna_max_pages = 5  # Per country and keyword; searches are newest first, so later pages are mostly stale
+        # Calls left today on the Adzuna key, shared by every run and daemon cycle
+        self.adzuna_budget = CallBudget(adzuna_budget_path, ADZUNA_DAILY_CALLS) if adzuna_budget_path else None
+        # Requests per second allowed for each source, keyed by source name
+        self.rate_limits = {**SOURCE_RATE_LIMITS, **(rate_limits or {})}
+        self.rate_limiter = HostRateLimiter(host_rates={
+            SOURCE_HOSTS[source]: rate for source, rate in self.rate_limits.items() if source in SOURCE_HOSTS
+        }, host_bursts={SOURCE_HOSTS[source]: burst for source, burst in SOURCE_BURSTS.items()})
+        # A slow quota gains nothing from parallel requests, so Adzuna holds few worker slots
+        host_limits = {SOURCE_HOSTS["Adzuna"]: 2, **(host_limits or {})}
+        self.engine = FetchEngine(max_workers, per_host_limit, host_limits)
+        cache = ResponseCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.metrics = RunMetrics()
+        self.http = HttpTransport(pool_size=max_workers, max_retries=max_retries, cache=cache,
+                                  limiter=self.rate_limiter, metrics=self.metrics)
+        self.slug_health = SlugHealth(slug_health_path) if slug_health_path else None
+        # Refresh units whose listing was read in full this run (or is known dead)
+        self.fetched_units = set()
+        self._fetched_lock = threading.Lock()
         
+    def cutoff_timestamp(self) -> int:
+        """UTC epoch before which jobs count as stale; fixed once per run"""
+        if self._cutoff_ts is None:
+            now = self.reference_time if self.reference_time is not None else time.time()
+            self._cutoff_ts = int(now) - self.days_old_threshold * 86400
+        return self._cutoff_ts
+    
+    def is_recent_timestamp(self, posted_ts: Optional[int]) -> bool:
+        """Check a normalized timestamp against the cutoff; undated jobs follow keep_undated"""
+        if posted_ts is None:
+            return self.keep_undated
+        return posted_ts >= self.cutoff_timestamp()
+    
+    def is_job_recent(self, posted_date) -> bool:
+        """Check if job was posted within the threshold"""
+        return self.is_recent_timestamp(parse_timestamp(posted_date))
+        
+    def live_boards(self, source: str, companies: Dict[str, tuple]) -> Dict[str, tuple]:
+        """Drop boards the slug-health cache knows to be dead"""
+        if self.slug_health is None:
+            return companies
+        live = {}
+        for slug, company in companies.items():
+            if self.slug_health.should_skip(source, slug):
+                self.mark_fetched(f"{source}/{slug}")  # Known dead, so its postings may go
+            else:
+                live[slug] = company
+        return live
+    
+    def mark_fetched(self, unit: str):
+        """Record that a refresh unit's listing was read in full, so its missing postings can be retired"""
+        with self._fetched_lock:
+            self.fetched_units.add(unit)
+    
+    def fetched(self, units: Iterable[str]) -> List[str]:
+        """The given refresh units that were fetched successfully this run"""
+        with self._fetched_lock:
+            return [unit for unit in units if unit in self.fetched_units]
+    
+    def record_board(self, source: str, slug: str, status_code: Optional[int], postings: int = 0):
+        """Feed a board fetch outcome and its posting count to the slug-health cache.
+
+        A None status means the request timed out.
+        """
+        if self.slug_health is None:
+            return
+        if status_code is None:
+            status = "timeout"
+        elif status_code == 404:
+            status = "not_found"
+        elif status_code != 200:
+            status = "error"
+        else:
+            status = "ok" if postings else "empty"
+        self.slug_health.record(source, slug, status)
+    
+    def moved_boards(self, probe: bool = True) -> List[Dict]:
+        """Dead boards that have live postings on another ATS under the same slug.
+
+        Boards we also list under another source are checked against the
+        slug-health cache; with ``probe`` the remaining ATS endpoints are
+        queried directly.
+        """
+        if self.slug_health is None:
+            return []
+        
+        def check(item) -> Optional[Dict]:
+            key, entry = item
+            source, slug = key.split("/", 1)
+            found_on = []
+            for ats, template in ATS_PROBES.items():
+                if ats == source:
+                    continue
+                known = self.slug_health.boards.get(SlugHealth.key(ats, slug))
+                if known and known["status"] == "ok":
+                    found_on.append(ats)
+                    continue
+                if not probe:
+                    continue
+                try:
+                    response = self.http.get(template.format(slug=slug), timeout=10)
+                    if response.status_code != 200:
+                        continue
+                    data = json_loads(response.content)
+                    if data if isinstance(data, list) else data.get("jobs"):
+                        found_on.append(ats)
+                except Exception:
+                    continue
+            if not found_on:
+                return None
+            company = BOARD_SOURCES.get(source, {}).get(slug, (slug, ""))[0]
+            return {"source": source, "slug": slug, "company": company, "status": entry["status"],
+                    "dead_since": datetime.fromtimestamp(entry["since"], timezone.utc).isoformat(),
+                    "found_on": found_on}
+        
+        return [moved for moved in self.engine.imap(check, self.slug_health.dead().items()) if moved]
+    
+    def print_slug_report(self, probe: bool = True):
+        """Summarise dead boards and the ones that appear to have changed ATS"""
+        if self.slug_health is None:
+            print("ℹ️  Slug health tracking is disabled")
+            return
+        dead = self.slug_health.dead()
+        print(f"🪦 {len(dead)} boards are dead or empty")
+        for key, entry in sorted(dead.items()):
+            print(f"   {key}: {entry['status']} (failed {entry['failures']} checks in a row)")
+        moved = self.moved_boards(probe=probe)
+        if moved:
+            print(f"\n🚚 {len(moved)} boards look like they moved to a different ATS:")
+            for board in moved:
+                print(f"   {board['source']}/{board['slug']} ({board['company']}) -> {', '.join(board['found_on'])}")
+        else:
+            print("\n🚚 No dead board was found on another ATS")
+    
     def fetch_adzuna_jobs(self, api_id: str = None, api_key: str = None) -> List[Dict]:
-        """Fetch jobs from Adzuna API (UK & US job boards)"""
+        """Fetch jobs from Adzuna API across the configured country endpoints"""
+        return list(self.iter_adzuna_jobs(api_id, api_key))
+    
+    def iter_adzuna_jobs(self, api_id: str = None, api_key: str = None) -> Iterator[Dict]:
+        """Yield Adzuna jobs as pages arrive, paging every country/keyword search concurrently.
+
+        Results are requested newest first, so a search stops at the first page
+        whose jobs are all older than ``days_old_threshold``. The rate limiter's
+        Adzuna bucket keeps requests within the per-minute quota, and
+        ``adzuna_budget`` ends the searches once the day's calls are used up.
+        """
         if not api_id or not api_key:
             print("ℹ️  Adzuna API credentials not provided. Visit https://developer.adzuna.com/")
-            return []
-            
-        jobs = []
-        keywords = ["trust and safety", "content moderation", "fraud prevention", "threat intelligence"]
+            return
         
-        for keyword in keywords:
-            try:
-                url = f"https://api.adzuna.com/v1/api/jobs/us/search/1"
-                params = {
-                    "app_id": api_id,
-                    "app_key": api_key,
-                    "what": keyword,
-                    "results_per_page": 20,
-                    "content-type": "application/json"
-                }
-                
-                response = requests.get(url, params=params, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    for result in data.get("results", []):
-                        company_name = result.get("company", {}).get("display_name", "Unknown")
-                        jobs.append({
-                            "company": company_name,
-                            "company_url": f"https://www.google.com/search?q={company_name.replace(' ', '+')}",  # Generic search link
-                            "title": result.get("title", ""),
-                            "location": result.get("location", {}).get("display_name", "Unknown"),
-                            "description": result.get("description", "")[:200] + "...",
-                            "url": result.get("redirect_url", ""),
-                            "salary": result.get("salary_min", "Not specified"),
-                            "posted_date": result.get("created", "Unknown"),
-                            "source": "Adzuna"
-                        })
-            except Exception as e:
-                print(f"⚠️  Error fetching from Adzuna for '{keyword}': {e}")
-                
-        return jobs
-    
-    def fetch_greenhouse_jobs(self) -> List[Dict]:
-        """Fetch jobs from companies using Greenhouse ATS"""
-        jobs = []
-        companies = {
-            # Major Tech
-            "figma": ("Figma", "https://www.figma.com"),
-            "canva": ("Canva", "https://www.canva.com"), 
-            "grammarly": ("Grammarly", "https://www.grammarly.com"),
-            "airtable": ("Airtable", "https://www.airtable.com"),
-            "databricks": ("Databricks", "https://www.databricks.com"),
-            "cloudflare": ("Cloudflare", "https://www.cloudflare.com"),
-            "doordash": ("DoorDash", "https://www.doordash.com"),
-            "github": ("GitHub", "https://github.com"),
-            "gitlab": ("GitLab", "https://about.gitlab.com"),
-            "stripe": ("Stripe", "https://stripe.com"),
-            "square": ("Square", "https://squareup.com"),
-            "dropbox": ("Dropbox", "https://www.dropbox.com"),
-            "atlassian": ("Atlassian", "https://www.atlassian.com"),
-            "snap": ("Snap Inc", "https://www.snap.com"),
-            "uber": ("Uber", "https://www.uber.com"),
-            "lyft": ("Lyft", "https://www.lyft.com"),
-            "airbnb": ("Airbnb", "https://www.airbnb.com"),
-            "twitch": ("Twitch", "https://www.twitch.tv"),
-            "reddit": ("Reddit", "https://www.reddit.com"),
-            "discord": ("Discord", "https://discord.com"),
-            "roblox": ("Roblox", "https://corp.roblox.com"),
-            "spotify": ("Spotify", "https://www.spotify.com"),
-            "netflix": ("Netflix", "https://www.netflix.com"),
-            "patreon": ("Patreon", "https://www.patreon.com"),
-            "pinterest": ("Pinterest", "https://www.pinterest.com"),
-            "medium": ("Medium", "https://medium.com"),
-            "tumblr": ("Tumblr", "https://www.tumblr.com"),
-            "vimeo": ("Vimeo", "https://vimeo.com"),
-            "soundcloud": ("SoundCloud", "https://soundcloud.com"),
-            
-            # Web3/Crypto
-            "immunefi": ("Immunefi", "https://immunefi.com"),
-            "chainalysis": ("Chainalysis", "https://www.chainalysis.com"),
-            "consensys": ("ConsenSys", "https://consensys.net"),
-            "alchemy": ("Alchemy", "https://www.alchemy.com"),
-            "coinbase": ("Coinbase", "https://www.coinbase.com"),
-            "circle": ("Circle", "https://www.circle.com"),
-            "gemini": ("Gemini", "https://www.gemini.com"),
-            "opensea": ("OpenSea", "https://opensea.io"),
-            "uniswap": ("Uniswap Labs", "https://uniswap.org"),
-            "luno": ("Luno", "https://www.luno.com"),
-            "kraken": ("Kraken", "https://www.kraken.com"),
-            "binance": ("Binance", "https://www.binance.com"),
-            "blockdaemon": ("Blockdaemon", "https://blockdaemon.com"),
-            "infura": ("Infura", "https://infura.io"),
-            "anchorage": ("Anchorage Digital", "https://www.anchorage.com"),
-            "fireblocks": ("Fireblocks", "https://www.fireblocks.com"),
-            "messari": ("Messari", "https://messari.io"),
-            "aave": ("Aave", "https://aave.com"),
-            "sushiswap": ("SushiSwap", "https://www.sushi.com"),
-            "thegraph": ("The Graph", "https://thegraph.com"),
-            "pythereum": ("Pyth Network", "https://pyth.network"),
-            "lido": ("Lido", "https://lido.fi"),
-            "rarible": ("Rarible", "https://rarible.com"),
-            "magiceden": ("Magic Eden", "https://magiceden.io"),
-            "looksrare": ("LooksRare", "https://looksrare.org"),
-            "moonbeam": ("Moonbeam", "https://moonbeam.network"),
-            "render": ("Render", "https://render.com"),
-            "farcaster": ("Farcaster", "https://www.farcaster.xyz"),
-            "lensprotocol": ("Lens Protocol", "https://www.lens.xyz"),
-            "optimism": ("Optimism", "https://optimism.io"),
-            "arbitrum": ("Arbitrum", "https://arbitrum.io"),
-            "polygon": ("Polygon", "https://polygon.technology"),
-            "solana": ("Solana Labs", "https://solana.com"),
-            "avalabs": ("Avalabs", "https://www.avalabs.org"),
-            "near": ("Near Protocol", "https://near.org"),
-            "sideshift": ("SideShift.ai", "https://sideshift.ai"),
-            "changelly": ("Changelly", "https://changelly.com"),
-            "shapeshift": ("ShapeShift", "https://shapeshift.com"),
-            "thorchain": ("Thorchain", "https://thorchain.org"),
-            "0x": ("0x", "https://0x.org"),
-            "paraswap": ("Paraswap", "https://paraswap.io"),
-            "kybernetwork": ("Kyber Network", "https://kyber.network"),
-            "lifi": ("Li.Fi", "https://li.fi"),
-            "dydx": ("dYdX", "https://dydx.exchange"),
-            "compound": ("Compound", "https://compound.finance"),
-            "makerdao": ("MakerDAO", "https://makerdao.com"),
-            "curve": ("Curve Finance", "https://curve.fi"),
-            "balancer": ("Balancer", "https://balancer.fi"),
-            "1inch": ("1inch", "https://1inch.io"),
-            "metamask": ("MetaMask", "https://metamask.io"),
-            "rainbow": ("Rainbow", "https://rainbow.me"),
-            "phantom": ("Phantom", "https://phantom.app"),
-            "ledger": ("Ledger", "https://www.ledger.com"),
-            "trezor": ("Trezor", "https://trezor.io"),
-            "safe": ("Safe", "https://safe.global"),
-            "zksync": ("zkSync", "https://zksync.io"),
-            "starkware": ("StarkWare", "https://starkware.co"),
-            "matter-labs": ("Matter Labs", "https://matter-labs.io"),
-            "scroll": ("Scroll", "https://scroll.io"),
-            "base": ("Base", "https://base.org"),
-            "mantle": ("Mantle", "https://www.mantle.xyz"),
-            "linea": ("Linea", "https://linea.build"),
-            
-            # Blockchain Security & Auditing
-            "code4rena": ("Code4rena", "https://code4rena.com"),
-            "sherlock": ("Sherlock", "https://www.sherlock.xyz"),
-            "openzeppelin": ("OpenZeppelin", "https://www.openzeppelin.com"),
-            "certik": ("CertiK", "https://www.certik.com"),
-            "halborn": ("Halborn", "https://halborn.com"),
-            "trailofbits": ("Trail of Bits", "https://www.trailofbits.com"),
-            
-            # Blockchain Analytics & Compliance
-            "trmlabs": ("TRM Labs", "https://www.trmlabs.com"),
-            "elliptic": ("Elliptic", "https://www.elliptic.co"),
-            "crystalblockchain": ("Crystal Blockchain", "https://crystalblockchain.com"),
-            "merklescience": ("Merkle Science", "https://www.merklescience.com"),
-            
-            # AI Startups
-            "anthropic": ("Anthropic", "https://www.anthropic.com"),
-            "openai": ("OpenAI", "https://www.openai.com"),
-            "scale": ("Scale AI", "https://scale.com"),
-            "huggingface": ("Hugging Face", "https://huggingface.co"),
-            "cohere": ("Cohere", "https://cohere.com"),
-            "adept": ("Adept", "https://www.adept.ai"),
-            "inflection": ("Inflection AI", "https://inflection.ai"),
-            "character": ("Character.AI", "https://character.ai"),
-            "midjourney": ("Midjourney", "https://www.midjourney.com"),
-            "runway": ("Runway", "https://runwayml.com"),
-            "jasper": ("Jasper", "https://www.jasper.ai"),
-            "replicate": ("Replicate", "https://replicate.com"),
-            "together": ("Together AI", "https://www.together.ai"),
-            "mosaic": ("MosaicML", "https://www.mosaicml.com"),
-            "ai21": ("AI21 Labs", "https://www.ai21.com"),
-            "perplexity": ("Perplexity AI", "https://www.perplexity.ai"),
-            "stability": ("Stability AI", "https://stability.ai"),
-            "cresta": ("Cresta", "https://cresta.com"),
-            "synthesia": ("Synthesia", "https://www.synthesia.io"),
-            "elevenlabs": ("ElevenLabs", "https://elevenlabs.io"),
-            "replit": ("Replit", "https://replit.com"),
-            "mem": ("Mem", "https://get.mem.ai"),
-            "glean": ("Glean", "https://www.glean.com"),
-            "harvey": ("Harvey", "https://www.harvey.ai"),
-            "typeface": ("Typeface", "https://www.typeface.ai"),
-            "aleph-alpha": ("Aleph Alpha", "https://www.aleph-alpha.com"),
-            "lightricks": ("Lightricks", "https://www.lightricks.com"),
-            "writer": ("Writer", "https://writer.com"),
-            "reka": ("Reka AI", "https://reka.ai"),
-            "mistral": ("Mistral AI", "https://mistral.ai"),
-            "poolside": ("Poolside", "https://poolside.ai"),
-            "magic": ("Magic", "https://magic.dev"),
-            
-            # Security/Bug Bounty/Cybersecurity
-            "okta": ("Okta", "https://www.okta.com"),
-            "auth0": ("Auth0", "https://auth0.com"),
-            "crowdstrike": ("CrowdStrike", "https://www.crowdstrike.com"),
-            "datadog": ("Datadog", "https://www.datadoghq.com"),
-            "elastic": ("Elastic", "https://www.elastic.co"),
-            "splunk": ("Splunk", "https://www.splunk.com"),
-            "hackerone": ("HackerOne", "https://www.hackerone.com"),
-            "bugcrowd": ("Bugcrowd", "https://www.bugcrowd.com"),
-            "synack": ("Synack", "https://www.synack.com"),
-            "cobalt": ("Cobalt", "https://cobalt.io"),
-            "safebreach": ("SafeBreach", "https://safebreach.com"),
-            "paloaltonetworks": ("Palo Alto Networks", "https://www.paloaltonetworks.com"),
-            "sentinelone": ("SentinelOne", "https://www.sentinelone.com"),
-            "trellix": ("Trellix", "https://www.trellix.com"),
-            "checkpoint": ("Check Point", "https://www.checkpoint.com"),
-            "sophos": ("Sophos", "https://www.sophos.com"),
-            "akamai": ("Akamai", "https://www.akamai.com"),
-            "cisco": ("Cisco Security", "https://www.cisco.com"),
-            "rapid7": ("Rapid7", "https://www.rapid7.com"),
-            "tenable": ("Tenable", "https://www.tenable.com"),
-            "arcticwolf": ("Arctic Wolf", "https://arcticwolf.com"),
-            
-            # E-commerce/Marketplaces
-            "shopify": ("Shopify", "https://www.shopify.com"),
-            "etsy": ("Etsy", "https://www.etsy.com"),
-            "instacart": ("Instacart", "https://www.instacart.com"),
-            "doordash": ("DoorDash", "https://www.doordash.com"),
-            
-            # Developer Tools
-            "vercel": ("Vercel", "https://vercel.com"),
-            "notion": ("Notion", "https://www.notion.so"),
-            "linear": ("Linear", "https://linear.app"),
-            "retool": ("Retool", "https://retool.com"),
-            "webflow": ("Webflow", "https://webflow.com"),
-            "miro": ("Miro", "https://miro.com"),
-            "docker": ("Docker", "https://www.docker.com"),
-            "hashicorp": ("HashiCorp", "https://www.hashicorp.com"),
-            "mongodb": ("MongoDB", "https://www.mongodb.com"),
-            "postman": ("Postman", "https://www.postman.com"),
-            "confluent": ("Confluent", "https://www.confluent.io"),
-            "snyk": ("Snyk", "https://snyk.io"),
-            "pagerduty": ("PagerDuty", "https://www.pagerduty.com"),
-            "new-relic": ("New Relic", "https://newrelic.com"),
-            "sentry": ("Sentry", "https://sentry.io"),
-            
-            # Social/Communication
-            "bumble": ("Bumble", "https://bumble.com"),
-            "hinge": ("Hinge", "https://hinge.co"),
-            "match": ("Match Group", "https://mtch.com"),
-            "zoom": ("Zoom", "https://zoom.us"),
-            "slack": ("Slack", "https://slack.com"),
-            
-            # Gaming
-            "riotgames": ("Riot Games", "https://www.riotgames.com"),
-            "unity": ("Unity Technologies", "https://unity.com"),
-            "epicgames": ("Epic Games", "https://www.epicgames.com"),
-            "ea": ("Electronic Arts", "https://www.ea.com"),
-            "activision": ("Activision Blizzard", "https://www.activisionblizzard.com"),
-            "blizzard": ("Blizzard Entertainment", "https://www.blizzard.com"),
-            "bungie": ("Bungie", "https://www.bungie.net"),
-            "supercell": ("Supercell", "https://supercell.com"),
-            "king": ("King", "https://king.com"),
-            "zynga": ("Zynga", "https://www.zynga.com")
-        }
+        per_page = self.adzuna_results_per_page
+        failed = []  # Searches that ended on an error; their postings must not be retired
         
-        keywords = ["trust", "safety", "security", "fraud", "risk", "moderation", "abuse", "compliance", "policy", "integrity", "operations", "support", "investigation"]
+        def to_job(result: Dict, country: str) -> Dict:
+            company_name = result.get("company", {}).get("display_name", "Unknown")
+            # The search query already selected these; score them for ranking only
+            relevance = self.matcher.score(result.get("title", ""), result.get("description", ""))
+            return {
+                "company": company_name,
+                "company_url": f"https://www.google.com/search?q={company_name.replace(' ', '+')}",  # Generic search link
+                "title": result.get("title", ""),
+                "location": result.get("location", {}).get("display_name", "Unknown"),
+                # Adzuna has no detail endpoint; its snippet is the most the API gives
+                "description": html_to_text(result.get("description", "")),
+                "url": result.get("redirect_url", ""),
+                "salary": result.get("salary_min", "Not specified"),
+                "posted_date": result.get("created", "Unknown"),
+                "source": "Adzuna",
+                "country": country.upper(),
+                "relevance": relevance
+            }
         
-        for company_slug, company_info in companies.items():
-            company_name, company_url = company_info
+        def search(country: str, keyword: str) -> Iterator[Dict]:
+            self.metrics.scope("Adzuna", country)
+            params = {
+                "app_id": api_id,
+                "app_key": api_key,
+                "what": keyword,
+                "results_per_page": per_page,
+                "sort_by": "date",
+                "max_days_old": self.days_old_threshold,
+                "content-type": "application/json"
+            }
+            for page in range(1, self.adzuna_max_pages + 1):
+                if self.adzuna_budget is not None and not self.adzuna_budget.take():
+                    failed.append((country, keyword))
+                    return
+                url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/{page}"
+                try:
+                    response = self.engine.run(self.http.get, url, params=params, timeout=10, host=host_of(url))
+                    if response.status_code != 200:
+                        print(f"⚠️  Adzuna {country} '{keyword}' page {page}: HTTP {response.status_code}")
+                        failed.append((country, keyword))
+                        return
+                    parse_started = time.perf_counter()
+                    data = json_loads(response.content)
+                except Exception as e:
+                    print(f"⚠️  Error fetching from Adzuna {country} for '{keyword}': {e}")
+                    failed.append((country, keyword))
+                    return
+                results = data.get("results", [])
+                fresh = [result for result in results
+                         if self.is_job_recent(result.get("created"))]
+                self.metrics.observe_parse(time.perf_counter() - parse_started, len(results), len(fresh))
+                for result in fresh:
+                    yield to_job(result, country)
+                # Newest-first ordering: a page with nothing recent means the rest are stale too
+                if not fresh or len(results) < per_page or page * per_page >= data.get("count", 0):
+                    return
+        
+        searches = [(country, keyword) for country in self.adzuna_countries for keyword in ADZUNA_KEYWORDS]
+        streams = [lambda country=country, keyword=keyword: search(country, keyword)
+                   for country, keyword in searches]
+        try:
+            for _, job in self.engine.interleave(streams):
+                yield job
+        finally:
+            if self.adzuna_budget is not None:
+                self.adzuna_budget.save()
+        if not failed:
+            self.mark_fetched("Adzuna")
+        elif self.adzuna_budget is not None and not self.adzuna_budget.remaining():
+            print(f"⚠️  Adzuna daily budget of {self.adzuna_budget.daily_limit} calls used up, "
+                  f"{len(failed)} searches cut short")
+    
+    def fetch_greenhouse_jobs(self, slugs: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Fetch jobs from companies using Greenhouse ATS (all boards, or only the given slugs)"""
+        return list(self.iter_greenhouse_jobs(slugs))
+    
+    def iter_greenhouse_jobs(self, slugs: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+        """Yield Greenhouse jobs board by board; each board's raw JSON is dropped once filtered"""
+        companies = self.live_boards("Greenhouse", select_companies(GREENHOUSE_COMPANIES, slugs))
+        
+        def fetch_company(item) -> List[Dict]:
+            company_slug, (company_name, company_url) = item
+            self.metrics.scope("Greenhouse", company_slug)
+            jobs = []
             try:
                 url = f"https://boards-api.greenhouse.io/v1/boards/{company_slug}/jobs"
-                response = requests.get(url, timeout=10)
+                response = self.http.get(url, cached=True, timeout=10)
+                parse_started = time.perf_counter()
+                seen = 0
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    for job in data.get("jobs", []):
-                        title = job.get("title", "").lower()
+                    # Postings are decoded one by one and dropped unless they match
+                    for job in iter_json_array(response.content, "jobs"):
+                        seen += 1
+                        relevance = self.matcher.score(job.get("title", ""))
                         posted_date = job.get("updated_at", "Unknown")
                         
                         # Filter by keywords and recency
-                        if any(keyword in title for keyword in keywords) and self.is_job_recent(posted_date):
+                        if self.matcher.relevant(relevance) and self.is_job_recent(posted_date):
                             jobs.append({
                                 "company": company_name,
                                 "company_url": company_url,
@@ -312,164 +2624,178 @@ class JobAggregator:
                                 "url": job.get("absolute_url", ""),
                                 "posted_date": posted_date,
                                 "source": "Greenhouse",
-                                "id": job.get("id", "")
+                                "id": job.get("id", ""),
+                                "relevance": relevance
                             })
+                self.record_board("Greenhouse", company_slug, response.status_code, seen)
+                if response.status_code in (200, 404):
+                    self.mark_fetched(f"Greenhouse/{company_slug}")
+                self.metrics.observe_parse(time.perf_counter() - parse_started, seen, len(jobs))
+            except requests.Timeout as e:
+                self.record_board("Greenhouse", company_slug, None)
+                print(f"⚠️  Timed out fetching from Greenhouse for {company_name}: {e}")
             except Exception as e:
                 print(f"⚠️  Error fetching from Greenhouse for {company_name}: {e}")
-                
-        return jobs
+            return jobs
+        
+        for company_jobs in self.engine.imap(fetch_company, companies.items(), host="boards-api.greenhouse.io"):
+            yield from company_jobs
     
     def fetch_cryptojobslist_jobs(self) -> List[Dict]:
         """Fetch jobs from CryptoJobsList RSS feed"""
-        jobs = []
-        keywords = ["trust", "safety", "security", "fraud", "risk", "moderation", "abuse", "compliance", "support"]
-        
+        return list(self.iter_cryptojobslist_jobs())
+    
+    def iter_cryptojobslist_jobs(self) -> Iterator[Dict]:
+        """Yield matching jobs from the CryptoJobsList RSS feed while it downloads"""
+        self.metrics.scope("CryptoJobsList")
         try:
             # Try the RSS feed first (more accessible than HTML scraping)
-            import xml.etree.ElementTree as ET
-            
             rss_url = "https://cryptojobslist.com/jobs.rss"
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(rss_url, headers=headers, timeout=15)
+            response, chunks = self.engine.run(self.http.stream, rss_url, host=host_of(rss_url),
+                                               cached=True, headers=headers, timeout=15)
             
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
+            with response, closing(chunks):
+                if response.status_code != 200:
+                    return
+                # Newest first: stop at the first 100 items or the first stale one
+                items = iter_feed_items(chunks, limit=100, since_ts=self.cutoff_timestamp())
+                parse_seconds, seen, kept = 0.0, 0, 0
+                started = time.perf_counter()
                 
-                for item in root.findall('.//item')[:100]:  # Limit to first 100
-                    try:
-                        title = item.find('title').text if item.find('title') is not None else ""
-                        
-                        # Check if title matches keywords
-                        if not any(keyword in title.lower() for keyword in keywords):
-                            continue
-                        
-                        # Extract job details
-                        link = item.find('link').text if item.find('link') is not None else ""
-                        description = item.find('description').text if item.find('description') is not None else ""
-                        pub_date = item.find('pubDate').text if item.find('pubDate') is not None else datetime.now().isoformat()
-                        
-                        # Try to extract company from title or description
-                        company = "Unknown"
-                        if " at " in title:
-                            company = title.split(" at ")[-1].strip()
-                        
-                        # Extract location from description if possible
-                        location = "Remote"
-                        if "location" in description.lower():
-                            # Simple extraction, can be improved
-                            location = "Remote / Flexible"
-                        
-                        jobs.append({
-                            "company": company,
-                            "company_url": f"https://www.google.com/search?q={company.replace(' ', '+')}",
-                            "title": title,
-                            "location": location,
-                            "url": link,
-                            "posted_date": pub_date,
-                            "source": "CryptoJobsList"
-                        })
-                    except Exception as e:
+                for item in items:
+                    seen += 1
+                    title = item.get("title", "")
+                    
+                    # Check if title matches keywords
+                    relevance = self.matcher.score(title)
+                    if not self.matcher.relevant(relevance):
                         continue
+                    
+                    description = item.get("description", "")
+                    
+                    # Try to extract company from title or description
+                    company = "Unknown"
+                    if " at " in title:
+                        company = title.split(" at ")[-1].strip()
+                    
+                    # Extract location from description if possible
+                    location = "Remote"
+                    if "location" in description.lower():
+                        # Simple extraction, can be improved
+                        location = "Remote / Flexible"
+                    
+                    kept += 1
+                    parse_seconds += time.perf_counter() - started
+                    yield {
+                        "company": company,
+                        "company_url": f"https://www.google.com/search?q={company.replace(' ', '+')}",
+                        "title": title,
+                        "location": location,
+                        "url": item.get("link", ""),
+                        "posted_date": item.get("published") or datetime.now().isoformat(),
+                        "source": "CryptoJobsList",
+                        "relevance": relevance,
+                        "description": html_to_text(description)
+                    }
+                    started = time.perf_counter()
+                parse_seconds += time.perf_counter() - started
+                self.metrics.observe_parse(parse_seconds, seen, kept)
+                self.mark_fetched("CryptoJobsList")
                         
         except Exception as e:
             print(f"⚠️  Error fetching from CryptoJobsList: {e}")
-        
-        return jobs
     
     def fetch_remoteok_jobs(self) -> List[Dict]:
         """Fetch jobs from RemoteOK API"""
-        jobs = []
-        keywords = ["trust", "safety", "security", "fraud", "risk", "moderation", "abuse", "compliance", "support"]
-        
+        return list(self.iter_remoteok_jobs())
+    
+    def iter_remoteok_jobs(self) -> Iterator[Dict]:
+        """Yield matching jobs from the RemoteOK API as they are read"""
+        self.metrics.scope("RemoteOK")
         try:
             url = "https://remoteok.com/api"
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = self.engine.run(self.http.get, url, host=host_of(url), cached=True, headers=headers, timeout=15)
             
             if response.status_code == 200:
-                data = response.json()
-                # First item is usually metadata, skip it
-                jobs_data = data[1:] if isinstance(data, list) and len(data) > 1 else data
+                # The first item is a legal notice rather than a job; skip it and stop after 200 jobs
+                items = (job for job in iter_json_array(response.content)
+                         if isinstance(job, dict) and "legal" not in job)
+                jobs_data = itertools.islice(items, 200)
+                parse_seconds, seen, kept = 0.0, 0, 0
+                started = time.perf_counter()
                 
-                for job in jobs_data[:200]:  # Limit to first 200
-                    if not isinstance(job, dict):
-                        continue
-                        
-                    title = job.get('position', '').lower()
-                    tags = ' '.join(job.get('tags', [])).lower() if job.get('tags') else ''
+                for job in jobs_data:
+                    seen += 1
+                    tags = ' '.join(job.get('tags', [])) if job.get('tags') else ''
                     
                     # Filter by keywords in title or tags
-                    if not any(keyword in title or keyword in tags for keyword in keywords):
+                    relevance = self.matcher.score(job.get('position', ''), tags)
+                    if not self.matcher.relevant(relevance):
                         continue
                     
                     # Extract date
                     posted_date = job.get('date', datetime.now().isoformat())
                     if isinstance(posted_date, (int, float)):
                         # Convert timestamp to ISO format
-                        posted_date = datetime.fromtimestamp(posted_date).isoformat()
+                        posted_date = datetime.fromtimestamp(posted_date, timezone.utc).isoformat()
                     
                     # Check if recent
                     if not self.is_job_recent(posted_date):
                         continue
                     
-                    jobs.append({
+                    kept += 1
+                    parse_seconds += time.perf_counter() - started
+                    yield {
                         "company": job.get('company', 'Unknown'),
                         "company_url": job.get('company_url', ''),
                         "title": job.get('position', ''),
                         "location": job.get('location', 'Remote'),
                         "url": job.get('url', f"https://remoteok.com/jobs/{job.get('id', '')}"),
                         "posted_date": posted_date,
-                        "source": "RemoteOK"
-                    })
+                        "source": "RemoteOK",
+                        "relevance": relevance,
+                        "description": html_to_text(job.get('description', ''))
+                    }
+                    started = time.perf_counter()
+                parse_seconds += time.perf_counter() - started
+                self.metrics.observe_parse(parse_seconds, seen, kept)
+                self.mark_fetched("RemoteOK")
         except Exception as e:
             print(f"⚠️  Error fetching from RemoteOK: {e}")
+    
+    def fetch_lever_jobs(self, slugs: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Fetch jobs from companies using Lever ATS (all boards, or only the given slugs)"""
+        return list(self.iter_lever_jobs(slugs))
+    
+    def iter_lever_jobs(self, slugs: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+        """Yield Lever jobs board by board; each board's raw JSON is dropped once filtered"""
+        companies = self.live_boards("Lever", select_companies(LEVER_COMPANIES, slugs))
         
-        return jobs
-    
-    def fetch_lever_jobs(self) -> List[Dict]:
-        """Fetch jobs from companies using Lever ATS"""
-        jobs = []
-        companies = {
-            "cloudflare": ("Cloudflare", "https://www.cloudflare.com"),
-            "affirm": ("Affirm", "https://www.affirm.com"),
-            "asana": ("Asana", "https://asana.com"),
-            "notion": ("Notion", "https://www.notion.so"),
-            "figma": ("Figma", "https://www.figma.com"),
-            "gusto": ("Gusto", "https://gusto.com"),
-            "benchling": ("Benchling", "https://www.benchling.com"),
-            "airtable": ("Airtable", "https://www.airtable.com"),
-            "ripple": ("Ripple", "https://ripple.com"),
-            "tiktok": ("TikTok", "https://www.tiktok.com"),
-            "bytedance": ("ByteDance", "https://www.bytedance.com"),
-            "stripe": ("Stripe", "https://stripe.com"),
-            "canva": ("Canva", "https://www.canva.com"),
-            "linkedin": ("LinkedIn", "https://www.linkedin.com"),
-            "netflix": ("Netflix", "https://www.netflix.com"),
-            "meta": ("Meta", "https://www.meta.com"),
-            "moonpay": ("MoonPay", "https://www.moonpay.com"),
-            "github": ("GitHub", "https://github.com")
-        }
-        
-        keywords = ["trust", "safety", "security", "fraud", "risk", "compliance", "policy", "integrity", "operations", "support", "investigation", "moderation"]
-        
-        for company_slug, company_info in companies.items():
-            company_name, company_url = company_info
+        def fetch_company(item) -> List[Dict]:
+            company_slug, (company_name, company_url) = item
+            self.metrics.scope("Lever", company_slug)
+            jobs = []
             try:
                 url = f"https://api.lever.co/v0/postings/{company_slug}"
-                response = requests.get(url, timeout=10)
+                response = self.http.get(url, cached=True, timeout=10)
+                parse_started = time.perf_counter()
+                seen = 0
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    for job in data:
-                        title = job.get("text", "").lower()
+                    # Postings are decoded one by one and dropped unless they match
+                    for job in iter_json_array(response.content):
+                        seen += 1
+                        relevance = self.matcher.score(job.get("text", ""))
                         posted_date = job.get("createdAt", "Unknown")
                         
                         # Filter by keywords and recency
-                        if any(keyword in title for keyword in keywords) and self.is_job_recent(posted_date):
+                        if self.matcher.relevant(relevance) and self.is_job_recent(posted_date):
                             jobs.append({
                                 "company": company_name,
                                 "company_url": company_url,
@@ -477,81 +2803,737 @@ class JobAggregator:
                                 "location": job.get("categories", {}).get("location", "Unknown"),
                                 "url": job.get("hostedUrl", ""),
                                 "posted_date": posted_date,
-                                "source": "Lever"
+                                "source": "Lever",
+                                "relevance": relevance,
+                                # Lever lists already include the full posting, so no detail request is needed
+                                "description": html_to_text(job.get("descriptionPlain", "")),
+                                "department": job.get("categories", {}).get("team", ""),
+                                "commitment": job.get("categories", {}).get("commitment", "")
                             })
+                self.record_board("Lever", company_slug, response.status_code, seen)
+                if response.status_code in (200, 404):
+                    self.mark_fetched(f"Lever/{company_slug}")
+                self.metrics.observe_parse(time.perf_counter() - parse_started, seen, len(jobs))
+            except requests.Timeout as e:
+                self.record_board("Lever", company_slug, None)
+                print(f"⚠️  Timed out fetching from Lever for {company_name}: {e}")
             except Exception as e:
                 print(f"⚠️  Error fetching from Lever for {company_name}: {e}")
-                
-        return jobs
-    
-    def fetch_all_jobs(self) -> List[Dict]:
-        """Aggregate jobs from all sources"""
-        all_jobs = []
+            return jobs
         
+        for company_jobs in self.engine.imap(fetch_company, companies.items(), host="api.lever.co"):
+            yield from company_jobs
+    
+    def fetch_detail(self, job: Dict) -> Optional[Dict]:
+        """Description and metadata for a Greenhouse posting from its detail endpoint"""
+        unit = self.unit_of(job)
+        if job.get("source") != "Greenhouse" or "/" not in unit or not job.get("id"):
+            return None
+        slug = unit.split("/", 1)[1]
+        self.metrics.scope("Greenhouse details", slug)
+        url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs/{job['id']}"
+        response = self.http.get(url, timeout=10)
+        if response.status_code != 200:
+            return None
+        data = json_loads(response.content)
+        return {
+            "description": html_to_text(data.get("content", "")),
+            "department": ", ".join(d["name"] for d in data.get("departments") or [] if d.get("name")),
+            "offices": [o["name"] for o in data.get("offices") or [] if o.get("name")],
+        }
+    
+    def enrich_job(self, job: Dict) -> Dict:
+        """Fetch, cache and add one job's details; the job is returned unchanged on failure"""
+        try:
+            detail = self.fetch_detail(job)
+        except Exception as e:
+            print(f"⚠️  Error fetching details for {job.get('title')} at {job.get('company')}: {e}")
+            return job
+        if detail is not None:
+            self.details.put(job["source"], job.get("id"), job.get("posted_date"), detail)
+            job.update(detail)
+        return job
+    
+    def enrich_jobs(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """Detail stage: add descriptions to jobs that passed the filters, keeping their order.
+
+        Only postings that survived the keyword and recency filters get here.
+        Details are cached per posting and ``updated_at``: cache hits are
+        applied inline and only misses are fetched, concurrently, with at most
+        twice ``max_workers`` jobs held back waiting for one.
+        """
+        if self.details is None:
+            yield from jobs
+            return
+        hits, misses = self.details.hits, self.details.misses
+        host = SOURCE_HOSTS["Greenhouse"]
+        lookahead = self.engine.max_workers * 2
+        pending = deque()  # (job, future or None), in arrival order
+        with ThreadPoolExecutor(max_workers=self.engine.max_workers) as pool:
+            for job in jobs:
+                future = None
+                if job.get("source") == "Greenhouse" and "description" not in job:
+                    detail = self.details.get(job["source"], job.get("id"), job.get("posted_date"))
+                    if detail is not None:
+                        job.update(detail)
+                    else:
+                        future = pool.submit(self.engine.run, self.enrich_job, job, host=host)
+                pending.append((job, future))
+                while pending and (pending[0][1] is None or pending[0][1].done() or len(pending) > lookahead):
+                    head, head_future = pending.popleft()
+                    yield head_future.result() if head_future is not None else head
+            for job, future in pending:
+                yield future.result() if future is not None else job
+        fetched = self.details.misses - misses
+        if fetched or self.details.hits - hits:
+            print(f"📝 Job details: {self.details.hits - hits} from cache, {fetched} fetched")
+    
+    def fetch_all_jobs(self, plan: Optional[Dict[str, Optional[List[str]]]] = None) -> List[Dict]:
+        """Aggregate jobs from all sources.
+
+        ``plan`` maps source name to the board slugs to fetch (None for all of
+        them); sources missing from the plan are skipped. Without a plan every
+        source is fetched.
+        """
+        return list(self.enrich_jobs(self.normalize_jobs(self.iter_all_jobs(plan))))
+    
+    def iter_all_jobs(self, plan: Optional[Dict[str, Optional[List[str]]]] = None) -> Iterator[Dict]:
+        """Fetch stage: yield filtered jobs from every planned source as they arrive.
+
+        Sources run side by side and their jobs are interleaved. Per-source
+        counts and the fetch summary are printed once all sources are drained.
+        """
         print("🔍 Fetching real job listings...")
+        print(f"   Up to {self.engine.max_workers} requests in flight, {self.engine.per_host_limit} per host")
         
-        # Greenhouse jobs (free, no API key needed)
-        print("📋 Checking Greenhouse...")
-        greenhouse_jobs = self.fetch_greenhouse_jobs()
-        all_jobs.extend(greenhouse_jobs)
-        print(f"   Found {len(greenhouse_jobs)} jobs from Greenhouse")
-        
-        # Lever jobs (free, no API key needed)
-        print("📋 Checking Lever...")
-        lever_jobs = self.fetch_lever_jobs()
-        all_jobs.extend(lever_jobs)
-        print(f"   Found {len(lever_jobs)} jobs from Lever")
-        
-        # CryptoJobsList (free, no API key needed)
-        print("📋 Checking CryptoJobsList...")
-        crypto_jobs = self.fetch_cryptojobslist_jobs()
-        all_jobs.extend(crypto_jobs)
-        print(f"   Found {len(crypto_jobs)} jobs from CryptoJobsList")
-        
-        # RemoteOK (free, no API key needed)
-        print("📋 Checking RemoteOK...")
-        remoteok_jobs = self.fetch_remoteok_jobs()
-        all_jobs.extend(remoteok_jobs)
-        print(f"   Found {len(remoteok_jobs)} jobs from RemoteOK")
+        # Greenhouse, Lever, CryptoJobsList and RemoteOK are free, no API key needed
+        plan = plan if plan is not None else {name: None for name in self.available_sources()}
+        sources = [
+            ("Greenhouse", lambda: self.iter_greenhouse_jobs(plan["Greenhouse"])),
+            ("Lever", lambda: self.iter_lever_jobs(plan["Lever"])),
+            ("CryptoJobsList", self.iter_cryptojobslist_jobs),
+            ("RemoteOK", self.iter_remoteok_jobs),
+        ]
         
         # Adzuna jobs (requires free API key)
         adzuna_id = os.environ.get("ADZUNA_API_ID")
         adzuna_key = os.environ.get("ADZUNA_API_KEY")
         if adzuna_id and adzuna_key:
-            print("📋 Checking Adzuna...")
-            adzuna_jobs = self.fetch_adzuna_jobs(adzuna_id, adzuna_key)
-            all_jobs.extend(adzuna_jobs)
-            print(f"   Found {len(adzuna_jobs)} jobs from Adzuna")
-        
-        print(f"\n✅ Total jobs found: {len(all_jobs)}")
-        return all_jobs
-    
-    def save_jobs_json(self, filename: str = "jobs_data.json"):
-        """Save jobs to JSON file"""
-        jobs = self.fetch_all_jobs()
-        data = {
-            "last_updated": datetime.now().isoformat(),
-            "total_jobs": len(jobs),
-            "jobs": jobs
-        }
+            sources.append(("Adzuna", lambda: self.iter_adzuna_jobs(adzuna_id, adzuna_key)))
+        sources = [(name, stream) for name, stream in sources if name in plan]
+        
+        for name, _ in sources:
+            print(f"📋 Checking {name}...")
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        self._cutoff_ts = None  # Recompute the recency cutoff once for this run
+        with self._fetched_lock:
+            self.fetched_units.difference_update(self.refresh_units(plan))
+        started = time.perf_counter()
+        tasks_before, seconds_before = self.engine.tasks_run, self.engine.task_seconds
+        counts = [0] * len(sources)
+        for index, job in self.engine.interleave([stream for _, stream in sources]):
+            counts[index] += 1
+            yield job
+        elapsed = time.perf_counter() - started
         
-        print(f"💾 Saved {len(jobs)} jobs to {filename}")
-        return jobs
+        for (name, _), count in zip(sources, counts):
+            problems = self.metrics.status_summary(name)
+            print(f"   Found {count} jobs from {name}" + (f" ({problems})" if problems else ""))
+        if self.http.retries:
+            print(f"🔁 Retried {self.http.retries} requests after transient failures")
+        for host, stats in self.rate_limiter.stats().items():
+            if stats["throttled_seconds"] or stats["backoffs"]:
+                print(f"🚦 {host}: throttled {stats['throttled_requests']} requests for "
+                      f"{stats['throttled_seconds']:.1f}s, {stats['backoffs']} backoffs, "
+                      f"now {stats['rate']:g}/{stats['ceiling']:g} req/s")
+        if self.slug_health is not None:
+            self.slug_health.save()
+            skipped = sum(self.slug_health.skipped.values())
+            if skipped:
+                print(f"🪦 Skipped {skipped} boards known to be dead or empty")
+            self.slug_health.skipped.clear()
+        if self.http.cache is not None:
+            self.http.cache.save()
+            print(f"🗄️  {self.http.cache.hits} boards unchanged since last run "
+                  f"({self.http.cache.bytes_saved / 1024:.0f} KB not re-downloaded)")
+        serial = self.engine.task_seconds - seconds_before
+        speedup = serial / elapsed if elapsed > 0 else 1.0
+        print(f"⏱️  Fetched {self.engine.tasks_run - tasks_before} requests in {elapsed:.1f}s "
+              f"(serial estimate {serial:.1f}s, {speedup:.1f}x speedup)")
+    
+    def normalize_jobs(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """Normalize stage: tag locations, timestamp postings and drop stale ones.
+
+        Done once per job so later stages never reparse locations or dates.
+        """
+        kept = dropped = 0
+        for job in jobs:
+            job["location_tags"] = location_tags(job.get("location", ""))
+            job["posted_ts"] = parse_timestamp(job.get("posted_date"))
+            if not self.is_recent_timestamp(job["posted_ts"]):
+                dropped += 1
+                continue
+            kept += 1
+            yield job
+        if dropped:
+            print(f"   Dropped {dropped} jobs older than {self.days_old_threshold} days")
+        print(f"\n✅ Total jobs found: {kept}")
+    
+    def available_sources(self) -> List[str]:
+        """Names of the sources this run can fetch"""
+        names = ["Greenhouse", "Lever", "CryptoJobsList", "RemoteOK"]
+        if os.environ.get("ADZUNA_API_ID") and os.environ.get("ADZUNA_API_KEY"):
+            names.append("Adzuna")
+        return names
+    
+    def refresh_plan(self, refreshed_at: Dict[str, str], now: datetime) -> Dict[str, Optional[List[str]]]:
+        """Work out which sources and boards are due for a refresh.
+
+        ``refreshed_at`` maps ``"Source"`` or ``"Source/slug"`` to the ISO time it
+        was last fetched; anything never fetched, or older than its source's
+        interval in ``refresh_intervals``, is due.
+        """
+        def is_due(unit: str, source: str) -> bool:
+            last = refreshed_at.get(unit)
+            if not last:
+                return True
+            interval = self.refresh_intervals.get(source, timedelta(0))
+            try:
+                return now - datetime.fromisoformat(last) >= interval
+            except ValueError:
+                return True
+        
+        plan = {}
+        for source in self.available_sources():
+            if source in BOARD_SOURCES:
+                due = [slug for slug in BOARD_SOURCES[source] if is_due(f"{source}/{slug}", source)]
+                if due:
+                    plan[source] = due
+            elif is_due(source, source):
+                plan[source] = None
+        return plan
+    
+    @staticmethod
+    def refresh_units(plan: Dict[str, Optional[List[str]]]) -> List[str]:
+        """Expand a plan into the ``refreshed_at`` keys it covers"""
+        units = []
+        for source, slugs in plan.items():
+            if source in BOARD_SOURCES:
+                units.extend(f"{source}/{slug}" for slug in (slugs if slugs is not None else BOARD_SOURCES[source]))
+            else:
+                units.append(source)
+        return units
+    
+    @staticmethod
+    def unit_of(job: Dict) -> str:
+        """The refresh unit (source, or source/board) a job was fetched through"""
+        source = job.get("source", "")
+        return BOARD_UNITS.get((source, job.get("company")), source)
+    
+    def load_snapshot(self, filename: str) -> Dict:
+        """Load a previously saved jobs file, or an empty snapshot if there is none"""
+        try:
+            with open(filename, "rb") as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return {"jobs": []}
+    
+    def import_snapshot(self, store: JobStore, filename: str) -> int:
+        """Seed an empty store from an existing jobs file, keeping its first/last-seen history"""
+        previous = self.load_snapshot(filename)
+        fallback = previous.get("last_updated", datetime.now().isoformat())
+        jobs = previous.get("jobs", [])
+        for job in jobs:
+            job.setdefault("first_seen", fallback)
+            job.setdefault("last_seen", fallback)
+            job.setdefault("location_tags", location_tags(job.get("location", "")))
+            if "posted_ts" not in job:
+                job["posted_ts"] = parse_timestamp(job.get("posted_date"))
+        store.upsert(jobs, fallback, self.unit_of)
+        # Files published before the store existed carried the refresh times; they are read once, never written back
+        if previous.get("refreshed_at"):
+            store.set_meta("refreshed_at", previous["refreshed_at"])
+        if jobs:
+            print(f"🗃️  Imported {len(jobs)} jobs from {filename} into {store.path}")
+        return len(jobs)
+    
+    def write_search_index(self, index: Dict, filename: str) -> Dict:
+        """Write the search index and facet counts sidecar for the client"""
+        write_atomic(filename, json.dumps(index, separators=(",", ":")).encode())
+        print(f"🔎 Indexed {len(index['tokens'])} search tokens into {filename}")
+        return index
+    
+    def write_json(self, data: Dict, filename: str, compact: bool = False) -> int:
+        """Write JSON pretty-printed, or minified with .gz/.br siblings; returns bytes written"""
+        if not compact:
+            body = json.dumps(data, indent=2).encode()
+        else:
+            body = json.dumps(data, separators=(",", ":")).encode()
+        write_atomic(filename, body)
+        if compact:
+            write_compressed_siblings(filename)
+        return len(body)
+    
+    def report_sizes(self, baseline: int, filenames: List[str]):
+        """Log each output format's size against the pretty-printed baseline (in bytes)"""
+        print("📦 Output sizes:")
+        print(f"   {'pretty-printed JSON (baseline)':<40} {baseline / 1024:8.1f} KB")
+        for filename in filenames:
+            for path in (filename, f"{filename}.gz", f"{filename}.br"):
+                if os.path.exists(path):
+                    size = os.path.getsize(path)
+                    saved = 100 * (1 - size / baseline) if baseline else 0
+                    print(f"   {path:<40} {size / 1024:8.1f} KB  ({saved:.0f}% smaller)")
+        if brotli is None:
+            print("   ℹ️  Install 'brotli' to also write .br files")
+    
+    def save_jobs_json(self, filename: str = "jobs_data.json", incremental: bool = False,
+                       shard_dir: Optional[str] = None, shard_size: int = 200,
+                       search_index: bool = True, compact: bool = False, columnar: bool = False):
+        """Fetch into the job store, then export the active jobs to a JSON file.
+
+        Fetched jobs are upserted into the SQLite store at ``db_path``, which
+        keeps each posting's first/last sighting across runs; the file is then
+        written from the store. In incremental mode only the sources and boards
+        that are due get fetched and the rest of the store is kept. With
+        ``shard_dir`` the jobs are also written as progressively loadable shards.
+        The search index sidecar is written next to ``filename`` as
+        ``<name>_index.json``. ``compact`` writes minified JSON with precompressed
+        siblings, and ``columnar`` adds a dictionary-encoded ``<name>.columnar.json``.
+        See publish() for the content-hashed copies and ``<name>_latest.json``.
+        """
+        now = datetime.now()
+        store = JobStore(self.db_path)
+        try:
+            return self._save_from_store(store, filename, now, incremental, shard_dir, shard_size,
+                                         search_index, compact, columnar)
+        finally:
+            store.close()
+    
+    def _save_from_store(self, store: JobStore, filename: str, now: datetime, incremental: bool,
+                         shard_dir: Optional[str], shard_size: int, search_index: bool,
+                         compact: bool, columnar: bool) -> int:
+        if store.is_empty():
+            self.import_snapshot(store, filename)
+        refreshed_at = dict(store.get_meta("refreshed_at", {})) if incremental else {}
+        plan = self.refresh_plan(refreshed_at, now)
+        units = self.refresh_units(plan)
+        if incremental:
+            print(f"♻️  Incremental refresh: {len(units)} sources/boards due")
+        
+        # fetch -> parse/filter (per board) -> normalize -> details -> store, one job at a time
+        self.metrics.reset()
+        timed = self.metrics.timed
+        fetched = timed("fetch", self.iter_all_jobs(plan))
+        normalized = timed("normalize", self.normalize_jobs(fetched), upstream="fetch")
+        enriched = timed("details", self.enrich_jobs(normalized), upstream="normalize")
+        with self.metrics.stage("store", upstream="details"):
+            seen, retired, refreshed = self.store_jobs(store, enriched, units, now, incremental)
+        
+        count = self.publish(store, filename, now, shard_dir, shard_size, search_index, compact, columnar)
+        self.metrics.totals.update(jobs_stored=len(seen), jobs_retired=retired, refreshed_units=len(refreshed),
+                                   failed_units=len(units) - len(refreshed), incremental=incremental)
+        self.metrics.finish()
+        return count
+    
+    def store_jobs(self, store: JobStore, jobs: Iterable[Dict], units: List[str], now: datetime,
+                   incremental: bool = True) -> Tuple[set, int, List[str]]:
+        """Upsert fetched jobs and retire the postings that left the refreshed units.
+
+        Only units in ``units`` that were actually fetched (see mark_fetched)
+        count as refreshed. A unit whose fetch failed keeps its postings and
+        its old refresh time, so the next run retries it. Incremental stores
+        only retire within the refreshed units; a full store retires
+        everything else not seen. Returns the keys written, the number of
+        postings retired and the units refreshed.
+        """
+        stamp = now.isoformat()
+        seen = store.upsert(jobs, stamp, self.unit_of)
+        refreshed = self.fetched(units)
+        failed = sorted(set(units) - set(refreshed))
+        # Postings that left a refreshed board stay in the store as history, but inactive
+        if incremental:
+            retired = store.retire(seen, refreshed)
+        else:
+            retired = store.retire(seen, keep_units=failed)
+        refreshed_at = dict(store.get_meta("refreshed_at", {}))
+        if not incremental:
+            refreshed_at = {unit: value for unit, value in refreshed_at.items() if unit in failed}
+        refreshed_at.update({unit: stamp for unit in refreshed})
+        store.set_meta("refreshed_at", refreshed_at)
+        store.set_meta("last_updated", stamp)
+        if retired:
+            print(f"📦 {retired} postings no longer listed were retired in {store.path}")
+        if failed:
+            print(f"⚠️  {len(failed)} sources/boards could not be fetched; kept their postings for the next run")
+        return seen, retired, refreshed
+    
+    @staticmethod
+    def pointer_path(filename: str) -> str:
+        """The small file naming the current content-hashed publication of ``filename``"""
+        return f"{os.path.splitext(filename)[0]}_latest.json"
+    
+    def load_pointer(self, filename: str) -> Dict:
+        try:
+            with open(self.pointer_path(filename), "rb") as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    def publish(self, store: JobStore, filename: str, now: datetime, shard_dir: Optional[str] = None,
+                shard_size: int = 200, search_index: bool = True, compact: bool = False,
+                columnar: bool = False) -> int:
+        """Export the store's active jobs to ``filename`` and its sidecars; returns the jobs published.
+
+        Each file also gets a content-hashed twin (``jobs_data.<hash>.json``)
+        that never changes once written, and ``<name>_latest.json`` points at
+        the current set. With ``shard_dir`` the pointer also names the shard
+        manifest (``files.shards``), the only way the pages find the shards;
+        the shards of an earlier run are removed once sharding is turned off.
+        If the jobs and output options match what the pointer already names,
+        nothing is written at all.
+        """
+        directory = os.path.dirname(os.path.abspath(filename))
+        previous = self.load_pointer(filename)
+        options = {"compact": compact, "columnar": columnar, "search_index": search_index,
+                   "shard_dir": shard_dir, "shard_size": shard_size if shard_dir else None}
+        
+        # store -> dedup -> write, again one job at a time
+        timed = self.metrics.timed
+        exported = timed("export", store.iter_active(self.cutoff_timestamp(), self.keep_undated))
+        dedup = JobDeduplicator()
+        jobs = timed("dedup", dedup.stream(exported), upstream="export")
+        
+        index = SearchIndexBuilder() if search_index else None
+        shards = ShardWriter(shard_dir, shard_size) if shard_dir else None
+        consumers = [builder.add for builder in (index, shards) if builder is not None]
+        with JobStreamWriter(filename, compact=compact) as writer:
+            for job in jobs:
+                writer.add(job)
+            # The layout options are part of the name, so a hashed file always has one exact body
+            content_hash = hashlib.sha256(f"{writer.content_hash}{json.dumps(options, sort_keys=True)}"
+                                          .encode()).hexdigest()[:16]
+            unchanged = (previous.get("hash") == content_hash
+                         and os.path.exists(filename)
+                         and all(os.path.exists(os.path.join(directory, name))
+                                 for name in previous.get("files", {}).values()))
+            if unchanged:
+                print(f"🟰 Jobs unchanged since {previous.get('last_updated')} ({content_hash}), "
+                      f"kept the published files")
+                self.metrics.totals.update(jobs_written=0, duplicates_merged=dedup.duplicates, published=False)
+                return previous.get("total_jobs", dedup.kept_count)
+            if dedup.duplicates:
+                print(f"🧬 Merged {dedup.duplicates} duplicate postings across sources")
+            with self.metrics.stage("write"):
+                writer.finish({"last_updated": now.isoformat(), "total_jobs": dedup.kept_count},
+                              {}, consumers, transform=dedup.transform)
+        self.last_sample = writer.sample
+        print(f"💾 Saved {writer.count} jobs to {filename}")
+        
+        files = {"jobs": filename}
+        if index is not None:
+            with self.metrics.stage("search_index"):
+                files["index"] = f"{os.path.splitext(filename)[0]}_index.json"
+                self.write_search_index(index.result(now.isoformat()), files["index"])
+        if shards is not None:
+            with self.metrics.stage("shards"):
+                shards.finish(now.isoformat())
+        
+        written = [filename]
+        columnar_filename = f"{os.path.splitext(filename)[0]}.columnar.json"
+        if columnar:
+            # The columnar encoding needs every column at once, so it reads the file back
+            with self.metrics.stage("columnar"):
+                with open(filename, "rb") as f:
+                    data = json_loads(f.read())
+                self.write_json(encode_columnar(data), columnar_filename, compact=compact)
+            written.append(columnar_filename)
+            files["columnar"] = columnar_filename
+        # Outputs of modes now off would otherwise be served (or content-negotiated) stale
+        stale = [] if columnar else [columnar_filename + suffix for suffix in ("", *COMPRESSED_SUFFIXES)]
+        if not compact:
+            stale += [path + suffix for path in written for suffix in COMPRESSED_SUFFIXES]
+        remove_files(stale)
+        if compact or columnar:
+            self.report_sizes(writer.pretty_bytes, written)
+        
+        # Hashed twins first, then the pointer, so it never names a file that is not there yet
+        with self.metrics.stage("publish"):
+            hashed = {kind: publish_hashed(path, content_hash, compressed=compact and kind != "index")
+                      for kind, path in files.items()}
+            if shards is not None:
+                # Chunk names are already content hashes, so the manifest itself is not twinned
+                manifest_path = os.path.join(shard_dir, "manifest.json")
+                hashed["shards"] = os.path.relpath(os.path.abspath(manifest_path), directory).replace(os.sep, "/")
+            pointer = {"hash": content_hash, "last_updated": now.isoformat(), "total_jobs": writer.count,
+                       "files": hashed, "options": options, "previous": previous.get("hash")}
+            write_atomic(self.pointer_path(filename), json.dumps(pointer, indent=2).encode())
+            # Keep the previous generation for clients still holding the old pointer
+            keep = {content_hash, previous.get("hash")}
+            # Families written in earlier runs only (say columnar, since turned off) get pruned too
+            for path in {*files.values(), columnar_filename, f"{os.path.splitext(filename)[0]}_index.json"}:
+                prune_hashed(path, keep)
+            stale_manifest = previous.get("files", {}).get("shards")
+            if stale_manifest and shards is None:
+                ShardWriter.remove(os.path.join(directory, stale_manifest))
+        print(f"🔖 Published {hashed['jobs']} and pointed {os.path.basename(self.pointer_path(filename))} at it")
+        self.metrics.totals.update(jobs_written=writer.count, duplicates_merged=dedup.duplicates, published=True)
+        return writer.count
+    
+    def write_metrics(self, directory: str) -> Dict[str, Any]:
+        """Write the last run's report as run_report.json and a Prometheus textfile, job_scraper.prom"""
+        os.makedirs(directory, exist_ok=True)
+        hosts = self.rate_limiter.stats()
+        extra = {"hosts": hosts}
+        if self.http.cache is not None:
+            extra["cache"] = {"hits": self.http.cache.hits, "bytes_saved": self.http.cache.bytes_saved}
+        report = self.metrics.report(extra)
+        outputs = [("run_report.json", json.dumps(report, indent=2)),
+                   ("job_scraper.prom", self.metrics.prometheus(hosts))]
+        for name, content in outputs:
+            # Written atomically so a collector never reads a half-written file
+            path = os.path.join(directory, name)
+            with open(f"{path}.tmp", "w") as f:
+                f.write(content)
+            os.replace(f"{path}.tmp", path)
+        print(f"📈 Wrote run metrics to {directory}")
+        return report
+
+
+
+@contextmanager
+def exclusive_lock(path: str):
+    """Hold an exclusive lock on ``path`` for the block; raises RuntimeError if another process has it"""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            raise RuntimeError(f"{path} is held by another scraper process")
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# How often the daemon refreshes each source; Adzuna's free tier allows 250 calls a day
+DAEMON_INTERVALS = {
+    "RemoteOK": timedelta(minutes=15),
+    "CryptoJobsList": timedelta(minutes=15),
+    "Greenhouse": timedelta(hours=1),
+    "Lever": timedelta(hours=1),
+    "Adzuna": timedelta(hours=6),
+}
+
+
+class ScrapeDaemon:
+    """Long-running refresher that keeps one JobAggregator warm between cycles.
+
+    Each source runs in its own worker thread on its own interval, stretched
+    or shrunk by up to ``jitter`` so boards are not hit on the hour. A slow
+    source only delays itself, and its next cycle never starts before the
+    previous one has ended. The HTTP session, caches, rate limiter and store
+    connection live as long as the process. After every cycle the store is
+    exported to ``filename``, which is replaced atomically. SIGINT or SIGTERM
+    lets running cycles finish and then exits; a second signal exits at once.
+    """
+
+    def __init__(self, aggregator: JobAggregator, filename: str = "jobs_data.json",
+                 intervals: Optional[Dict[str, timedelta]] = None, jitter: float = 0.1,
+                 metrics_dir: Optional[str] = None, **publish_options):
+        self.aggregator = aggregator
+        self.filename = filename
+        self.intervals = {**DAEMON_INTERVALS, **(intervals or {})}
+        self.jitter = jitter
+        self.metrics_dir = metrics_dir
+        self.publish_options = publish_options  # shard_dir, compact, ... as for JobAggregator.publish
+        self.store = None
+        self.cycles = Counter()
+        self._store_lock = threading.Lock()  # One cycle at a time writes the store and publishes
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    def _on_signal(self, signum, frame):
+        if self._stop.is_set():
+            raise SystemExit(1)
+        print(f"\n🛑 Got signal {signum}, finishing running cycles (send it again to quit now)")
+        self.stop()
+
+    def next_delay(self, source: str) -> float:
+        """Seconds until a source's next cycle, its interval with jitter applied"""
+        interval = self.intervals[source].total_seconds()
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def run_cycle(self, source: str) -> int:
+        """Fetch one source, fold it into the store and publish; returns the jobs published"""
+        started = time.perf_counter()
+        now = datetime.now()
+        plan = {source: None}
+        metrics = self.aggregator.metrics
+        metrics.reset_source(source)
+        cycle_started_at = datetime.now(timezone.utc)
+        try:
+            # Fetching is the slow part and runs outside the lock, so other sources carry on
+            jobs = self.aggregator.fetch_all_jobs(plan)
+            with self._store_lock:
+                # Stages and totals are shared, so they only describe the cycle holding the lock
+                metrics.begin_cycle(cycle_started_at, time.perf_counter() - started)
+                units = self.aggregator.refresh_units(plan)
+                with metrics.stage("store"):
+                    seen, retired, refreshed = self.aggregator.store_jobs(self.store, jobs, units, now)
+                count = self.aggregator.publish(self.store, self.filename, now, **self.publish_options)
+                metrics.totals.update(source=source, jobs_stored=len(seen), jobs_retired=retired,
+                                      refreshed_units=len(refreshed), failed_units=len(units) - len(refreshed))
+                metrics.finish()
+                if self.metrics_dir:
+                    self.aggregator.write_metrics(self.metrics_dir)
+        except Exception as e:
+            print(f"⚠️  {source} cycle failed: {e}")
+            return 0
+        self.cycles[source] += 1
+        print(f"🔄 {source} cycle {self.cycles[source]} done in {time.perf_counter() - started:.1f}s: "
+              f"{len(jobs)} fetched, {count} jobs published")
+        return count
+
+    def _worker(self, source: str):
+        next_run = time.monotonic()
+        while not self._stop.wait(max(0.0, next_run - time.monotonic())):
+            started = time.monotonic()
+            self.run_cycle(source)
+            next_run = started + self.next_delay(source)
+            if time.monotonic() > next_run and not self._stop.is_set():
+                print(f"⏰ {source} cycle overran its interval, starting the next one right away")
+
+    def run(self):
+        """Refresh every available source on its schedule until stopped; call from the main thread"""
+        sources = [source for source in self.aggregator.available_sources() if source in self.intervals]
+        handlers = {sig: signal.signal(sig, self._on_signal) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            with exclusive_lock(f"{self.aggregator.db_path}.lock"):
+                self.store = JobStore(self.aggregator.db_path, check_same_thread=False)
+                if self.store.is_empty():
+                    self.aggregator.import_snapshot(self.store, self.filename)
+                for source in sources:
+                    minutes = self.intervals[source].total_seconds() / 60
+                    print(f"🗓️  {source}: every {minutes:g} min (±{self.jitter:.0%})")
+                workers = [threading.Thread(target=self._worker, args=(source,), name=f"refresh-{source}",
+                                            daemon=True) for source in sources]
+                for worker in workers:
+                    worker.start()
+                while not self._stop.wait(1):
+                    pass
+                for worker in workers:
+                    worker.join()
+        finally:
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+            # A forced exit may leave a cycle mid-write; its transaction and temp files are simply dropped
+            if self.store is not None and self._store_lock.acquire(timeout=5):
+                self.store.close()
+                self._store_lock.release()
+            if self.aggregator.http.cache is not None:
+                self.aggregator.http.cache.save()
+            if self.aggregator.slug_health is not None:
+                self.aggregator.slug_health.save()
+            self.aggregator.http.close()
+        print(f"👋 Daemon stopped after {sum(self.cycles.values())} cycles")
+
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Fetch Trust & Safety jobs into jobs_data.json")
+    parser.add_argument("--output", default="jobs_data.json", help="jobs file to write")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only refetch sources/boards that are due and keep the rest of the job store")
+    parser.add_argument("--db", default="jobs.db", help="SQLite job store the output file is exported from")
+    parser.add_argument("--shard-dir", default=None,
+                        help="also write per-source shards plus manifest.json into this directory (e.g. jobs_data)")
+    parser.add_argument("--shard-size", type=int, default=200, help="maximum jobs per shard")
+    parser.add_argument("--no-search-index", action="store_true", help="skip the search index sidecar")
+    parser.add_argument("--compact", action="store_true",
+                        help="write minified JSON plus precompressed .gz (and .br if brotli is installed)")
+    parser.add_argument("--columnar", action="store_true",
+                        help="also write a dictionary-encoded <name>.columnar.json")
+    parser.add_argument("--rate-limit", action="append", default=[], metavar="SOURCE=RPS",
+                        help="override a source's requests per second, e.g. RemoteOK=0.5 (repeatable)")
+    parser.add_argument("--metrics-dir", default=".scraper_cache/metrics",
+                        help="where to write run_report.json and the job_scraper.prom Prometheus textfile")
+    parser.add_argument("--slug-report", action="store_true",
+                        help="list dead boards and probe which ones moved to another ATS, then exit")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep running and refresh each source on its own schedule, publishing after every cycle")
+    parser.add_argument("--interval", action="append", default=[], metavar="SOURCE=MINUTES",
+                        help="override a source's refresh interval in daemon mode, e.g. Greenhouse=30 (repeatable)")
+    parser.add_argument("--jitter", type=float, default=0.1,
+                        help="spread each daemon interval by up to this fraction (default 0.1)")
+    args = parser.parse_args()
+    
+    rate_limits = {}
+    for override in args.rate_limit:
+        source, _, rate = override.partition("=")
+        try:
+            rate_limits[source] = float(rate)
+            if rate_limits[source] <= 0:
+                raise ValueError(rate)
+        except ValueError:
+            parser.error(f"invalid --rate-limit {override!r}, expected SOURCE=RPS")
+        if source not in SOURCE_HOSTS:
+            parser.error(f"unknown source {source!r} in --rate-limit, expected one of {', '.join(SOURCE_HOSTS)}")
+    
+    intervals = {}
+    for override in args.interval:
+        source, _, minutes = override.partition("=")
+        try:
+            intervals[source] = timedelta(minutes=float(minutes))
+            if intervals[source] <= timedelta(0):
+                raise ValueError(minutes)
+        except ValueError:
+            parser.error(f"invalid --interval {override!r}, expected SOURCE=MINUTES")
+        if source not in DAEMON_INTERVALS:
+            parser.error(f"unknown source {source!r} in --interval, expected one of {', '.join(DAEMON_INTERVALS)}")
+    if not 0 <= args.jitter < 1:
+        parser.error("--jitter must be at least 0 and below 1")
+    
     print("🚀 EpiskoAI Real Job Aggregator\n")
     
-    aggregator = JobAggregator()
-    jobs = aggregator.save_jobs_json()
+    aggregator = JobAggregator(rate_limits=rate_limits, db_path=args.db)
+    if args.slug_report:
+        aggregator.print_slug_report()
+        raise SystemExit(0)
+    if args.daemon:
+        daemon = ScrapeDaemon(aggregator, args.output, intervals=intervals, jitter=args.jitter,
+                              metrics_dir=args.metrics_dir, shard_dir=args.shard_dir,
+                              shard_size=args.shard_size, search_index=not args.no_search_index,
+                              compact=args.compact, columnar=args.columnar)
+        try:
+            daemon.run()
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+        raise SystemExit(0)
+    try:
+        # A cron run and a daemon must never write the same store at once
+        with exclusive_lock(f"{args.db}.lock"):
+            total = aggregator.save_jobs_json(args.output, incremental=args.incremental,
+                                             shard_dir=args.shard_dir, shard_size=args.shard_size,
+                                             search_index=not args.no_search_index,
+                                             compact=args.compact, columnar=args.columnar)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    if args.metrics_dir:
+        aggregator.write_metrics(args.metrics_dir)
     
-    if jobs:
+    if total and aggregator.last_sample:
         print("\n📊 Sample jobs:")
-        for job in jobs[:5]:
+        for job in aggregator.last_sample:
             print(f"\n  • {job['title']} at {job['company']}")
             print(f"    📍 {job['location']}")
             print(f"    🔗 {job['url'][:60]}...")
-    else:
+    elif not total:
         print("\n⚠️  No jobs found. Check API credentials or network connection.")
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Local query API and static site server for the scraper output
+
+  python3 serve_jobs.py                                # site + API on http://localhost:8000
+  curl 'http://localhost:8000/jobs?q=trust+safety&location=remote-us&page=2'
+  curl 'http://localhost:8000/facets'
+
+The published jobs file is loaded once into an in-memory index; /jobs
+filters, sorts and paginates on the server so a page load costs one small
+response instead of the whole dataset. Responses carry a weak ETag and are
+gzipped when the client accepts it. A new publication (the
+``<name>_latest.json`` pointer, or the jobs file itself) is picked up
+without a restart. Other paths are served as static files, but only site
+assets (see STATIC_EXTENSIONS): the job store, caches, dotfiles and
+sources under the root stay private.
+"""
+
+import argparse
+import bisect
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from functools import lru_cache, partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import job_scraper
+from job_scraper import SEARCH_TOKEN, build_search_index, json_dumps, json_loads
+
+# File types the static site is made of; anything else under the root (jobs.db, logs, sources) is not served
+STATIC_EXTENSIONS = {".html", ".js", ".css", ".json", ".png", ".svg", ".ico", ".webmanifest"}
+
+# Location filter option (as in the pages' location menu) -> tag emitted by normalize_location()
+LOCATION_FILTER_TAGS = {
+    "remote": "remote:global",
+    "remote-us": "remote:us",
+    "remote-uk": "remote:gb",
+    "remote-india": "remote:in",
+    "us": "country:us",
+    "sf": "metro:sf",
+    "nyc": "metro:nyc",
+    "seattle": "metro:seattle",
+    "india": "country:in",
+    "international": "international",
+}
+SORTS = ("posted", "relevance", "company", "first_seen")
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+GZIP_MIN_BYTES = 512  # Smaller bodies gain less than the gzip framing costs
+
+
+class QueryError(ValueError):
+    """A malformed query parameter; reported to the client as a 400"""
+
+
+class JobSnapshot:
+    """One published jobs file, indexed in memory; never modified once built.
+
+    Jobs are pre-encoded to JSON so a page is a join of ready-made bytes.
+    Search tokens, company, source and location tag lookups and every sort
+    order are computed up front; query results and page bodies are memoized
+    per snapshot, so a reload starts with fresh caches.
+    """
+
+    def __init__(self, data: Dict, generation: str):
+        self.generation = generation
+        self.last_updated = data.get("last_updated")
+        self.jobs = data.get("jobs", [])
+        self.encoded = [json_dumps(job).encode() for job in self.jobs]
+        index = build_search_index(self.jobs, self.last_updated)
+        self.tokens = index["tokens"]
+        self.postings = [frozenset(positions) for positions in index["postings"]]
+        self.facets = index["facets"]
+        self.by_company = {}
+        self.by_source = {}
+        self.by_tag = {}
+        for position, job in enumerate(self.jobs):
+            self.by_company.setdefault(job.get("company", "Unknown"), set()).add(position)
+            self.by_source.setdefault(job.get("source", "Unknown"), set()).add(position)
+            for tag in job.get("location_tags") or job_scraper.location_tags(job.get("location", "")):
+                self.by_tag.setdefault(tag, set()).add(position)
+        positions = range(len(self.jobs))
+        # Undated jobs sort after dated ones; ties keep the file's order
+        self.orders = {
+            "posted": sorted(positions, key=lambda p: -(self.jobs[p].get("posted_ts") or 0)),
+            "relevance": sorted(positions, key=lambda p: -(self.jobs[p].get("relevance") or 0)),
+            "company": sorted(positions, key=lambda p: (self.jobs[p].get("company") or "").lower()),
+            "first_seen": sorted(positions, key=lambda p: self.jobs[p].get("first_seen") or "", reverse=True),
+        }
+        self.search = lru_cache(maxsize=256)(self._search)
+        self.page_body = lru_cache(maxsize=1024)(self._page_body)
+
+    def _token_matches(self, token: str) -> set:
+        """Positions of jobs with any indexed token starting with ``token`` (as the pages search)"""
+        matches = set()
+        start = bisect.bisect_left(self.tokens, token)
+        for i in range(start, len(self.tokens)):
+            if not self.tokens[i].startswith(token):
+                break
+            matches |= self.postings[i]
+        return matches
+
+    def _search(self, q: str, company: str, location: str, source: str, sort: str) -> Tuple[int, ...]:
+        """Positions of the matching jobs in ``sort`` order"""
+        candidates = None
+        lookups = [self._token_matches(token) for token in SEARCH_TOKEN.findall(q.lower())]
+        if company:
+            lookups.append(self.by_company.get(company, set()))
+        if source:
+            lookups.append(self.by_source.get(source, set()))
+        if location:
+            lookups.append(self.by_tag.get(LOCATION_FILTER_TAGS.get(location.lower(), location), set()))
+        # Intersect smallest first so a selective filter keeps the rest cheap
+        for matches in sorted(lookups, key=len):
+            candidates = set(matches) if candidates is None else candidates & matches
+            if not candidates:
+                return ()
+        order = self.orders[sort]
+        if candidates is None:
+            return tuple(order)
+        return tuple(position for position in order if position in candidates)
+
+    def _page_body(self, q: str, company: str, location: str, source: str, sort: str,
+                   page: int, per_page: int) -> Tuple[bytes, bytes]:
+        """The response body for one page of a query, plain and gzipped"""
+        matches = self.search(q, company, location, source, sort)
+        pages = max(1, -(-len(matches) // per_page))
+        header = {
+            "last_updated": self.last_updated,
+            "total": len(matches),
+            "page": page,
+            "per_page": per_page,
+            "pages": pages,
+        }
+        selected = matches[(page - 1) * per_page:page * per_page]
+        body = (json_dumps(header)[:-1].encode() + b',"jobs":['
+                + b",".join(self.encoded[position] for position in selected) + b"]}")
+        compressed = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_BYTES else b""
+        return body, compressed
+
+
+class JobLibrary:
+    """Holds the current JobSnapshot and swaps in a new one when a publication lands.
+
+    A watcher thread polls the pointer file (or the jobs file when there is
+    no pointer) every ``reload_interval`` seconds. The new snapshot is built
+    off the request path and swapped in with a single assignment, so
+    requests in flight finish against the snapshot they started with.
+    """
+
+    def __init__(self, filename: str = "jobs_data.json", reload_interval: float = 2.0):
+        self.filename = filename
+        self.pointer_path = job_scraper.JobAggregator.pointer_path(filename)
+        self.reload_interval = reload_interval
+        self.snapshot = JobSnapshot({"jobs": []}, "empty")
+        self._signature = None
+        self._stop = threading.Event()
+        self.reload()
+
+    def _current(self) -> Tuple[Optional[Tuple], str, str]:
+        """(stat signature, generation, path to load) of the latest publication"""
+        for path in (self.pointer_path, self.filename):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            return (path, stat.st_mtime_ns, stat.st_size), f"{stat.st_mtime_ns:x}{stat.st_size:x}", path
+        return None, "empty", self.filename
+
+    def reload(self) -> bool:
+        """Load the latest publication if it changed since the last check; True if swapped in"""
+        signature, generation, path = self._current()
+        if signature is None or signature == self._signature:
+            return False
+        try:
+            if path == self.pointer_path:
+                with open(path, "rb") as f:
+                    pointer = json_loads(f.read())
+                generation = pointer["hash"]
+                path = os.path.join(os.path.dirname(os.path.abspath(path)), pointer["files"]["jobs"])
+            started = time.perf_counter()
+            with open(path, "rb") as f:
+                snapshot = JobSnapshot(json_loads(f.read()), generation)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️  Could not load {path}: {e}")
+            return False
+        self.snapshot = snapshot
+        self._signature = signature
+        print(f"📚 Loaded {len(snapshot.jobs)} jobs from {path} ({generation}) in {time.perf_counter() - started:.2f}s")
+        return True
+
+    def watch(self):
+        while not self._stop.wait(self.reload_interval):
+            self.reload()
+
+    def start(self):
+        threading.Thread(target=self.watch, name="reload-jobs", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+
+class JobRequestHandler(SimpleHTTPRequestHandler):
+    """Serves /jobs and /facets from the library and everything else from the site directory"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so busy clients reuse their connections
+    disable_nagle_algorithm = True
+
+    def __init__(self, *args, library: JobLibrary, access_log: bool = False, **kwargs):
+        self.library = library
+        self.access_log = access_log
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format, *args):
+        if self.access_log:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/jobs":
+            self.send_jobs()
+        elif path == "/facets":
+            self.send_facets()
+        else:
+            super().do_GET()
+
+    def is_servable(self) -> bool:
+        """Site assets only: no dotfile or dot directory (.git, .scraper_cache) and a STATIC_EXTENSIONS type"""
+        local = self.translate_path(self.path)
+        relative = os.path.relpath(local, self.directory)
+        if relative == ".":
+            return True  # The root, served as its index.html
+        if any(part.startswith(".") for part in relative.split(os.sep)):
+            return False
+        return os.path.isdir(local) or os.path.splitext(local)[1].lower() in STATIC_EXTENSIONS
+
+    def send_head(self):
+        if not self.is_servable():
+            self.send_error(404)
+            return None
+        return super().send_head()
+
+    def list_directory(self, path):
+        self.send_error(404)  # Listings would reveal files that are not served anyway
+        return None
+
+    def _query(self) -> Dict[str, List[str]]:
+        return parse_qs(urlsplit(self.path).query)
+
+    @staticmethod
+    def _int_param(params: Dict[str, List[str]], name: str, default: int, low: int, high: int) -> int:
+        value = params.get(name, [str(default)])[0]
+        try:
+            number = int(value)
+        except ValueError:
+            raise QueryError(f"{name} must be a whole number, got {value!r}")
+        if not low <= number <= high:
+            raise QueryError(f"{name} must be between {low} and {high}")
+        return number
+
+    def send_jobs(self):
+        snapshot = self.library.snapshot
+        params = self._query()
+
+        def first(name: str) -> str:
+            return params.get(name, [""])[0].strip()
+
+        try:
+            sort = first("sort") or "posted"
+            if sort not in SORTS:
+                raise QueryError(f"sort must be one of {', '.join(SORTS)}")
+            per_page = self._int_param(params, "per_page", DEFAULT_PER_PAGE, 1, MAX_PER_PAGE)
+            page = self._int_param(params, "page", 1, 1, 1_000_000)
+        except QueryError as e:
+            self.send_json_error(400, str(e))
+            return
+        key = (first("q"), first("company"), first("location"), first("source"), sort, page, per_page)
+        # Weak: the same entity is sent plain or gzipped
+        etag = f'W/"{snapshot.generation}-{hashlib.sha1(repr(key).encode()).hexdigest()[:12]}"'
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body, compressed = snapshot.page_body(*key)
+        self.send_body(body, compressed, etag)
+
+    def send_facets(self):
+        snapshot = self.library.snapshot
+        etag = f'W/"{snapshot.generation}-facets"'
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"last_updated": snapshot.last_updated, "total_jobs": len(snapshot.jobs),
+                           "facets": snapshot.facets}, separators=(",", ":")).encode()
+        self.send_body(body, gzip.compress(body, compresslevel=6, mtime=0), etag)
+
+    def send_body(self, body: bytes, compressed: bytes, etag: str):
+        use_gzip = compressed and "gzip" in self.headers.get("Accept-Encoding", "")
+        payload = compressed if use_gzip else body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_json_error(self, status: int, message: str):
+        body = json.dumps({"error": message}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the site plus a /jobs query API over the scraper output")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--data", default="jobs_data.json", help="jobs file published by job_scraper.py")
+    parser.add_argument("--root", default=".", help="directory the static site is served from")
+    parser.add_argument("--reload-interval", type=float, default=2.0,
+                        help="seconds between checks for a newly published jobs file")
+    parser.add_argument("--access-log", action="store_true", help="log every request to stderr")
+    args = parser.parse_args()
+
+    library = JobLibrary(args.data, args.reload_interval)
+    library.start()
+    handler = partial(JobRequestHandler, library=library, access_log=args.access_log,
+                      directory=os.path.abspath(args.root))
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    print(f"🌐 Serving {os.path.abspath(args.root)} and /jobs on http://localhost:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping")
+    finally:
+        library.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
-const CACHE_NAME = 'episkoai-v1';
+const CACHE_NAME = 'episkoai-v3';
+const DATA_CACHE_NAME = 'episkoai-data-v1';
 const urlsToCache = [
   '/index.html',
-  '/jobs_data.json',
   '/manifest.json'
 ];
 
+// Job data published under a content hash (jobs_data.<hash>.json, shard chunks)
+// never changes once written, so it is served from cache without revalidating
+const HASHED_DATA = /\.[0-9a-f]{16}\.json$/;
+// Small files that say which hashed files are current; always asked of the network first.
+// Shard manifests live in a subdirectory (--shard-dir), unlike the app's own /manifest.json
+const POINTER_DATA = /\/(jobs_data_latest\.json|jobs_data\.json|jobs_data_index\.json|[^/]+\/manifest\.json)$/;
+
 // Install service worker and cache resources
 self.addEventListener('install', event => {
   event.waitUntil(
@@ -16,8 +23,57 @@ self.addEventListener('install', event => {
   );
 });
 
+// Cache-first for immutable hashed data; older generations of the same file are dropped
+function hashedDataResponse(request) {
+  return caches.open(DATA_CACHE_NAME).then(cache =>
+    cache.match(request).then(cached => {
+      if (cached) {
+        return cached;
+      }
+      return fetch(request).then(response => {
+        if (response && response.status === 200) {
+          const family = request.url.replace(HASHED_DATA, '');
+          cache.put(request, response.clone())
+            .then(() => cache.keys())
+            .then(keys => Promise.all(keys
+              .filter(key => key.url !== request.url && key.url.replace(HASHED_DATA, '') === family)
+              .map(key => cache.delete(key))));
+        }
+        return response;
+      });
+    })
+  );
+}
+
+// Network-first for the pointer files, falling back to the last copy when offline
+function pointerResponse(request) {
+  return caches.open(DATA_CACHE_NAME).then(cache =>
+    fetch(request, { cache: 'no-cache' })
+      .then(response => {
+        if (response && response.status === 200) {
+          cache.put(request, response.clone());
+        }
+        return response;
+      })
+      .catch(() => cache.match(request))
+  );
+}
+
 // Fetch resources from cache or network
 self.addEventListener('fetch', event => {
+  if (event.request.method !== 'GET') {
+    return;
+  }
+  const path = new URL(event.request.url).pathname;
+  if (HASHED_DATA.test(path)) {
+    event.respondWith(hashedDataResponse(event.request));
+    return;
+  }
+  if (POINTER_DATA.test(path)) {
+    event.respondWith(pointerResponse(event.request));
+    return;
+  }
+
   event.respondWith(
     caches.match(event.request)
       .then(response => {
@@ -25,7 +81,7 @@ self.addEventListener('fetch', event => {
         if (response) {
           return response;
         }
-        
+
         return fetch(event.request).then(
           response => {
             // Check if we received a valid response
@@ -50,7 +106,7 @@ self.addEventListener('fetch', event => {
 
 // Update service worker
 self.addEventListener('activate', event => {
-  const cacheWhitelist = [CACHE_NAME];
+  const cacheWhitelist = [CACHE_NAME, DATA_CACHE_NAME];
   event.waitUntil(
     caches.keys().then(cacheNames => {
       return Promise.all(
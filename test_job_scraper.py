@@ -0,0 +1,108 @@
+"""Regression tests for job_scraper.py (run with ``python -m pytest -q``)"""
+
+import os
+
+import pytest
+
+from job_scraper import (SOURCE_BURSTS, SOURCE_HOSTS, SOURCE_RATE_LIMITS, HostRateLimiter, JobDeduplicator,
+                         JobStreamWriter, normalize_location)
+
+
+@pytest.mark.parametrize("location, country", [
+    ("Toronto, CA", "country:ca"),
+    ("Vancouver, BC, CA", "country:ca"),
+    ("Berlin, DE", "country:de"),
+    ("Tel Aviv, IL", "country:il"),
+    ("Bengaluru, IN", "country:in"),
+])
+def test_country_codes_that_look_like_states_stay_international(location, country):
+    tags = normalize_location(location)
+    assert country in tags
+    assert "country:us" not in tags
+    assert "international" in tags
+
+
+@pytest.mark.parametrize("location", [
+    "Austin, TX",
+    "San Francisco, CA",
+    "Sacramento, CA 95814",
+    "Springfield, IL, USA",
+    "Albuquerque, NM",
+])
+def test_state_codes_with_us_context_are_us(location):
+    tags = normalize_location(location)
+    assert "country:us" in tags
+    assert "international" not in tags
+
+
+@pytest.mark.parametrize("location", [
+    "Albuquerque, New Mexico",
+    "Santa Fe, New Mexico, USA, Remote",
+])
+def test_new_mexico_is_not_mexico(location):
+    tags = normalize_location(location)
+    assert "country:us" in tags
+    assert "country:mx" not in tags
+    assert "international" not in tags
+
+
+def test_mexico_is_still_mexico():
+    assert "country:mx" in normalize_location("Mexico City")
+
+
+def posting(title, source, location="Remote", company="Acme"):
+    return {"title": title, "company": company, "location": location, "source": source,
+            "url": f"https://example.com/{source}/{title}"}
+
+
+@pytest.mark.parametrize("first, second", [
+    ("Trust & Safety Analyst", "Senior Trust & Safety Analyst"),
+    ("Risk Manager", "Risk Manager, Payments"),
+])
+def test_dedup_keeps_postings_with_different_qualifiers(first, second):
+    jobs = [posting(first, "Greenhouse"), posting(second, "Adzuna")]
+    assert len(JobDeduplicator().deduplicate(jobs)) == 2
+
+
+def test_dedup_keeps_same_title_in_other_locations():
+    jobs = [posting("Fraud Analyst", "Greenhouse", "New York, NY"), posting("Fraud Analyst", "Adzuna", "London, UK")]
+    assert len(JobDeduplicator().deduplicate(jobs)) == 2
+
+
+@pytest.mark.parametrize("first, second", [
+    ("Trust & Safety Analyst", "Trust and Safety Analyst - Remote"),
+    ("Trust & Safety Analyst", "Analyst, Trust & Safety"),
+])
+def test_dedup_merges_reworded_copies(first, second):
+    jobs = [posting(first, "Adzuna"), posting(second, "Greenhouse")]
+    kept = JobDeduplicator().deduplicate(jobs)
+    assert len(kept) == 1
+    assert kept[0]["source"] == "Greenhouse"
+    assert kept[0]["sources"] == ["Adzuna", "Greenhouse"]
+
+
+def test_compact_size_baseline_matches_pretty_file(tmp_path):
+    jobs = [posting(f"Fraud Analyst {n}", source) for n, source in enumerate(["Greenhouse", "Lever", "Greenhouse"])]
+    sizes = {}
+    for compact in (False, True):
+        filename = str(tmp_path / f"jobs_{compact}.json")
+        with JobStreamWriter(filename, compact=compact) as writer:
+            for job in jobs:
+                writer.add(job)
+            writer.finish({"last_updated": "2026-01-01T00:00:00"}, {"note": {"a": 1}})
+        sizes[compact] = (writer.pretty_bytes, os.path.getsize(filename))
+    assert sizes[True][0] == sizes[False][1]
+
+
+def test_adzuna_bucket_stays_within_its_minute_quota():
+    host = SOURCE_HOSTS["Adzuna"]
+    limiter = HostRateLimiter(host_rates={host: SOURCE_RATE_LIMITS["Adzuna"]},
+                              host_bursts={host: SOURCE_BURSTS["Adzuna"]})
+    bucket = limiter._bucket(host)
+    started, calls = bucket._updated, 0
+    for centisecond in range(60 * 100):
+        bucket._refill(started + centisecond / 100)
+        while bucket.tokens >= 1:
+            bucket.tokens -= 1
+            calls += 1
+    assert calls <= 25